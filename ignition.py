@@ -7,7 +7,6 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
-import time
 from pathlib import Path
 from typing import Optional
 
@@ -25,6 +24,10 @@ except ImportError:
 
 console = Console()
 
+LOG_TAIL_LINES = 50
+# Read only the end of the log; 50 lines fit comfortably in this window
+LOG_TAIL_BYTES = 64 * 1024
+
 
 class PathValidator(Validator):
     def validate(self, document):
@@ -37,8 +40,31 @@ class PathValidator(Validator):
 
 
 class Ignition:
+    MENU_CHOICES = [
+        questionary.Choice("  Launch ON1Builder", value="launch"),
+        questionary.Choice("  Check System Status", value="status"),
+        questionary.Choice("    Configure .env Path", value="config"),
+        questionary.Choice("  View Logs", value="logs"),
+        questionary.Separator(),
+        questionary.Choice("  Exit", value="exit"),
+    ]
+
     def __init__(self):
         self.env_file_path: Optional[Path] = self._find_env_file()
+        # Shown once under the settings panel on the next menu render
+        self._pending_notice: Optional[str] = None
+        self._header_panel = Panel(
+            "[bold yellow]ON1Builder Ignition[/]\n[dim]Interactive TUI Launcher[/]",
+            title="[bold]v2.3.1[/]",
+            border_style="yellow",
+            expand=False,
+        )
+        self._menu_actions = {
+            "launch": self.launch_bot,
+            "status": self.check_status,
+            "config": self.configure_env_path,
+            "logs": self.view_logs,
+        }
 
     def _find_env_file(self) -> Optional[Path]:
         """Searches for a .env file in the current and parent directories."""
@@ -53,13 +79,7 @@ class Ignition:
     def display_header(self):
         """Displays the application header."""
         console.clear()
-        header = Panel(
-            "[bold yellow]ON1Builder Ignition[/]\n[dim]Interactive TUI Launcher[/]",
-            title="[bold]v2.3.1[/]",
-            border_style="yellow",
-            expand=False,
-        )
-        console.print(header)
+        console.print(self._header_panel)
         console.print()
 
     def display_status(self):
@@ -85,6 +105,10 @@ class Ignition:
         while True:
             self.display_header()
             self.display_status()
+            if self._pending_notice:
+                console.print(self._pending_notice)
+                console.print()
+                self._pending_notice = None
 
             if not self.env_file_path:
                 console.print(
@@ -94,29 +118,13 @@ class Ignition:
                 continue
 
             choice = questionary.select(
-                "Select an action:",
-                choices=[
-                    questionary.Choice("  Launch ON1Builder", value="launch"),
-                    questionary.Choice("  Check System Status", value="status"),
-                    questionary.Choice("    Configure .env Path", value="config"),
-                    questionary.Choice("  View Logs", value="logs"),
-                    questionary.Separator(),
-                    questionary.Choice("  Exit", value="exit"),
-                ],
-                use_indicator=True,
+                "Select an action:", choices=self.MENU_CHOICES, use_indicator=True
             ).ask()
 
-            if choice == "launch":
-                self.launch_bot()
-            elif choice == "status":
-                self.check_status()
-            elif choice == "config":
-                self.configure_env_path()
-            elif choice == "logs":
-                self.view_logs()
-            elif choice == "exit" or choice is None:
+            if choice == "exit" or choice is None:
                 console.print("[bold yellow]Goodbye![/]")
                 break
+            self._menu_actions[choice]()
 
     def configure_env_path(self):
         """Prompts the user to set the path to the .env file."""
@@ -127,8 +135,7 @@ class Ignition:
         ).ask()
         if path_str:
             self.env_file_path = Path(path_str)
-            console.print(f"[green]  .env path set to: {self.env_file_path}[/]")
-        time.sleep(1.5)
+            self._pending_notice = f"[green]  .env path set to: {self.env_file_path}[/]"
 
     def launch_bot(self):
         """Constructs and runs the 'run start' command."""
@@ -175,24 +182,29 @@ class Ignition:
         """Displays the tail end of the main log file."""
         self.display_header()
         log_file = Path("logs/on1builder.log")
-        if not log_file.exists():
+        try:
+            with open(log_file, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                offset = max(0, f.tell() - LOG_TAIL_BYTES)
+                f.seek(offset)
+                if offset:
+                    # The seek usually lands mid-line; skip that partial line
+                    f.readline()
+                data = f.read().decode("utf-8", errors="replace")
+        except FileNotFoundError:
             console.print("[bold red]Log file not found at 'logs/on1builder.log'[/]")
+        except Exception as e:
+            console.print(f"[bold red]Error reading log file:[/] {e}")
         else:
             console.print(
                 Panel(
-                    f"[bold]Showing last 50 lines of {log_file}[/]", border_style="blue"
+                    f"[bold]Showing last {LOG_TAIL_LINES} lines of {log_file}[/]",
+                    border_style="blue",
                 )
             )
-            log_content = ""
-            try:
-                with open(log_file, "r") as f:
-                    lines = f.readlines()
-                    log_content = "".join(lines[-50:])
-
-                syntax = Syntax(log_content, "log", theme="monokai", line_numbers=True)
-                console.print(syntax)
-            except Exception as e:
-                console.print(f"[bold red]Error reading log file:[/] {e}")
+            log_content = "\n".join(data.splitlines()[-LOG_TAIL_LINES:])
+            syntax = Syntax(log_content, "log", theme="monokai", line_numbers=True)
+            console.print(syntax)
 
         console.print("\n[bold blue]Press Enter to return to the menu.[/]")
         input()
@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
 
 import typer
 
@@ -15,6 +17,9 @@ from on1builder.utils.logging_config import get_logger
 logger = get_logger(__name__)
 app = typer.Typer(help="Commands to run the ON1Builder bot.")
 
+# Drives the orchestrator coroutine; tests swap in a runner bound to a shared loop.
+_run_coroutine: Callable[[Coroutine[Any, Any, Any]], Any] = asyncio.run
+
 
 @app.command(name="start")
 @handle_cli_errors(show_traceback=True)
@@ -26,7 +31,7 @@ def start_bot():
     logger.info("CLI: 'start' command invoked.")
 
     orchestrator = MainOrchestrator()
-    asyncio.run(orchestrator.run())
+    _run_coroutine(orchestrator.run())
 
     logger.debug("ON1Builder has shut down.")
     info_message("Goodbye!")
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import re
+import subprocess
 from collections.abc import Iterable
 from pathlib import Path
 
@@ -25,13 +26,17 @@ from on1builder.utils.custom_exceptions import ConfigurationError
 
 console = Console()
 
+_ENV_ASSIGNMENT_PATTERN = re.compile(r"^([A-Z0-9_]+)=(.*)$")
+
 
 def _load_env_values(paths: Iterable[Path]) -> dict[str, str]:
     values: dict[str, str] = {}
     for path in paths:
-        if not path.exists():
+        try:
+            content = path.read_text()
+        except FileNotFoundError:
             continue
-        for line in path.read_text().splitlines():
+        for line in content.splitlines():
             stripped = line.strip()
             if not stripped or stripped.startswith("#") or "=" not in stripped:
                 continue
@@ -59,7 +64,7 @@ def _apply_updates(lines: list[str], updates: dict[str, str]) -> str:
     updated_keys = set()
     rendered: list[str] = []
     for line in lines:
-        match = re.match(r"^([A-Z0-9_]+)=(.*)$", line)
+        match = _ENV_ASSIGNMENT_PATTERN.match(line)
         if not match:
             rendered.append(line)
             continue
@@ -684,8 +689,6 @@ def run_setup_wizard() -> None:
             if _ask_confirm("Open .env in an editor now?", default=True):
                 command = resolve_editor_command(None)
                 try:
-                    import subprocess
-
                     subprocess.run([*command, str(env_path)], check=False)
                 except FileNotFoundError:
                     warning_message(
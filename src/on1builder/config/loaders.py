@@ -191,6 +191,8 @@ class _EnvSettings(BaseSettings):
     smtp_username: str | None = Field(None, alias="SMTP_USERNAME")
     smtp_password: str | None = Field(None, alias="SMTP_PASSWORD")
     alert_email: str | None = Field(None, alias="ALERT_EMAIL")
+    notification_pool_size: int = Field(100, alias="NOTIFICATION_POOL_SIZE")
+    notification_pool_per_host: int = Field(30, alias="NOTIFICATION_POOL_PER_HOST")
 
     database_url: str = Field(
         "sqlite+aiosqlite:///on1builder_data.db", alias="DATABASE_URL"
@@ -303,6 +305,8 @@ def load_settings(env_path: Path | None = None) -> GlobalSettings:
         smtp_username=env_settings.smtp_username,
         smtp_password=env_settings.smtp_password,
         alert_email=env_settings.alert_email,
+        pool_size=env_settings.notification_pool_size,
+        pool_per_host=env_settings.notification_pool_per_host,
     )
 
     database_settings = DatabaseSettings(url=env_settings.database_url)
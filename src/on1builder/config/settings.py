@@ -65,6 +65,8 @@ class NotificationSettings(BaseModel):
     smtp_username: str | None = None
     smtp_password: str | None = None
     alert_email: str | None = None
+    pool_size: int = Field(default=100, gt=0)
+    pool_per_host: int = Field(default=30, gt=0)
 
     @field_validator("min_level", mode="before")
     def normalize_level(cls, v):
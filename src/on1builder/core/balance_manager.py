@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from decimal import Decimal
 from typing import Any
 
@@ -91,8 +92,6 @@ class BalanceManager:
 
     async def update_balance(self, force: bool = False) -> Decimal:
         """balance update with intelligent caching."""
-        import time
-
         async with self._balance_lock:
             current_time = time.time()
 
@@ -363,8 +362,6 @@ class BalanceManager:
         self, token_symbol: str, force_refresh: bool = False
     ) -> Decimal:
         """Get token balance using symbol lookup."""
-        import time
-
         # Check cache first
         if not force_refresh:
             cached_balance = self._token_balance_cache.get(token_symbol)
@@ -471,8 +468,6 @@ class BalanceManager:
 
     def _cache_token_balance(self, identifier: str, balance: Decimal) -> None:
         """Cache token balance with timestamp."""
-        import time
-
         self._token_balance_cache[identifier] = (balance, time.time())
         if not identifier.startswith("0x"):  # Only update balances dict for symbols
             self.balances[identifier] = balance
@@ -600,8 +595,6 @@ class BalanceManager:
             self._performance_metrics["max_profit"] = profit_amount
 
         # Add to profit history
-        import time
-
         profit_record = {
             "timestamp": time.time(),
             "strategy": strategy,
@@ -680,8 +673,6 @@ class BalanceManager:
 
     def get_recent_performance(self, hours: int = 24) -> dict[str, Any]:
         """Get performance metrics for recent period."""
-        import time
-
         cutoff_time = time.time() - (hours * 3600)
 
         recent_trades = [
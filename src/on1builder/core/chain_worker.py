@@ -36,7 +36,7 @@ class ChainWorker:
     def __init__(self, chain_id: int):
         self.chain_id = chain_id
         self.is_running = False
-        self._tasks: list[asyncio.Task[Any]] = []
+        self._tasks: set[asyncio.Task[Any]] = set()
 
         # Core components
         self.web3: AsyncWeb3 | None = None
@@ -178,13 +178,18 @@ class ChainWorker:
 
         logger.debug(f"[Chain {self.chain_id}] Starting ON1Builder background tasks...")
 
-        # Start core monitoring tasks
-        self._tasks.append(asyncio.create_task(self.market_feed.start()))
-        self._tasks.append(asyncio.create_task(self.tx_scanner.start()))
-        self._tasks.append(asyncio.create_task(self._ON1Builder_heartbeat()))
-        self._tasks.append(asyncio.create_task(self._balance_monitoring_loop()))
-        self._tasks.append(asyncio.create_task(self._performance_reporting_loop()))
-        self._tasks.append(asyncio.create_task(self._run_startup_test_transaction()))
+        # Start core monitoring tasks; finished ones drop out of the set themselves
+        for coro in (
+            self.market_feed.start(),
+            self.tx_scanner.start(),
+            self._ON1Builder_heartbeat(),
+            self._balance_monitoring_loop(),
+            self._performance_reporting_loop(),
+            self._run_startup_test_transaction(),
+        ):
+            task = asyncio.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
         await asyncio.gather(*self._tasks, return_exceptions=True)
 
@@ -196,14 +201,11 @@ class ChainWorker:
         logger.debug(f"[Chain {self.chain_id}] Stopping ON1Builder worker...")
         self.is_running = False
 
-        # Cancel all tasks
-        for task in self._tasks:
+        # Cancel all still-running tasks and wait for them to complete
+        tasks = list(self._tasks)
+        for task in tasks:
             task.cancel()
-
-        # Wait for tasks to complete
-        await asyncio.gather(
-            *[t for t in self._tasks if not t.done()], return_exceptions=True
-        )
+        await asyncio.gather(*tasks, return_exceptions=True)
         self._tasks.clear()
 
         # Stop components
@@ -215,6 +217,9 @@ class ChainWorker:
         # Final performance report
         await self._generate_final_report()
 
+        if self.tx_manager:
+            await self.tx_manager.close()
+
         logger.info("Closing ChainWorker...")
 
     async def _run_startup_test_transaction(self) -> None:
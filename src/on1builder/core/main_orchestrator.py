@@ -53,6 +53,7 @@ class MainOrchestrator:
         self._db_interface: DatabaseInterface | None = None
         self._error_recovery_manager = get_error_recovery_manager()
         self._performance_monitor_task: asyncio.Task | None = None
+        self._background_tasks: list[asyncio.Task] = []
         self._last_profit_report = datetime.now()
         self._startup_time = datetime.now()
         self._error_count = 0
@@ -145,21 +146,32 @@ class MainOrchestrator:
         successful_workers = 0
         failed_chains = []
 
-        for chain_id in self._config.chains:
-            try:
-                await self._initialize_chain_worker(chain_id)
-                successful_workers += 1
-                logger.debug("Successfully initialized worker for chain %s", chain_id)
+        # Chains are independent, so connect them concurrently: startup then
+        # takes as long as the slowest chain rather than the sum of all of them.
+        chains = list(self._config.chains)
+        results = await asyncio.gather(
+            *(self._initialize_chain_worker(chain_id) for chain_id in chains),
+            return_exceptions=True,
+        )
+        chain_order = {chain_id: index for index, chain_id in enumerate(chains)}
+        self._workers.sort(key=lambda w: chain_order.get(w.chain_id, len(chains)))
 
-            except Exception as e:
+        for chain_id, result in zip(chains, results):
+            if isinstance(result, BaseException):
                 failed_chains.append(chain_id)
-                logger.error(f"Failed to initialize worker for chain {chain_id}: {e}")
+                logger.error(
+                    f"Failed to initialize worker for chain {chain_id}: {result}"
+                )
                 await self._send_alert(
                     title=f"Chain {chain_id} Initialization Failed",
                     message=f"Could not initialize worker for chain {chain_id}",
                     level="ERROR",
-                    details={"chain_id": chain_id, "error": str(e)},
+                    details={"chain_id": chain_id, "error": str(result)},
                 )
+                continue
+
+            successful_workers += 1
+            logger.debug("Successfully initialized worker for chain %s", chain_id)
 
         if successful_workers == 0:
             raise InitializationError("No workers were initialized successfully")
@@ -186,12 +198,14 @@ class MainOrchestrator:
             self._multi_chain_orchestrator = MultiChainOrchestrator(self._workers)
             logger.info("Multi-chain orchestrator initialized")
 
-        # Start all workers
-        worker_tasks = [asyncio.create_task(worker.start()) for worker in self._workers]
+        # Start all workers; keep the task handles so shutdown can reap them
+        self._background_tasks = [
+            asyncio.create_task(worker.start()) for worker in self._workers
+        ]
 
         # Start multi-chain orchestrator if available
         if self._multi_chain_orchestrator:
-            worker_tasks.append(
+            self._background_tasks.append(
                 asyncio.create_task(self._multi_chain_orchestrator.start())
             )
 
@@ -266,6 +280,14 @@ class MainOrchestrator:
             logger.info(f"Shutdown sequence initiated{signal_name}.")
             self._shutdown_event.set()
 
+    async def _cancel_background_tasks(self) -> None:
+        """Cancel all outstanding background tasks and reap them in one gather."""
+        pending = [task for task in self._background_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._background_tasks.clear()
+
     async def _shutdown(self):
         """Performs the actual shutdown of all workers and services."""
         logger.debug(f"Stopping {len(self._workers)} chain workers...")
@@ -285,6 +307,7 @@ class MainOrchestrator:
         # Stop all workers
         shutdown_tasks = [worker.stop() for worker in self._workers]
         await asyncio.gather(*shutdown_tasks, return_exceptions=True)
+        await self._cancel_background_tasks()
 
         # Generate final profit report
         await self._generate_final_report()
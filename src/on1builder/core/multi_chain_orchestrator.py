@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -176,8 +177,6 @@ class MultiChainOrchestrator:
         return opportunities
 
     def _get_common_tokens(self) -> set[str]:
-        from collections import Counter
-
         all_symbols: list[str] = []
         for worker in self.workers.values():
             if worker.tx_scanner:
@@ -473,29 +472,27 @@ class MultiChainOrchestrator:
                 },
             }
 
-            chain_id = await worker.web3.eth.chain_id
-            routers = dex_routers.get(chain_id, {})
+            # The worker's chain was validated against the provider at startup,
+            # so there is no need to ask the node for it again per query.
+            routers = dex_routers.get(worker.chain_id, {})
+
+            # Token addresses do not depend on the router; resolve them once
+            token_address = await self._get_token_address(worker, token_symbol)
+            weth_address = await self._get_token_address(worker, "WETH")
+            usdc_address = await self._get_token_address(worker, "USDC")
+            if not (token_address and weth_address and usdc_address):
+                routers = {}
 
             for dex_name, router_address in routers.items():
                 try:
-                    # Get token contract address from symbol
-                    token_address = await self._get_token_address(worker, token_symbol)
-                    if not token_address:
-                        continue
-
-                    # Query pool reserves for major pairs (ETH/USDC)
-                    weth_address = await self._get_token_address(worker, "WETH")
-                    usdc_address = await self._get_token_address(worker, "USDC")
-
-                    if weth_address and usdc_address:
-                        # Check liquidity in token/WETH and token/USDC pools
-                        for base_token in [weth_address, usdc_address]:
-                            pool_liquidity = await self._query_pool_liquidity(
-                                worker, token_address, base_token, router_address
-                            )
-                            if pool_liquidity > 0:
-                                total_liquidity += pool_liquidity
-                                liquidity_sources += 1
+                    # Check liquidity in token/WETH and token/USDC pools
+                    for base_token in [weth_address, usdc_address]:
+                        pool_liquidity = await self._query_pool_liquidity(
+                            worker, token_address, base_token, router_address
+                        )
+                        if pool_liquidity > 0:
+                            total_liquidity += pool_liquidity
+                            liquidity_sources += 1
 
                 except Exception as e:
                     logger.warning(
@@ -839,12 +836,7 @@ class MultiChainOrchestrator:
             },
         }
 
-        try:
-            assert worker.web3 is not None
-            chain_id = await worker.web3.eth.chain_id
-            return token_addresses.get(chain_id, {}).get(symbol, "")
-        except Exception:
-            return ""
+        return token_addresses.get(worker.chain_id, {}).get(symbol, "")
 
     async def _query_pool_liquidity(
         self, worker: ChainWorker, token_a: str, token_b: str, router_address: str
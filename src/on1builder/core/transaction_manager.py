@@ -91,6 +91,8 @@ class TransactionManager:
         self._bundle_signer_key = getattr(settings, "bundle_signer_key", None)
         self._bundle_signer_key_path = getattr(settings, "bundle_signer_key_path", None)
         self._bundle_signer_account: LocalAccount | None = None
+        # Shared by relay, private-RPC and simulation calls to reuse connections
+        self._http_session: aiohttp.ClientSession | None = None
 
         # Performance tracking
         self._execution_stats = {
@@ -124,6 +126,18 @@ class TransactionManager:
             logger.error(f"Error initializing TransactionManager: {e}")
             raise
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Lazily creates and returns the shared aiohttp ClientSession."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
+    async def close(self) -> None:
+        """Closes the shared aiohttp session."""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
     async def _build_transaction(
         self,
         to: str,
@@ -331,10 +345,10 @@ class TransactionManager:
                 "method": method,
                 "params": [self._format_raw_tx(raw_tx)],
             }
-            async with (
-                aiohttp.ClientSession() as session,
-                session.post(self._private_rpc_url, json=payload, timeout=15) as resp,
-            ):
+            session = await self._get_http_session()
+            async with session.post(
+                self._private_rpc_url, json=payload, timeout=15
+            ) as resp:
                 data = await resp.json()
                 if "error" in data:
                     raise StrategyExecutionError(
@@ -366,9 +380,7 @@ class TransactionManager:
         target_block = (
             await self._web3.eth.block_number
         ) + self._bundle_target_block_offset
-        import time as _time
-
-        now = int(_time.time())
+        now = int(time.time())
 
         payload: dict[str, Any] = {
             "jsonrpc": "2.0",
@@ -395,12 +407,10 @@ class TransactionManager:
         except Exception as e:
             raise StrategyExecutionError(f"Failed to sign bundle payload: {e}") from e
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(
-                self._bundle_relay_url, data=body, headers=headers, timeout=15
-            ) as resp,
-        ):
+        session = await self._get_http_session()
+        async with session.post(
+            self._bundle_relay_url, data=body, headers=headers, timeout=15
+        ) as resp:
             data = await resp.json()
             if "error" in data:
                 raise StrategyExecutionError(
@@ -592,14 +602,14 @@ class TransactionManager:
 
             # Send notification for significant profits or failures
             if status and actual_profit_eth > 0.01:
-                await self._notification_service.send_alert(
+                self._notification_service.queue_alert(
                     title=f"Profitable Trade: {strategy_name}",
                     message=f"Profit: {actual_profit_eth:.6f} ETH",
                     level="INFO",
                     details=result,
                 )
             elif not status:
-                await self._notification_service.send_alert(
+                self._notification_service.queue_alert(
                     title=f"Transaction Failed: {strategy_name}",
                     message=f"Transaction {tx_hash} failed",
                     level="WARNING",
@@ -644,7 +654,7 @@ class TransactionManager:
                     exc_info=True,
                 )
             logger.error(f"Execution failed for strategy '{strategy_name}': {e}")
-            await self._notification_service.send_alert(
+            self._notification_service.queue_alert(
                 title=f"Strategy '{strategy_name}' Failed",
                 message=str(e),
                 level="ERROR",
@@ -725,19 +735,19 @@ class TransactionManager:
                 )
             tx_for_call = dict(tx_params)
             tx_for_call.pop("nonce", None)
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [tx_for_call, "latest"],
-                }
-                async with session.post(fork_rpc, json=payload, timeout=15) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        raise StrategyExecutionError(
-                            f"Anvil simulation failed: {data['error'].get('message', data['error'])}"
-                        )
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "eth_call",
+                "params": [tx_for_call, "latest"],
+            }
+            session = await self._get_http_session()
+            async with session.post(fork_rpc, json=payload, timeout=15) as resp:
+                data = await resp.json()
+                if "error" in data:
+                    raise StrategyExecutionError(
+                        f"Anvil simulation failed: {data['error'].get('message', data['error'])}"
+                    )
         elif backend == "tenderly":
             await self._simulate_with_tenderly(tx_params)
         else:
@@ -776,10 +786,8 @@ class TransactionManager:
             "Authorization": f"Bearer {self._tenderly_token}",
         }
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(url, json=payload, headers=headers, timeout=15) as resp,
-        ):
+        session = await self._get_http_session()
+        async with session.post(url, json=payload, headers=headers, timeout=15) as resp:
             data = await resp.json()
             if resp.status >= 400 or "error" in data:
                 message = (
@@ -1340,8 +1348,6 @@ class TransactionManager:
         }
 
         # Properly encode arbitrage data for flashloan contract callback
-        import json
-
         try:
             # Create structured data for the flashloan callback
             callback_data = {
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from web3 import AsyncWeb3
@@ -44,6 +45,9 @@ class SafetyGuard:
         "normal": None,  # Use configured minimum
     }
 
+    # Upper bound on remembered duplicate signatures; oldest are evicted first
+    MAX_RECENT_TX_SIGNATURES = 1000
+
     def __init__(
         self,
         web3: AsyncWeb3,
@@ -60,7 +64,7 @@ class SafetyGuard:
         self._chain_id = chain_id
 
         # Transaction tracking with efficient storage
-        self._recent_tx_signatures = set()
+        self._recent_tx_signatures: OrderedDict[str, None] = OrderedDict()
         self._duplicate_attempts: dict[str, int] = {}
         self._last_clear_time = time.time()
 
@@ -306,7 +310,7 @@ class SafetyGuard:
         self._duplicate_attempts[tx_signature] = attempts
 
         if attempts > self._duplicate_threshold:
-            self._recent_tx_signatures.add(tx_signature)
+            self._remember_signature(tx_signature)
             self._safety_stats["failed_duplicate_checks"] += 1
             return False, "Potential duplicate transaction detected"
 
@@ -426,6 +430,13 @@ class SafetyGuard:
         else:
             self._failed_tx_count += 1
 
+    def _remember_signature(self, tx_signature: str) -> None:
+        """Record a duplicate signature, evicting the oldest beyond the cap."""
+        self._recent_tx_signatures[tx_signature] = None
+        self._recent_tx_signatures.move_to_end(tx_signature)
+        if len(self._recent_tx_signatures) > self.MAX_RECENT_TX_SIGNATURES:
+            self._recent_tx_signatures.popitem(last=False)
+
     def _clear_stale_signatures(self) -> None:
         """Clear old transaction signatures."""
         if time.time() - self._last_clear_time > 60:  # Clear every 60 seconds
@@ -462,12 +473,6 @@ class SafetyGuard:
         self._circuit_break_time = 0
         self._failed_tx_count = 0
 
-        # Clean recent transaction signatures periodically
-        if len(self._recent_tx_signatures) > 1000:
-            # Keep only the most recent half
-            signatures_list = list(self._recent_tx_signatures)
-            self._recent_tx_signatures = set(signatures_list[-500:])
-
         # Send notification
         try:
             self._notification_service.send_message(
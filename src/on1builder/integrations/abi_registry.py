@@ -7,6 +7,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from on1builder.utils.json_utils import json_loads
 from on1builder.utils.logging_config import get_logger
 from on1builder.utils.path_helpers import get_monitored_tokens_path, get_resource_dir
 from on1builder.utils.singleton import SingletonMeta
@@ -50,8 +51,8 @@ class ABIRegistry(metaclass=SingletonMeta):
             for file_path in abi_dir.glob("*.json"):
                 try:
                     name = file_path.stem.lower().replace("_abi", "")
-                    with open(file_path) as f:
-                        abi_data = json.load(f)
+                    with open(file_path, "rb") as f:
+                        abi_data = json_loads(f.read())
                         # ABI can be a list directly or inside an 'abi' key
                         self._abis[name] = (
                             abi_data
@@ -73,8 +74,8 @@ class ABIRegistry(metaclass=SingletonMeta):
             logger.warning(f"Monitored tokens file not found at: {tokens_file_path}")
         else:
             try:
-                with open(tokens_file_path) as f:
-                    self._tokens = json.load(f)
+                with open(tokens_file_path, "rb") as f:
+                    self._tokens = json_loads(f.read())
                 self._build_token_maps()
                 logger.debug("Loaded and mapped %s tokens.", len(self._tokens))
             except (OSError, json.JSONDecodeError) as e:
@@ -90,40 +91,29 @@ class ABIRegistry(metaclass=SingletonMeta):
             symbol = token_data.get("symbol")
             if not symbol:
                 continue
+            symbol = symbol.upper()
 
             for chain_id_str, address in token_data.get("addresses", {}).items():
                 try:
                     chain_id = int(chain_id_str)
-
-                    # Map by symbol
-                    if chain_id not in self._token_map_by_symbol:
-                        self._token_map_by_symbol[chain_id] = {}
-                    self._token_map_by_symbol[chain_id][
-                        symbol.upper()
-                    ] = address.lower()
-
-                    # Map by address
-                    if chain_id not in self._token_map_by_address:
-                        self._token_map_by_address[chain_id] = {}
-                    self._token_map_by_address[chain_id][
-                        address.lower()
-                    ] = symbol.upper()
-
-                    # Store token info for quick lookup (including decimals/name where available)
-                    if chain_id not in self._token_info_by_address:
-                        self._token_info_by_address[chain_id] = {}
-                    self._token_info_by_address[chain_id][address.lower()] = {
-                        "symbol": symbol.upper(),
-                        "address": address.lower(),
-                        "chain_id": chain_id,
-                        "name": token_data.get("name"),
-                        "decimals": token_data.get("decimals", 18),
-                        "api_ids": token_data.get("api_ids", {}),
-                    }
                 except ValueError:
                     logger.warning(
                         f"Invalid chain ID '{chain_id_str}' for token {symbol}"
                     )
+                    continue
+                address = address.lower()
+
+                self._token_map_by_symbol.setdefault(chain_id, {})[symbol] = address
+                self._token_map_by_address.setdefault(chain_id, {})[address] = symbol
+                # Token info for quick lookup (including decimals/name where available)
+                self._token_info_by_address.setdefault(chain_id, {})[address] = {
+                    "symbol": symbol,
+                    "address": address,
+                    "chain_id": chain_id,
+                    "name": token_data.get("name"),
+                    "decimals": token_data.get("decimals", 18),
+                    "api_ids": token_data.get("api_ids", {}),
+                }
 
     def get_abi(self, name: str) -> list[dict[str, Any]] | None:
         """
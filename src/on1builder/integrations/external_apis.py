@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -16,6 +17,7 @@ from cachetools import TTLCache
 
 from on1builder.config.loaders import settings
 from on1builder.utils.custom_exceptions import APICallError
+from on1builder.utils.json_utils import json_loads
 from on1builder.utils.logging_config import get_logger
 from on1builder.utils.path_helpers import get_resource_path
 from on1builder.utils.singleton import SingletonMeta
@@ -423,8 +425,8 @@ class ExternalAPIManager(metaclass=SingletonMeta):
     def _parse_token_json(self, token_file: str) -> list[dict]:
         """Parse token JSON file synchronously (called in executor)."""
         try:
-            with open(token_file, encoding="utf-8") as f:
-                return json.load(f)
+            with open(token_file, "rb") as f:
+                return json_loads(f.read())
         except (OSError, json.JSONDecodeError) as e:
             logger.error(f"JSON parsing error: {e}")
             return []
@@ -529,8 +531,6 @@ class ExternalAPIManager(metaclass=SingletonMeta):
         # If token not found and we haven't loaded all tokens yet, try loading them
         if not token_mapping and not self._all_tokens_loaded:
             # Add cooldown to prevent spamming token loads
-            import time
-
             current_time = time.time()
             if current_time - self._all_tokens_load_time > 3600:  # 1 hour cooldown
                 logger.debug(
@@ -817,7 +817,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 url, params=params, headers=headers
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=json_loads)
                 elif response.status == 400 and provider_name == "binance":
                     # 400 from Binance usually means invalid symbol - this is expected for many tokens
                     symbol = params.get("symbol", "unknown") if params else "unknown"
@@ -938,9 +938,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
             if answer is None or int(answer) <= 0:
                 return None
             # basic staleness check: 1 hour
-            import time as _time
-
-            if updated_at and (_time.time() - int(updated_at) > 3600):
+            if updated_at and (time.time() - int(updated_at) > 3600):
                 logger.debug(
                     f"Oracle price stale for {token_symbol}: updated_at={updated_at}"
                 )
@@ -1040,8 +1038,6 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                         returns.append(return_val)
 
                 if returns:
-                    import math
-
                     mean_return = sum(returns) / len(returns)
                     variance = sum((r - mean_return) ** 2 for r in returns) / len(
                         returns
@@ -1184,7 +1180,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
 
                 async with self._session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
 
                         # Extract sentiment indicators
                         sentiment_votes = data.get("sentiment_votes_up_percentage", 50)
@@ -1220,7 +1216,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 }
                 async with self._session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         market_data = data.get("market_data", {})
                         volume = market_data.get("total_volume", {}).get("usd")
                         if volume is not None:
@@ -1448,7 +1444,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
 
                 async with self._session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         market_data = data.get("market_data", {})
                         market_cap = market_data.get("market_cap", {}).get("usd")
                         if market_cap:
@@ -1475,7 +1471,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 }
                 async with self._session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         market_data = data.get("market_data", {})
                         supply = market_data.get("circulating_supply")
                         if supply:
@@ -1535,7 +1531,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 session.get(url, timeout=5) as resp,
             ):
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_loads)
                     community_data = data.get("community_data", {})
 
                     reddit_subscribers = community_data.get("reddit_subscribers", 0)
@@ -1621,7 +1617,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 session.get(url, timeout=5) as resp,
             ):
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_loads)
                     dev_data = data.get("developer_data", {})
 
                     commits_4_weeks = dev_data.get("commit_count_4_weeks", 0)
@@ -1723,7 +1719,7 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                 session.get(url, timeout=10) as resp,
             ):
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_loads)
                     prices = data.get("prices", [])
                     return [price[1] for price in prices]  # Extract price values
 
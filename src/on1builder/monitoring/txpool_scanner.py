@@ -9,6 +9,8 @@ import re
 from datetime import datetime, timedelta
 from typing import Any
 
+import eth_abi
+from cachetools import LRUCache
 from web3 import AsyncWeb3
 from web3.exceptions import TransactionNotFound
 from web3.types import TxData
@@ -35,12 +37,49 @@ class TxPoolScanner:
         "flash_loan": re.compile(r"flashLoan|flashSwap", re.IGNORECASE),
     }
 
+    # Common DEX swap selectors -> (call kind, ABI argument types), built once
+    SWAP_SELECTOR_ABI: dict[str, tuple[str, list[str]]] = {
+        # Uniswap V2 swapExactTokensForTokens
+        "0x38ed1739": (
+            "exact_in",
+            ["uint256", "uint256", "address[]", "address", "uint256"],
+        ),
+        # Uniswap V2 swapTokensForExactTokens
+        "0x8803dbee": (
+            "exact_out",
+            ["uint256", "uint256", "address[]", "address", "uint256"],
+        ),
+        # Uniswap V2 swapExactETHForTokens
+        "0x7ff36ab5": (
+            "eth_exact_in",
+            ["uint256", "address[]", "address", "uint256"],
+        ),
+        # Uniswap V2 swapExactTokensForETH
+        "0x18cbafe5": (
+            "exact_in",
+            ["uint256", "uint256", "address[]", "address", "uint256"],
+        ),
+        # Uniswap V3 exactInputSingle
+        "0x414bf389": (
+            "v3_exact_input_single",
+            ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
+        ),
+        # Uniswap V3 exactInput
+        "0xc04b8d59": (
+            "v3_exact_input",
+            ["(bytes,address,uint256,uint256,uint256)"],
+        ),
+    }
+
     # Cache management constants
     MAX_TX_CACHE_SIZE = 1000
-    MAX_OPPORTUNITY_CACHE_SIZE = 500
     CACHE_CLEANUP_THRESHOLD = 0.8
     MEV_LOG_EVERY = 50
     NOT_FOUND_LOG_EVERY = 50
+    # Pending hashes waiting for analysis; newer hashes are dropped when full
+    MAX_PENDING_QUEUE_SIZE = 1000
+    TX_WORKER_COUNT = 8
+    TX_BATCH_SIZE = 32
     SUPPORTED_SWAP_DEXES = {"uniswap_v2", "uniswap_v3", "sushiswap", "pancakeswap"}
 
     def __init__(
@@ -52,6 +91,10 @@ class TxPoolScanner:
         self._abi_registry = ABIRegistry()
         self._is_running = False
         self._scan_task: asyncio.Task | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._tx_hash_queue: asyncio.Queue[Any] = asyncio.Queue(
+            maxsize=self.MAX_PENDING_QUEUE_SIZE
+        )
 
         # Build chain-specific DEX router mapping
         self._dex_routers = self._build_dex_router_mapping()
@@ -65,11 +108,11 @@ class TxPoolScanner:
         self._opportunity_count = 0
         self._mev_log_counter = 0
         self._not_found_counter = 0
+        self._dropped_tx_count = 0
+        self._cache_hits = 0
 
-        # - caching with size management
-        self._tx_analysis_cache: dict[str, dict] = {}
-        self._opportunity_cache: dict[str, dict] = {}
-        self._cache_access_times: dict[str, datetime] = {}
+        # Bounded cache; the LRU evicts the least recently analyzed tx on insert
+        self._tx_analysis_cache: LRUCache = LRUCache(maxsize=self.MAX_TX_CACHE_SIZE)
 
         logger.debug(
             "ON1Builder TxPoolScanner initialized. Monitoring %s addresses.",
@@ -110,39 +153,24 @@ class TxPoolScanner:
 
     def _get_all_monitored_addresses(self) -> set[str]:
         """Gathers all unique token addresses to monitor across all configured chains."""
-        addresses = set()
-        for chain_id in settings.chains:
-            token_map = self._abi_registry.get_monitored_tokens(chain_id)
-            addresses.update(addr.lower() for addr in token_map.values())
-        return addresses
+        return {
+            address
+            for address in (
+                addr.lower()
+                for chain_id in settings.chains
+                for addr in self._abi_registry.get_monitored_tokens(chain_id).values()
+            )
+            if address.startswith("0x")
+        }
 
     def _manage_cache_size(self) -> None:
-        """Efficiently manage cache sizes to prevent memory bloat."""
-        current_time = datetime.now()
-
-        # Clean tx analysis cache
+        """Trim the tx analysis cache ahead of LRU eviction under memory pressure."""
         if len(self._tx_analysis_cache) > int(
             self.MAX_TX_CACHE_SIZE * self.CACHE_CLEANUP_THRESHOLD
         ):
-            # Remove oldest 20% of entries
-            removal_count = len(self._tx_analysis_cache) // 5
-            oldest_keys = sorted(
-                self._cache_access_times.keys(),
-                key=lambda k: self._cache_access_times.get(k, current_time),
-            )[:removal_count]
-
-            for key in oldest_keys:
-                self._tx_analysis_cache.pop(key, None)
-                self._cache_access_times.pop(key, None)
-
-        # Clean opportunity cache
-        if len(self._opportunity_cache) > int(
-            self.MAX_OPPORTUNITY_CACHE_SIZE * self.CACHE_CLEANUP_THRESHOLD
-        ):
-            removal_count = len(self._opportunity_cache) // 5
-            oldest_opportunities = list(self._opportunity_cache.keys())[:removal_count]
-            for key in oldest_opportunities:
-                self._opportunity_cache.pop(key, None)
+            # Remove least recently used 20% of entries
+            for _ in range(len(self._tx_analysis_cache) // 5):
+                self._tx_analysis_cache.popitem()
 
     async def start(self):
         if self._is_running:
@@ -154,6 +182,9 @@ class TxPoolScanner:
             "Scanning transaction pool for MEV opportunities on chain %s...",
             self._chain_id,
         )
+        self._worker_tasks = [
+            asyncio.create_task(self._tx_worker()) for _ in range(self.TX_WORKER_COUNT)
+        ]
         self._scan_task = asyncio.create_task(self._subscribe_to_pending_transactions())
 
     async def stop(self):
@@ -161,14 +192,48 @@ class TxPoolScanner:
             return
 
         self._is_running = False
+        tasks = list(self._worker_tasks)
         if self._scan_task:
-            self._scan_task.cancel()
-            try:
-                await self._scan_task
-            except asyncio.CancelledError:
-                pass
+            tasks.append(self._scan_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker_tasks = []
         logger.info("TxPoolScanner stopped.")
 
+    def _enqueue_tx_hash(self, tx_hash: Any) -> None:
+        """Queue a pending hash for the workers, dropping it if the queue is full."""
+        try:
+            self._tx_hash_queue.put_nowait(tx_hash)
+        except asyncio.QueueFull:
+            # Stale mempool entries are worthless; never stall the subscription
+            self._dropped_tx_count += 1
+
+    def _drain_tx_batch(self, first: Any) -> list[Any]:
+        """Collect ``first`` plus any already-queued hashes, up to TX_BATCH_SIZE."""
+        batch = [first]
+        while len(batch) < self.TX_BATCH_SIZE:
+            try:
+                batch.append(self._tx_hash_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _tx_worker(self) -> None:
+        """Consume queued pending hashes in batches until cancelled."""
+        while True:
+            batch = self._drain_tx_batch(await self._tx_hash_queue.get())
+            try:
+                # Process the batch concurrently so one slow RPC fetch does not
+                # hold up the rest of the drained hashes
+                await asyncio.gather(
+                    *(self._process_tx_hash(tx_hash) for tx_hash in batch),
+                    return_exceptions=True,
+                )
+            finally:
+                for _ in batch:
+                    self._tx_hash_queue.task_done()
+
     async def _subscribe_to_pending_transactions(self):
         """
         Establishes a WebSocket subscription to new pending transactions and
@@ -218,7 +283,7 @@ class TxPoolScanner:
                     tx_hash = context.result
                     if tx_hash:
                         self._pending_tx_count += 1
-                        asyncio.create_task(self._process_tx_hash(tx_hash))
+                        self._enqueue_tx_hash(tx_hash)
 
                 subscription_id = await ws_web3.eth.subscribe(
                     "newPendingTransactions", handler=_handle_pending
@@ -258,11 +323,10 @@ class TxPoolScanner:
         """transaction processing with comprehensive MEV analysis."""
         normalized_hash = self._normalize_tx_hash(tx_hash)
         try:
-            # Check cache first
-            if normalized_hash in self._tx_analysis_cache:
-                self._cache_access_times[normalized_hash] = datetime.now()
-                tx_analysis = self._tx_analysis_cache[normalized_hash]
-                tx = None  # Don't need full tx data if cached
+            # Check cache first (a hit also refreshes the entry's LRU position)
+            tx_analysis = self._tx_analysis_cache.get(normalized_hash)
+            if tx_analysis is not None:
+                self._cache_hits += 1
             else:
                 tx = await self._web3.eth.get_transaction(normalized_hash)
                 if not tx:
@@ -271,13 +335,7 @@ class TxPoolScanner:
                 # Perform analysis
                 tx_analysis = self._analyze_transaction_comprehensive(tx)
 
-                # Cache with access time tracking
                 self._tx_analysis_cache[normalized_hash] = tx_analysis
-                self._cache_access_times[normalized_hash] = datetime.now()
-
-                # Manage cache size efficiently
-                if len(self._tx_analysis_cache) > self.MAX_TX_CACHE_SIZE:
-                    self._manage_cache_size()
 
             self._processed_tx_count += 1
 
@@ -430,43 +488,11 @@ class TxPoolScanner:
         if not data_hex:
             return {}
 
-        swap_selectors = {
-            "0x38ed1739": (
-                "exact_in",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x8803dbee": (
-                "exact_out",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x7ff36ab5": (
-                "eth_exact_in",
-                ["uint256", "address[]", "address", "uint256"],
-            ),
-            "0x18cbafe5": (
-                "exact_in",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x414bf389": (
-                "v3_exact_input_single",
-                ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
-            ),
-            "0xc04b8d59": (
-                "v3_exact_input",
-                ["(bytes,address,uint256,uint256,uint256)"],
-            ),
-        }
-
-        if func_selector not in swap_selectors:
-            return {}
-
-        try:
-            import eth_abi
-        except Exception:
+        if func_selector not in self.SWAP_SELECTOR_ABI:
             return {}
 
         try:
-            kind, types = swap_selectors[func_selector]
+            kind, types = self.SWAP_SELECTOR_ABI[func_selector]
             decoded = eth_abi.decode(types, bytes.fromhex(data_hex))
             if kind == "v3_exact_input_single":
                 params = decoded[0]
@@ -685,26 +711,14 @@ class TxPoolScanner:
             if len(tx_input) < 10:  # Must have function selector + data
                 return None
 
-            # Common DEX function selectors
-            swap_selectors = {
-                "0x38ed1739": "swapExactTokensForTokens",  # Uniswap V2
-                "0x8803dbee": "swapTokensForExactTokens",  # Uniswap V2
-                "0x7ff36ab5": "swapExactETHForTokens",  # Uniswap V2
-                "0x18cbafe5": "swapExactTokensForETH",  # Uniswap V2
-                "0x414bf389": "exactInputSingle",  # Uniswap V3
-                "0xc04b8d59": "exactInput",  # Uniswap V3
-            }
-
             func_selector = tx_input[:10]
-            if func_selector not in swap_selectors:
+            if func_selector not in self.SWAP_SELECTOR_ABI:
                 estimated_price_impact = (
                     analysis["value_eth"] * 0.002
                 )  # Fallback estimate
             else:
                 # Parse swap parameters for better analysis
                 try:
-                    import eth_abi
-
                     # Decode based on function type
                     if func_selector == "0x38ed1739":  # swapExactTokensForTokens
                         # (uint amountIn, uint amountOutMin, address[] path, address to, uint deadline)
@@ -843,12 +857,13 @@ class TxPoolScanner:
         """Returns cache statistics for monitoring."""
         return {
             "tx_analysis_cache_size": len(self._tx_analysis_cache),
-            "opportunity_cache_size": len(self._opportunity_cache),
             "monitored_addresses": len(self._monitored_addresses),
             "dex_addresses": len(self._dex_routers),
             "processed_transactions": self._processed_tx_count,
             "detected_opportunities": self._opportunity_count,
-            "cache_access_entries": len(self._cache_access_times),
+            "cache_hits": self._cache_hits,
+            "queued_transactions": self._tx_hash_queue.qsize(),
+            "dropped_transactions": self._dropped_tx_count,
         }
 
     def get_performance_metrics(self) -> dict[str, Any]:
@@ -861,11 +876,9 @@ class TxPoolScanner:
             "detected_opportunities": self._opportunity_count,
             "processing_rate": self._processed_tx_count / total_pending,
             "opportunity_detection_rate": self._opportunity_count / total_pending,
-            "cache_hit_efficiency": len(self._cache_access_times)
-            / max(len(self._tx_analysis_cache), 1),
+            "cache_hit_efficiency": self._cache_hits / max(self._processed_tx_count, 1),
             "memory_usage": {
                 "tx_cache_size": len(self._tx_analysis_cache),
-                "opportunity_cache_size": len(self._opportunity_cache),
                 "monitored_addresses": len(self._monitored_addresses),
             },
         }
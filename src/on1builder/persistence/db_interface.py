@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import event, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from on1builder.config.loaders import settings
@@ -18,6 +19,26 @@ from .db_models import Base, MarketPrice, ProfitRecord, Transaction
 
 logger = get_logger(__name__)
 
+# WAL lets readers run alongside the writer and NORMAL sync drops the fsync per
+# commit that dominates small inserts. The database stays consistent, but a
+# power loss or OS crash can roll back the last few commits; that is accepted
+# on purpose, since the chain itself stays the record of what was executed.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune every new SQLite connection opened by the engine."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseInterface:
     """
@@ -26,17 +47,28 @@ class DatabaseInterface:
     """
 
     _instance: DatabaseInterface | None = None
+    _lock: threading.Lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized_once = False
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                # Double-check locking
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized_once = False
+                instance = cls._instance
+        return instance
 
     def __init__(self):
         if getattr(self, "_initialized_once", False):
             return
+        with self._lock:
+            if not self._initialized_once:
+                self._configure()
 
+    def _configure(self) -> None:
+        """Resolve settings and build the engine; runs once per instance."""
         raw_db_settings = getattr(settings, "database", None)
         if isinstance(raw_db_settings, DatabaseSettings):
             db_settings = raw_db_settings
@@ -58,6 +90,8 @@ class DatabaseInterface:
         self._initialized = False
         # Detect stub engine by presence of _store attribute
         self._is_stub = hasattr(self._engine, "_store")
+        if not self._is_stub and self._engine.dialect.name == "sqlite":
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self._initialized_once = True
         logger.debug("DatabaseInterface initialized for URL: %s", self._db_url)
 
@@ -71,7 +105,8 @@ class DatabaseInterface:
     @classmethod
     def reset_instance(cls) -> None:
         """Reset singleton instance for tests."""
-        cls._instance = None
+        with cls._lock:
+            cls._instance = None
 
     # ------------------------------------------------------------------
     # Compatibility accessors
@@ -149,6 +184,48 @@ class DatabaseInterface:
                     return None
                 await asyncio.sleep(0.5 * attempt)
 
+    async def save_transactions(
+        self, rows: list[dict[str, Any]], retries: int = 2
+    ) -> int:
+        """
+        Saves many transaction records with a single bulk INSERT.
+
+        Args:
+            rows: A list of dictionaries containing transaction data.
+
+        Returns:
+            The number of rows written, or 0 on failure.
+        """
+        if not rows:
+            return 0
+
+        attempt = 0
+        while attempt <= retries:
+            try:
+                if self._is_stub:
+                    self._engine._store["transactions"].extend(
+                        Transaction(**row) for row in rows
+                    )
+                    return len(rows)
+
+                async with self._session_factory() as session:
+                    async with session.begin():
+                        await session.execute(insert(Transaction), rows)
+                return len(rows)
+            except Exception as e:
+                attempt += 1
+                logger.error(
+                    "Failed to bulk save %s transactions: %s (attempt %s/%s)",
+                    len(rows),
+                    e,
+                    attempt,
+                    retries + 1,
+                    exc_info=True,
+                )
+                if attempt > retries:
+                    return 0
+                await asyncio.sleep(0.5 * attempt)
+
     async def save_profit_record(
         self, profit_data: dict[str, Any], retries: int = 2
     ) -> ProfitRecord | None:
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import random
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any, TypeVar
@@ -146,8 +147,6 @@ class RetryManager:
         delay = min(delay, self.max_delay)
 
         if self.jitter:
-            import random
-
             # Add ±25% jitter
             jitter_factor = random.uniform(0.75, 1.25)
             delay *= jitter_factor
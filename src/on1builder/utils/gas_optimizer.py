@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import statistics
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -211,21 +212,27 @@ class GasOptimizer:
 
                     # Clean old data efficiently
                     cutoff_time = now - timedelta(hours=self.MAX_HISTORY_HOURS)
-                    self._gas_history = [
-                        (t, p) for t, p in self._gas_history if t > cutoff_time
-                    ]
-                    self._base_fee_history = [
-                        (t, p) for t, p in self._base_fee_history if t > cutoff_time
-                    ]
-                    self._priority_fee_history = [
-                        (t, p) for t, p in self._priority_fee_history if t > cutoff_time
-                    ]
+                    for history in (
+                        self._gas_history,
+                        self._base_fee_history,
+                        self._priority_fee_history,
+                    ):
+                        self._prune_history(history, cutoff_time)
 
                     self._last_update = now
 
                 except Exception as e:
                     logger.error(f"Error updating gas metrics: {e}")
 
+    @staticmethod
+    def _prune_history(
+        history: list[tuple[datetime, int]], cutoff_time: datetime
+    ) -> None:
+        """Drop expired entries in place; histories are appended in time order."""
+        expired = bisect.bisect_right(history, cutoff_time, key=lambda entry: entry[0])
+        if expired:
+            del history[:expired]
+
     async def _calculate_priority_fee_estimate(
         self, latest_block: dict, base_fee: int, current_gas_price: int
     ) -> int:
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+"""
+JSON helpers shared by logging, notifications and the integrations.
+
+orjson is used when the ``speedups`` extra is installed. It only handles
+integers up to 64 bits, while wei and uint256 values regularly exceed that,
+so both helpers fall back to the stdlib whenever such a value is involved.
+Either way ``json_dumps`` produces the same compact layout, and datetimes and
+dataclasses go through ``default`` just as they do with the stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+    # Match json.dumps: str keys for non-str dict keys, and leave datetimes and
+    # dataclasses to ``default`` rather than orjson's own encodings
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    HAVE_ORJSON = False
+
+# Any integer wider than 64 bits has at least 20 digits
+_LONG_DIGIT_RUN = re.compile(r"\d{20}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"\d{20}")
+
+
+def json_dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """
+    Serializes obj to a JSON string.
+
+    Args:
+        obj: The value to serialize
+        default: Called for objects JSON cannot encode natively
+
+    Returns:
+        The JSON document as a str
+    """
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson rejects integers beyond 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parses a JSON document from str or bytes.
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        The decoded value
+    """
+    if HAVE_ORJSON:
+        pattern = _LONG_DIGIT_RUN_BYTES if isinstance(data, bytes) else _LONG_DIGIT_RUN
+        # orjson decodes integers beyond 64 bits as lossy floats
+        if not pattern.search(data):
+            return orjson.loads(data)
+    return json.loads(data)
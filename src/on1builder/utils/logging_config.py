@@ -4,13 +4,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import sys
+from logging.handlers import RotatingFileHandler
 
 import dotenv
 
+from on1builder.utils.json_utils import json_dumps
 from on1builder.utils.path_helpers import get_base_dir
 
 # Use colorlog if available for richer console output
@@ -21,6 +22,10 @@ try:
 except ImportError:
     HAVE_COLORLOG = False
 
+# Rotate the application log so long-running bots cannot fill the disk
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
 _loggers: dict[str, logging.Logger] = {}
 _logging_initialized = False
 dotenv.load_dotenv()
@@ -57,10 +62,19 @@ class JsonFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Add extra context if available
-        if hasattr(record, "extra_data"):
-            log_entry.update(record.extra_data)
+        extra_data = getattr(record, "extra_data", None)
+        if extra_data:
+            log_entry.update(extra_data)
+
+        # default=str keeps odd extra values from raising
+        return json_dumps(log_entry, default=str)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+
+def _close_handlers(logger: logging.Logger) -> None:
+    """Detach and close every handler so reconfiguration releases open files."""
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
 
 def setup_logging(force_setup: bool = False) -> None:
@@ -97,9 +111,8 @@ def setup_logging(force_setup: bool = False) -> None:
     root_logger = logging.getLogger("on1builder")
     root_logger.setLevel(getattr(logging, log_level, logging.INFO))
 
-    # Clear any existing handlers to prevent duplicate logging
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
+    # Drop existing handlers to prevent duplicate logging and leaked file handles
+    _close_handlers(root_logger)
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -127,13 +140,21 @@ def setup_logging(force_setup: bool = False) -> None:
     root_logger.addHandler(console_handler)
 
     # File Handler (only if not in test environment)
-    if not os.environ.get("PYTEST_CURRENT_TEST"):
+    if not os.environ.get("PYTEST_CURRENT_TEST") and _file_logging_enabled():
         try:
             log_dir = get_base_dir() / "logs"
             log_dir.mkdir(exist_ok=True)
             log_file = log_dir / "on1builder.log"
 
-            file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
+            # delay=True defers opening the file until the first record is emitted
+            file_handler = RotatingFileHandler(
+                log_file,
+                mode="a",
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True,
+            )
             file_formatter = logging.Formatter(
                 "%(asctime)s [%(name)s:%(levelname)s] - %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
@@ -167,6 +188,11 @@ def setup_logging(force_setup: bool = False) -> None:
         )
 
 
+def _file_logging_enabled() -> bool:
+    """Return False when ON1_LOG_TO_FILE disables the log file (e.g. under test)."""
+    return os.environ.get("ON1_LOG_TO_FILE", "1").lower() not in ("0", "false", "no")
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Retrieves a logger instance. It will be a child of the root 'on1builder' logger.
@@ -189,9 +215,7 @@ def reset_logging() -> None:
     _loggers.clear()
 
     # Clear all handlers from the root logger
-    root_logger = logging.getLogger("on1builder")
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    _close_handlers(logging.getLogger("on1builder"))
 
 
 # Initialize logging as soon as this module is imported (unless in test mode)
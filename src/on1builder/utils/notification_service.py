@@ -7,18 +7,25 @@ from __future__ import annotations
 import asyncio
 import json
 import smtplib
+import threading
+import time
+from collections.abc import Callable
 from email.mime.text import MIMEText
 from typing import Any
 
 import aiohttp
+from cachetools import TTLCache
 
 from on1builder.config.loaders import get_settings
 from on1builder.config.settings import NotificationSettings
+from on1builder.utils.json_utils import json_dumps, json_loads
 from on1builder.utils.logging_config import get_logger
 from on1builder.utils.singleton import SingletonMeta
 
 logger = get_logger(__name__)
 
+_LEVEL_VALUES = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
+
 
 def _coerce_notification_settings(raw: Any) -> NotificationSettings:
     """Normalize arbitrary settings input into a ``NotificationSettings`` instance."""
@@ -39,17 +46,48 @@ def _coerce_notification_settings(raw: Any) -> NotificationSettings:
 class NotificationService(metaclass=SingletonMeta):
     """Manages sending notifications through various configured channels."""
 
+    # Reconnect after this many messages to stay under provider per-session caps
+    SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+    # Alerts waiting for background delivery; newer alerts are dropped when full
+    ALERT_QUEUE_SIZE = 1000
+    # How long close() waits for queued alerts to go out before giving up
+    ALERT_DRAIN_TIMEOUT_SECONDS = 5.0
+    # Identical alerts inside this window are collapsed into one delivery;
+    # suppressed counts are reported in a summary once the window has passed
+    ALERT_DEDUP_WINDOW_SECONDS = 5.0
+    MAX_DEDUP_ENTRIES = 1000
+    # Webhook statuses worth retrying (timeouts, throttling, upstream errors)
+    RETRYABLE_WEBHOOK_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+    WEBHOOK_MAX_ATTEMPTS = 3
+    WEBHOOK_RETRY_BASE_DELAY = 0.2
+    # Upper bound on a server-requested Retry-After wait
+    WEBHOOK_MAX_RETRY_AFTER = 30.0
+
     def __init__(self, settings_override: Any | None = None):
         self._session: aiohttp.ClientSession | None = None
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_lock = threading.Lock()
+        self._smtp_messages_sent = 0
         self._config: NotificationSettings | None = None
         self._configured_channels: list[str] = []
+        self._dispatchers: list[Callable] = []
         self._min_level_value = self._level_to_int("ERROR")
         self._config_loaded = False
+        self._alert_queue: asyncio.Queue | None = None
+        self._alert_worker: asyncio.Task | None = None
+        self._dropped_alert_count = 0
+        # (level, title, message) -> [last delivery time, duplicates suppressed
+        # since, latest details]
+        self._recent_alerts: TTLCache = TTLCache(
+            maxsize=self.MAX_DEDUP_ENTRIES, ttl=self.ALERT_DEDUP_WINDOW_SECONDS * 12
+        )
+        self._dedup_flush_task: asyncio.Task | None = None
 
         if settings_override is not None:
             try:
                 self._config = _coerce_notification_settings(settings_override)
                 self._configured_channels = list(self._config.channels or [])
+                self._dispatchers = self._build_dispatchers()
                 self._min_level_value = self._level_to_int(self._config.min_level)
                 self._config_loaded = True
                 logger.debug(
@@ -97,6 +135,7 @@ class NotificationService(metaclass=SingletonMeta):
                 if isinstance(ch, str) and ch.strip()
             ]
             self._min_level_value = self._level_to_int(self._config.min_level)
+            self._dispatchers = self._build_dispatchers()
             if self._configured_channels:
                 logger.info(
                     "NotificationService configured. Active channels: %s",
@@ -109,23 +148,49 @@ class NotificationService(metaclass=SingletonMeta):
             logger.debug("NotificationService configuration unavailable: %s", exc)
             self._config = NotificationSettings()
             self._configured_channels = []
+            self._dispatchers = []
             self._min_level_value = self._level_to_int("ERROR")
 
         return bool(self._configured_channels)
 
+    def _build_dispatchers(self) -> list[Callable]:
+        """Resolves configured channels to their send methods once per configuration."""
+        config = self._config
+        dispatchers: list[Callable] = []
+        for channel in self._configured_channels:
+            if channel == "slack" and config.slack_webhook_url:
+                dispatchers.append(self._send_slack)
+            elif channel == "discord" and config.discord_webhook_url:
+                dispatchers.append(self._send_discord)
+            elif (
+                channel == "telegram"
+                and config.telegram_bot_token
+                and config.telegram_chat_id
+            ):
+                dispatchers.append(self._send_telegram)
+            elif channel == "email" and config.smtp_server and config.alert_email:
+                dispatchers.append(self._send_email)
+        return dispatchers
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Lazily creates and returns an aiohttp ClientSession."""
         if self._session is None or self._session.closed:
+            config = self._config or NotificationSettings()
+            connector = aiohttp.TCPConnector(
+                limit=config.pool_size,
+                limit_per_host=config.pool_per_host,
+                ttl_dns_cache=300,
+            )
             self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+                json_serialize=json_dumps,
             )
         return self._session
 
     def _level_to_int(self, level: str) -> int:
         """Converts a log level string to an integer for comparison."""
-        return {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}.get(
-            level.upper(), 1
-        )
+        return _LEVEL_VALUES.get(level.upper(), 1)
 
     def _should_send(self, level: str) -> bool:
         """Determines if a message of a given level should be sent."""
@@ -143,6 +208,11 @@ class NotificationService(metaclass=SingletonMeta):
         """
         Sends a notification if its level is at or above the configured minimum.
 
+        Repeats of the same level, title and message within
+        ALERT_DEDUP_WINDOW_SECONDS are suppressed and later reported as one
+        summary. ``details`` is not part of that identity, since it usually
+        carries per-event values; the summary uses the latest details seen.
+
         Args:
             title: The main title of the alert.
             message: The detailed message body.
@@ -160,29 +230,105 @@ class NotificationService(metaclass=SingletonMeta):
         if not self._should_send(level):
             return
 
-        logger.debug(f"Sending alert (Level: {level}): {title} - {message}")
-        tasks = []
-        for channel in self._configured_channels:
-            if channel == "slack" and self._config.slack_webhook_url:
-                tasks.append(self._send_slack(title, message, level, details))
-            elif channel == "discord" and self._config.discord_webhook_url:
-                tasks.append(self._send_discord(title, message, level, details))
-            elif (
-                channel == "telegram"
-                and self._config.telegram_bot_token
-                and self._config.telegram_chat_id
-            ):
-                tasks.append(self._send_telegram(title, message, level, details))
-            elif (
-                channel == "email"
-                and self._config.smtp_server
-                and self._config.alert_email
+        key = (level.upper(), title, message)
+        now = time.monotonic()
+        recent = self._recent_alerts.get(key)
+        if recent is not None:
+            if now - recent[0] < self.ALERT_DEDUP_WINDOW_SECONDS:
+                recent[1] += 1
+                recent[2] = details
+                if self._dedup_flush_task is None or self._dedup_flush_task.done():
+                    self._dedup_flush_task = asyncio.create_task(
+                        self._flush_suppressed_loop()
+                    )
+                return
+            if recent[1]:
+                message = f"{message} (x{recent[1] + 1} since last alert)"
+        self._recent_alerts[key] = [now, 0, details]
+
+        logger.debug("Sending alert (Level: %s): %s - %s", level, title, message)
+        tasks = [send(title, message, level, details) for send in self._dispatchers]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def queue_alert(
+        self,
+        title: str,
+        message: str,
+        level: str = "ERROR",
+        details: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Queues an alert for background delivery without waiting on any channel.
+
+        Must be called from a running event loop. Returns False when the alert
+        was filtered out or the queue is full.
+        """
+        if not self._load_configuration() or not self._should_send(level):
+            return False
+
+        if self._alert_queue is None:
+            self._alert_queue = asyncio.Queue(maxsize=self.ALERT_QUEUE_SIZE)
+        if self._alert_worker is None or self._alert_worker.done():
+            self._alert_worker = asyncio.create_task(self._drain_alerts())
+
+        try:
+            self._alert_queue.put_nowait((title, message, level, details))
+        except asyncio.QueueFull:
+            self._dropped_alert_count += 1
+            logger.warning("Alert queue full; dropping alert %s (%s)", title, level)
+            return False
+        return True
+
+    async def _drain_alerts(self) -> None:
+        """Delivers queued alerts one at a time until cancelled."""
+        while True:
+            title, message, level, details = await self._alert_queue.get()
+            try:
+                await self.send_alert(title, message, level, details)
+            except Exception as e:
+                logger.error(f"Error delivering queued alert: {e}", exc_info=True)
+            finally:
+                self._alert_queue.task_done()
+
+    async def _flush_suppressed_alerts(self, force: bool = False) -> None:
+        """
+        Sends one summary per alert whose duplicates were suppressed.
+
+        Args:
+            force: Flush every pending count, even if its window is still open.
+        """
+        now = time.monotonic()
+        summaries = []
+        for key, (sent_at, suppressed, details) in list(self._recent_alerts.items()):
+            if suppressed and (
+                force or now - sent_at >= self.ALERT_DEDUP_WINDOW_SECONDS
             ):
-                tasks.append(self._send_email(title, message, level, details))
+                self._recent_alerts[key] = [now, 0, details]
+                summaries.append((key, suppressed, details))
 
+        tasks = [
+            send(
+                title,
+                f"{message} (duplicates suppressed: {suppressed})",
+                level,
+                details,
+            )
+            for (level, title, message), suppressed, details in summaries
+            for send in self._dispatchers
+        ]
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def _flush_suppressed_loop(self) -> None:
+        """Flushes suppressed-duplicate summaries until none are pending."""
+        while any(entry[1] for entry in list(self._recent_alerts.values())):
+            await asyncio.sleep(self.ALERT_DEDUP_WINDOW_SECONDS)
+            try:
+                await self._flush_suppressed_alerts()
+            except Exception as e:
+                logger.error(f"Error flushing suppressed alerts: {e}", exc_info=True)
+
     def _format_details(self, details: dict[str, Any] | None) -> str:
         """Formats the details dictionary into a string for message bodies."""
         if not details:
@@ -194,6 +340,64 @@ class NotificationService(metaclass=SingletonMeta):
             ]
         )
 
+    async def _post_webhook(
+        self, channel: str, url: str, payload: dict[str, Any]
+    ) -> bool:
+        """
+        Posts a webhook payload, retrying transient statuses and connection
+        errors with backoff, or after the wait a rate-limited response asks for.
+        """
+        try:
+            session = await self._get_session()
+        except Exception as e:
+            logger.error(f"Error sending {channel} notification: {e}", exc_info=True)
+            return False
+
+        for attempt in range(self.WEBHOOK_MAX_ATTEMPTS):
+            last_attempt = attempt + 1 == self.WEBHOOK_MAX_ATTEMPTS
+            delay = self.WEBHOOK_RETRY_BASE_DELAY * 2**attempt
+            try:
+                async with session.post(url, json=payload) as response:
+                    if response.ok:
+                        return True
+                    retryable = response.status in self.RETRYABLE_WEBHOOK_STATUSES
+                    if not retryable or last_attempt:
+                        logger.error(
+                            f"{channel} notification failed: {response.status} {await response.text()}"
+                        )
+                        return False
+                    if response.status == 429:
+                        retry_after = await self._retry_after_seconds(response)
+                        if retry_after is not None:
+                            delay = min(retry_after, self.WEBHOOK_MAX_RETRY_AFTER)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    logger.error(f"Error sending {channel} notification: {e}")
+                    return False
+            except Exception as e:
+                logger.error(
+                    f"Error sending {channel} notification: {e}", exc_info=True
+                )
+                return False
+            await asyncio.sleep(delay)
+        return False
+
+    @staticmethod
+    async def _retry_after_seconds(response: Any) -> float | None:
+        """Reads the wait a 429 asks for from Retry-After or Telegram's body."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            # Telegram reports it as {"parameters": {"retry_after": N}}
+            try:
+                value = json_loads(await response.text())["parameters"]["retry_after"]
+            except (ValueError, KeyError, TypeError):
+                return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            # HTTP-date form; fall back to the regular backoff
+            return None
+
     async def _send_slack(
         self, title: str, message: str, level: str, details: dict[str, Any] | None
     ):
@@ -239,17 +443,7 @@ class NotificationService(metaclass=SingletonMeta):
         payload["attachments"][0]["blocks"] = [
             b for b in payload["attachments"][0]["blocks"] if b is not None
         ]
-        try:
-            session = await self._get_session()
-            async with session.post(
-                self._config.slack_webhook_url, json=payload
-            ) as response:
-                if not response.ok:
-                    logger.error(
-                        f"Slack notification failed: {response.status} {await response.text()}"
-                    )
-        except Exception as e:
-            logger.error(f"Error sending Slack notification: {e}", exc_info=True)
+        await self._post_webhook("Slack", self._config.slack_webhook_url, payload)
 
     async def _send_discord(
         self, title: str, message: str, level: str, details: dict[str, Any] | None
@@ -282,17 +476,7 @@ class NotificationService(metaclass=SingletonMeta):
                 }
             ]
         }
-        try:
-            session = await self._get_session()
-            async with session.post(
-                self._config.discord_webhook_url, json=payload
-            ) as response:
-                if not response.ok:
-                    logger.error(
-                        f"Discord notification failed: {response.status} {await response.text()}"
-                    )
-        except Exception as e:
-            logger.error(f"Error sending Discord notification: {e}", exc_info=True)
+        await self._post_webhook("Discord", self._config.discord_webhook_url, payload)
 
     async def _send_telegram(
         self, title: str, message: str, level: str, details: dict[str, Any] | None
@@ -306,15 +490,7 @@ class NotificationService(metaclass=SingletonMeta):
             "text": text,
             "parse_mode": "Markdown",
         }
-        try:
-            session = await self._get_session()
-            async with session.post(url, json=payload) as response:
-                if not response.ok:
-                    logger.error(
-                        f"Telegram notification failed: {response.status} {await response.text()}"
-                    )
-        except Exception as e:
-            logger.error(f"Error sending Telegram notification: {e}", exc_info=True)
+        await self._post_webhook("Telegram", url, payload)
 
     async def _send_email(
         self, title: str, message: str, level: str, details: dict[str, Any] | None
@@ -331,11 +507,59 @@ class NotificationService(metaclass=SingletonMeta):
             logger.error(f"Error sending email notification: {e}", exc_info=True)
 
     def _send_smtp_email(self, msg):
-        """Blocking helper for sending email."""
-        with smtplib.SMTP(self._config.smtp_server, self._config.smtp_port) as server:
+        """Blocking helper for sending email over a reused SMTP connection."""
+        with self._smtp_lock:
+            server = self._get_smtp_connection()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped an idle connection; retry once on a fresh one
+                self._close_smtp()
+                server = self._get_smtp_connection()
+                server.send_message(msg)
+            self._smtp_messages_sent += 1
+
+    def _get_smtp_connection(self) -> smtplib.SMTP:
+        """Returns a live, authenticated SMTP connection, reconnecting if needed."""
+        if (
+            self._smtp is not None
+            and self._smtp_messages_sent >= self.SMTP_MAX_MESSAGES_PER_CONNECTION
+        ):
+            self._close_smtp()
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+
+        server = smtplib.SMTP(self._config.smtp_server, self._config.smtp_port)
+        try:
             server.starttls()
             server.login(self._config.smtp_username, self._config.smtp_password)
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._smtp_messages_sent = 0
+        return server
+
+    def _close_smtp(self) -> None:
+        """Quits the cached SMTP connection, ignoring errors from dead sockets."""
+        server, self._smtp = self._smtp, None
+        self._smtp_messages_sent = 0
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _shutdown_smtp(self) -> None:
+        """Closes the cached SMTP connection once any in-flight send completes."""
+        with self._smtp_lock:
+            self._close_smtp()
 
     async def __aenter__(self) -> NotificationService:
         return self
@@ -344,11 +568,42 @@ class NotificationService(metaclass=SingletonMeta):
         await self.close()
 
     async def close(self) -> None:
-        """Closes the aiohttp session."""
+        """
+        Delivers queued alerts, reports suppressed duplicates, and closes the
+        aiohttp session and SMTP connection.
+        """
+        if self._alert_queue is not None:
+            if self._alert_worker is not None and not self._alert_worker.done():
+                try:
+                    await asyncio.wait_for(
+                        self._alert_queue.join(),
+                        timeout=self.ALERT_DRAIN_TIMEOUT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            if not self._alert_queue.empty():
+                logger.warning(
+                    "NotificationService closing with %s queued alerts undelivered.",
+                    self._alert_queue.qsize(),
+                )
+        if self._alert_worker is not None and not self._alert_worker.done():
+            self._alert_worker.cancel()
+            await asyncio.gather(self._alert_worker, return_exceptions=True)
+        self._alert_worker = None
+        self._alert_queue = None
+        if self._dedup_flush_task is not None and not self._dedup_flush_task.done():
+            self._dedup_flush_task.cancel()
+            await asyncio.gather(self._dedup_flush_task, return_exceptions=True)
+        self._dedup_flush_task = None
+        await self._flush_suppressed_alerts(force=True)
+        self._recent_alerts.clear()
         if self._session and not self._session.closed:
             await self._session.close()
             logger.info("NotificationService session closed.")
         self._session = None
+        if self._smtp is not None:
+            await asyncio.to_thread(self._shutdown_smtp)
         self._config_loaded = False
         self._configured_channels = []
+        self._dispatchers = []
         self._config = None
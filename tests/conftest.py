@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Shared pytest fixtures for the ON1Builder test suite.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from on1builder.integrations.abi_registry import ABIRegistry
+
+
+def pytest_configure(config):
+    # Package logging defaults to INFO; under test that only costs formatting
+    # time. An explicit LOG_LEVEL in the environment still wins.
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    # Keep test runs from writing logs/on1builder.log into the checkout
+    os.environ.setdefault("ON1_LOG_TO_FILE", "0")
+
+
+@pytest.fixture(scope="session")
+def abi_registry() -> Iterator[ABIRegistry]:
+    """Real ABIRegistry loaded once per session from the bundled resources.
+
+    Parsing every ABI plus the token list is the most expensive setup step in
+    the suite, so tests share one read-only instance. Tests that need to mutate
+    registry state should build their own stub instead.
+    """
+    # Imported here so conftest loading never drags in the package for test
+    # runs that do not use the registry.
+    from on1builder.integrations.abi_registry import ABIRegistry
+
+    ABIRegistry.reset_instance()
+    registry = ABIRegistry()
+    yield registry
+    ABIRegistry.reset_instance()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Tests for the ABI registry against the bundled resource files.
+"""
+
+
+def test_loads_bundled_abis(abi_registry):
+    erc20 = abi_registry.get_abi("erc20")
+    assert erc20
+    assert abi_registry.get_abi("ERC20_ABI") is erc20
+    assert abi_registry.get_abi("does_not_exist") is None
+
+
+def test_token_lookups_roundtrip(abi_registry):
+    tokens = abi_registry.get_monitored_tokens(1)
+    assert tokens
+
+    symbol, address = next(iter(tokens.items()))
+    assert abi_registry.get_token_address(symbol.lower(), 1) == address
+    assert abi_registry.get_token_symbol(address.upper(), 1) == symbol
+    assert abi_registry.get_token_symbol_by_address(address) == symbol
+
+
+def test_token_info_by_address(abi_registry):
+    symbol, address = next(iter(abi_registry.get_monitored_tokens(1).items()))
+
+    info = abi_registry.get_token_info_by_address(address, chain_id=1)
+    assert info is not None
+    assert info["symbol"] == symbol
+    assert info["chain_id"] == 1
+    assert "decimals" in info
+
+
+def test_unknown_chain_returns_empty(abi_registry):
+    assert abi_registry.get_monitored_tokens(-1) == {}
+    assert abi_registry.get_token_address("WETH", -1) is None
+    assert abi_registry.get_token_info_by_address("0x" + "0" * 40) is None
+
+
+def test_get_monitored_tokens_served_from_memory(abi_registry, monkeypatch):
+    first = abi_registry.get_monitored_tokens(1)
+
+    def _fail_open(*_args, **_kwargs):
+        raise AssertionError("monitored tokens must not be reloaded from disk")
+
+    monkeypatch.setattr("builtins.open", _fail_open)
+
+    assert abi_registry.get_monitored_tokens(1) is first
+
+
+def test_build_token_maps_normalizes_case_and_skips_bad_chain_ids():
+    from on1builder.integrations.abi_registry import ABIRegistry
+
+    registry = ABIRegistry.__new__(ABIRegistry)
+    registry._token_map_by_symbol = {}
+    registry._token_map_by_address = {}
+    registry._token_info_by_address = {}
+    registry._tokens = [
+        {"symbol": "weth", "addresses": {"1": "0xABC", "mainnet": "0xDEF"}},
+        {"name": "No symbol", "addresses": {"1": "0x123"}},
+    ]
+
+    registry._build_token_maps()
+
+    assert registry._token_map_by_symbol == {1: {"WETH": "0xabc"}}
+    assert registry._token_map_by_address == {1: {"0xabc": "WETH"}}
+    assert registry._token_info_by_address[1]["0xabc"]["decimals"] == 18
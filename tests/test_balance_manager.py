@@ -49,7 +49,6 @@ class TestUpdateBalance:
     def manager(self, mock_web3):
         return BalanceManager(mock_web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_update_balance_first_time(self, manager, mock_web3):
         """Test initial balance update."""
         balance = await manager.update_balance()
@@ -59,7 +58,6 @@ class TestUpdateBalance:
         assert manager.balance_tier in ["large", "medium", "whale"]
         mock_web3.eth.get_balance.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_balance_caching(self, manager, mock_web3):
         """Test balance caching mechanism."""
         # First update
@@ -72,7 +70,6 @@ class TestUpdateBalance:
         # Should only call once due to caching
         mock_web3.eth.get_balance.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_balance_force(self, manager, mock_web3):
         """Test forced balance update."""
         # First update
@@ -87,7 +84,6 @@ class TestUpdateBalance:
         assert balance == Decimal("3.0")
         assert mock_web3.eth.get_balance.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_update_balance_connection_error(self, manager, mock_web3):
         """Test balance update with connection error."""
         mock_web3.eth.get_balance.side_effect = Exception("Connection lost")
@@ -95,7 +91,6 @@ class TestUpdateBalance:
         with pytest.raises(InsufficientFundsError):
             await manager.update_balance()
 
-    @pytest.mark.asyncio
     async def test_update_balance_tier_change(self, manager, mock_web3):
         """Test balance tier changes are detected."""
         # Start with high balance
@@ -164,7 +159,6 @@ class TestMaxInvestment:
         web3.eth.get_balance = AsyncMock(return_value=5000000000000000000)  # 5 ETH
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_max_investment_standard(self, manager):
         """Test max investment for standard strategy."""
         await manager.update_balance()
@@ -173,7 +167,6 @@ class TestMaxInvestment:
         # Should be less than total balance (accounting for risk ratio and gas)
         assert Decimal("0") < max_invest < Decimal("5.0")
 
-    @pytest.mark.asyncio
     async def test_max_investment_emergency_mode(self, manager):
         """Test max investment returns zero in emergency mode."""
         manager.web3.eth.get_balance.return_value = 0
@@ -182,7 +175,6 @@ class TestMaxInvestment:
         max_invest = await manager.get_max_investment_amount()
         assert max_invest == Decimal("0")
 
-    @pytest.mark.asyncio
     async def test_max_investment_flashloan_strategy(self, manager):
         """Test max investment for flashloan strategy."""
         await manager.update_balance()
@@ -192,7 +184,6 @@ class TestMaxInvestment:
         standard_invest = await manager.get_max_investment_amount("standard")
         assert max_invest < standard_invest
 
-    @pytest.mark.asyncio
     async def test_max_investment_arbitrage_strategy(self, manager):
         """Test max investment for arbitrage strategy."""
         await manager.update_balance()
@@ -210,7 +201,6 @@ class TestDynamicProfitThreshold:
         web3.eth.get_balance = AsyncMock(return_value=5000000000000000000)
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_profit_threshold_calculation(self, manager):
         """Test basic profit threshold calculation."""
         await manager.update_balance()
@@ -221,7 +211,6 @@ class TestDynamicProfitThreshold:
         # Should have some minimum threshold
         assert threshold >= Decimal("0.0001")
 
-    @pytest.mark.asyncio
     async def test_profit_threshold_scales_with_investment(self, manager):
         """Test profit threshold scales with investment amount."""
         await manager.update_balance()
@@ -250,7 +239,6 @@ class TestFlashloanLogic:
         web3.eth.get_balance = AsyncMock(return_value=1000000000000000000)  # 1 ETH
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_should_use_flashloan_low_balance(self, manager):
         """Test flashloan recommended for low balance."""
         await manager.update_balance()
@@ -264,7 +252,6 @@ class TestFlashloanLogic:
 
             assert should_use is True
 
-    @pytest.mark.asyncio
     async def test_should_not_use_flashloan_disabled(self, manager):
         """Test flashloan not used when disabled."""
         await manager.update_balance()
@@ -280,7 +267,6 @@ class TestFlashloanLogic:
         finally:
             loaders.settings.flashloan_enabled = original_enabled
 
-    @pytest.mark.asyncio
     async def test_should_use_flashloan_large_amount(self, manager):
         """Test flashloan recommended for large amounts."""
         await manager.update_balance()
@@ -304,7 +290,6 @@ class TestProfitTracking:
         web3 = AsyncMock()
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_record_profit(self, manager):
         """Test recording profit."""
         await manager.record_profit(
@@ -319,7 +304,6 @@ class TestProfitTracking:
         assert manager._profit_by_strategy.get("arbitrage") == Decimal("0.1")
         assert len(manager._profit_history) == 1
 
-    @pytest.mark.asyncio
     async def test_record_multiple_profits(self, manager):
         """Test recording multiple profits."""
         await manager.record_profit(Decimal("0.05"), "arbitrage")
@@ -330,7 +314,6 @@ class TestProfitTracking:
         assert manager._profit_by_strategy["arbitrage"] == Decimal("0.07")
         assert manager._profit_by_strategy["flashloan"] == Decimal("0.03")
 
-    @pytest.mark.asyncio
     async def test_get_profit_stats(self, manager):
         """Test getting profit statistics."""
         await manager.record_profit(Decimal("0.1"), "arbitrage")
@@ -353,7 +336,6 @@ class TestBalanceSummary:
         web3.eth.get_balance = AsyncMock(return_value=2000000000000000000)  # 2 ETH
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_get_profit_summary(self, manager):
         """Test getting comprehensive profit summary."""
         await manager.record_profit(
@@ -383,19 +365,16 @@ class TestTokenBalances:
         web3.to_checksum_address = lambda x: x
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_get_eth_balance(self, manager):
         """Test getting ETH balance."""
         balance = await manager.get_balance("ETH")
         assert balance == Decimal("1.0")
 
-    @pytest.mark.asyncio
     async def test_get_balance_none_defaults_to_eth(self, manager):
         """Test get_balance with None returns ETH."""
         balance = await manager.get_balance(None)
         assert balance == Decimal("1.0")
 
-    @pytest.mark.asyncio
     async def test_get_token_balance_by_address(self, manager):
         """Test getting token balance by address."""
         token_address = "0xA0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
@@ -410,7 +389,6 @@ class TestTokenBalances:
             assert balance == Decimal("1000.0")
             mock_get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_token_balance_by_symbol(self, manager):
         """Test getting token balance by symbol."""
         with patch.object(
@@ -432,7 +410,6 @@ class TestPerformanceMetrics:
         web3 = AsyncMock()
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_update_performance_metrics(self, manager):
         """Test performance metrics are updated."""
         await manager.record_profit(Decimal("0.1"), "arbitrage")
@@ -443,7 +420,6 @@ class TestPerformanceMetrics:
         assert metrics["total_trades"] == 2
         assert metrics["profitable_trades"] == 2
 
-    @pytest.mark.asyncio
     async def test_record_gas_cost(self, manager):
         """Test gas cost is recorded."""
         await manager.record_profit(
@@ -462,7 +438,6 @@ class TestSufficientBalance:
         web3.eth.get_balance = AsyncMock(return_value=1000000000000000000)  # 1 ETH
         return BalanceManager(web3, "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb7")
 
-    @pytest.mark.asyncio
     async def test_ensure_sufficient_balance_success(self, manager):
         """Test sufficient balance check passes."""
         with patch("on1builder.config.loaders.settings") as mock_settings:
@@ -472,7 +447,6 @@ class TestSufficientBalance:
             balance = await manager.ensure_sufficient_balance(Decimal("0.5"))
             assert balance >= Decimal("0.5")
 
-    @pytest.mark.asyncio
     async def test_ensure_sufficient_balance_failure(self, manager):
         """Test insufficient balance raises error."""
         with patch("on1builder.config.loaders.settings") as mock_settings:
@@ -482,7 +456,6 @@ class TestSufficientBalance:
             with pytest.raises(InsufficientFundsError):
                 await manager.ensure_sufficient_balance(Decimal("10.0"))
 
-    @pytest.mark.asyncio
     async def test_ensure_sufficient_balance_with_buffer(self, manager):
         """Test ensure sufficient balance with custom buffer."""
         with patch("on1builder.config.loaders.settings") as mock_settings:
@@ -1,11 +1,8 @@
 """Logic-focused tests for ChainWorker status without starting network tasks."""
 
-import pytest
-
 from on1builder.core.chain_worker import ChainWorker
 
 
-@pytest.mark.asyncio
 async def test_status_stopped_without_init():
     worker = ChainWorker.__new__(ChainWorker)
     worker.chain_id = 1
@@ -15,7 +12,6 @@ async def test_status_stopped_without_init():
     assert status["chain_id"] == 1
 
 
-@pytest.mark.asyncio
 async def test_status_running_reports_components(monkeypatch):
     worker = ChainWorker.__new__(ChainWorker)
     worker.chain_id = 1
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from eth_account import Account
 
 from on1builder.core import chain_worker as worker_module
 from on1builder.core.chain_worker import ChainWorker
@@ -22,6 +24,36 @@ class AwaitableValue:
         return _coro().__await__()
 
 
+class _FakeTxManager:
+    """Plain-coroutine stats source for the heartbeat and reporting loops."""
+
+    async def get_performance_stats(self):
+        return {
+            "success_rate_percentage": 99.0,
+            "net_profit_eth": 1.0,
+            "total_gas_spent_eth": 0.1,
+            "total_transactions": 2,
+            "successful_transactions": 2,
+            "total_profit_eth": 1.1,
+        }
+
+
+class _FakeStrategyExecutor:
+    async def get_strategy_report(self):
+        return {
+            "strategy_performance": {},
+            "execution_count": 1,
+            "recent_performance": 0.5,
+            "ml_parameters": {},
+        }
+
+
+@pytest.fixture(scope="session")
+def wallet_account():
+    """Account stub matching the configured wallet; no key derivation needed."""
+    return SimpleNamespace(address="0xabc")
+
+
 @pytest.fixture
 def stub_settings(monkeypatch):
     settings = SimpleNamespace(
@@ -39,10 +71,11 @@ def stub_settings(monkeypatch):
     return settings
 
 
-@pytest.mark.asyncio
-async def test_initialize_success_and_failure(monkeypatch, stub_settings):
+async def test_initialize_success_and_failure(
+    monkeypatch, stub_settings, wallet_account
+):
     worker = ChainWorker(1)
-    web3 = MagicMock()
+    web3 = Mock()
     web3.eth.gas_price = AwaitableValue(50)
     web3.to_wei = lambda value, unit: value * 10**9
     monkeypatch.setattr(
@@ -50,11 +83,9 @@ async def test_initialize_success_and_failure(monkeypatch, stub_settings):
         "create_connection",
         AsyncMock(return_value=web3),
     )
-    monkeypatch.setattr(
-        "eth_account.Account.from_key", lambda key: SimpleNamespace(address="0xabc")
-    )
+    monkeypatch.setattr(Account, "from_key", Mock(return_value=wallet_account))
 
-    balance_manager = MagicMock(
+    balance_manager = Mock(
         update_balance=AsyncMock(),
         get_balance_summary=AsyncMock(
             return_value={
@@ -64,40 +95,39 @@ async def test_initialize_success_and_failure(monkeypatch, stub_settings):
             }
         ),
     )
-    tx_manager = MagicMock(initialize=AsyncMock())
+    tx_manager = Mock(initialize=AsyncMock())
     monkeypatch.setattr(
         worker_module, "BalanceManager", lambda *_args, **_kwargs: balance_manager
     )
-    monkeypatch.setattr(worker_module, "MarketDataFeed", lambda web3: MagicMock())
-    monkeypatch.setattr(worker_module, "SafetyGuard", lambda web3: MagicMock())
-    monkeypatch.setattr(
-        worker_module, "NonceManager", lambda web3, address: MagicMock()
-    )
+    monkeypatch.setattr(worker_module, "MarketDataFeed", lambda web3: Mock())
+    monkeypatch.setattr(worker_module, "SafetyGuard", lambda web3: Mock())
+    monkeypatch.setattr(worker_module, "NonceManager", lambda web3, address: Mock())
     monkeypatch.setattr(
         worker_module, "TransactionManager", lambda **kwargs: tx_manager
     )
-    monkeypatch.setattr(worker_module, "StrategyExecutor", lambda **kwargs: MagicMock())
-    monkeypatch.setattr(worker_module, "TxPoolScanner", lambda **kwargs: MagicMock())
-    worker._memory_optimizer = MagicMock(register_cleanup_callback=MagicMock())
+    monkeypatch.setattr(worker_module, "StrategyExecutor", lambda **kwargs: Mock())
+    monkeypatch.setattr(worker_module, "TxPoolScanner", lambda **kwargs: Mock())
+    worker._memory_optimizer = Mock(register_cleanup_callback=Mock())
 
     await worker.initialize()
     assert worker.web3 is web3
+    assert worker.account is wallet_account
+    Account.from_key.assert_called_once_with("key1")
     tx_manager.initialize.assert_awaited_once()
 
     monkeypatch.setattr(
-        "eth_account.Account.from_key", lambda key: SimpleNamespace(address="0xdef")
+        Account, "from_key", Mock(return_value=SimpleNamespace(address="0xdef"))
     )
     with pytest.raises(InitializationError):
         await ChainWorker(1).initialize()
 
 
-@pytest.mark.asyncio
 async def test_start_stop_and_startup_test_transaction(monkeypatch, stub_settings):
     worker = ChainWorker.__new__(ChainWorker)
     worker.chain_id = 1
     worker.is_running = False
-    worker._tasks = []
-    worker.web3 = MagicMock(to_wei=lambda value, unit: value * 10**9)
+    worker._tasks = set()
+    worker.web3 = Mock(to_wei=lambda value, unit: value * 10**9)
     worker.web3.eth = SimpleNamespace(gas_price=AwaitableValue(200 * 10**9))
     worker.account = SimpleNamespace(address="0xabc")
     worker.market_feed = SimpleNamespace(start=AsyncMock(), stop=AsyncMock())
@@ -106,13 +136,14 @@ async def test_start_stop_and_startup_test_transaction(monkeypatch, stub_setting
         stop=AsyncMock(),
         get_cache_stats=lambda: {"tx_analysis_cache_size": 0},
     )
-    worker.balance_manager = MagicMock()
+    worker.balance_manager = Mock()
     worker.tx_manager = SimpleNamespace(
         _simulate_transaction=AsyncMock(),
         execute_and_confirm=AsyncMock(return_value={"success": False}),
         get_performance_stats=AsyncMock(
             return_value={"success_rate_percentage": 100, "net_profit_eth": 1}
         ),
+        close=AsyncMock(),
     )
     worker.strategy_executor = SimpleNamespace(
         get_strategy_report=AsyncMock(return_value={"strategy_performance": {}})
@@ -120,7 +151,7 @@ async def test_start_stop_and_startup_test_transaction(monkeypatch, stub_setting
     worker.nonce_manager = SimpleNamespace(
         get_next_nonce=AsyncMock(return_value=3), resync_nonce=AsyncMock()
     )
-    worker._memory_optimizer = MagicMock(
+    worker._memory_optimizer = Mock(
         get_current_metrics=lambda: SimpleNamespace(process_memory_mb=10)
     )
     worker._performance_stats = {
@@ -145,6 +176,9 @@ async def test_start_stop_and_startup_test_transaction(monkeypatch, stub_setting
         def done(self):
             return False
 
+        def add_done_callback(self, _callback):
+            pass
+
         def __await__(self):
             self.coro.close()
             if False:
@@ -166,9 +200,29 @@ async def test_start_stop_and_startup_test_transaction(monkeypatch, stub_setting
     worker.market_feed.stop.assert_awaited_once()
     worker.tx_scanner.stop.assert_awaited_once()
     worker._generate_final_report.assert_awaited_once()
+    worker.tx_manager.close.assert_awaited_once()
+
+
+async def test_start_drops_finished_tasks(stub_settings):
+    worker = ChainWorker.__new__(ChainWorker)
+    worker.chain_id = 1
+    worker.is_running = False
+    worker._tasks = set()
+    worker.web3 = worker.account = worker.balance_manager = object()
+    worker.market_feed = SimpleNamespace(start=AsyncMock())
+    worker.tx_scanner = SimpleNamespace(start=AsyncMock())
+    worker._ON1Builder_heartbeat = AsyncMock()
+    worker._balance_monitoring_loop = AsyncMock()
+    worker._performance_reporting_loop = AsyncMock()
+    worker._run_startup_test_transaction = AsyncMock()
+
+    await ChainWorker.start(worker)
+    await asyncio.sleep(0)
+
+    worker.tx_scanner.start.assert_awaited_once()
+    assert worker._tasks == set()
 
 
-@pytest.mark.asyncio
 async def test_worker_loops_cleanup_reports_and_status(monkeypatch, stub_settings):
     worker = ChainWorker.__new__(ChainWorker)
     worker.chain_id = 1
@@ -183,7 +237,7 @@ async def test_worker_loops_cleanup_reports_and_status(monkeypatch, stub_setting
         "error_count": 0,
         "opportunities_executed": 1,
     }
-    worker.balance_manager = MagicMock(
+    worker.balance_manager = Mock(
         get_balance_summary=AsyncMock(
             side_effect=[
                 {"balance": 1.0, "balance_tier": "normal", "emergency_mode": False},
@@ -194,34 +248,14 @@ async def test_worker_loops_cleanup_reports_and_status(monkeypatch, stub_setting
         update_balance=AsyncMock(),
         get_balance=AsyncMock(return_value=Decimal("1")),
     )
-    worker.tx_manager = SimpleNamespace(
-        get_performance_stats=AsyncMock(
-            return_value={
-                "success_rate_percentage": 99.0,
-                "net_profit_eth": 1.0,
-                "total_gas_spent_eth": 0.1,
-                "total_transactions": 2,
-                "successful_transactions": 2,
-                "total_profit_eth": 1.1,
-            }
-        )
-    )
-    worker.strategy_executor = SimpleNamespace(
-        get_strategy_report=AsyncMock(
-            return_value={
-                "strategy_performance": {},
-                "execution_count": 1,
-                "recent_performance": 0.5,
-                "ml_parameters": {},
-            }
-        )
-    )
+    worker.tx_manager = _FakeTxManager()
+    worker.strategy_executor = _FakeStrategyExecutor()
     worker.tx_scanner = SimpleNamespace(
         get_pending_tx_count=lambda: 1,
         get_cache_stats=lambda: {"tx_analysis_cache_size": 600},
-        _manage_cache_size=MagicMock(),
+        _manage_cache_size=Mock(),
     )
-    worker._memory_optimizer = MagicMock(
+    worker._memory_optimizer = Mock(
         get_current_metrics=lambda: SimpleNamespace(process_memory_mb=12)
     )
 
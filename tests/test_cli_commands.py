@@ -1,6 +1,7 @@
 """Tests for CLI commands: __main__, config_cmd, run_cmd."""
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -10,6 +11,21 @@ from on1builder.__main__ import app, cli, show_version
 runner = CliRunner()
 
 
+@pytest.fixture(scope="module")
+def loop_runner():
+    """One event loop reused by every CLI test that drives a coroutine."""
+    with asyncio.Runner() as async_runner:
+        yield async_runner
+
+
+@pytest.fixture
+def run_coroutine(loop_runner, monkeypatch):
+    """Route run_cmd's coroutine driver onto the shared module loop."""
+    driver = Mock(side_effect=loop_runner.run)
+    monkeypatch.setattr("on1builder.cli.run_cmd._run_coroutine", driver)
+    return driver
+
+
 class TestMainCLI:
     """Test main CLI entry point."""
 
@@ -72,18 +88,20 @@ class TestRunCommand:
     """Test run command functionality."""
 
     @patch("on1builder.cli.run_cmd.MainOrchestrator")
-    @patch("asyncio.run")
-    def test_start_bot_success(self, mock_asyncio_run, mock_orchestrator):
+    def test_start_bot_success(self, mock_orchestrator, run_coroutine):
         """Test successful bot start."""
         mock_orch_instance = Mock()
+        mock_orch_instance.run = AsyncMock()
         mock_orchestrator.return_value = mock_orch_instance
 
-        runner.invoke(app, ["run", "start"])
+        result = runner.invoke(app, ["run", "start"])
 
+        assert result.exit_code == 0
         # Orchestrator should be instantiated
         mock_orchestrator.assert_called_once()
-        # Run should be called
-        mock_asyncio_run.assert_called_once()
+        # Run should be awaited on the shared loop
+        run_coroutine.assert_called_once()
+        mock_orch_instance.run.assert_awaited_once()
 
     @patch("on1builder.cli.run_cmd.MainOrchestrator")
     def test_start_bot_initialization_error(self, mock_orchestrator):
@@ -132,11 +150,10 @@ class TestRunCmdModule:
     """Test run_cmd module functions directly."""
 
     @patch("on1builder.cli.run_cmd.MainOrchestrator")
-    @patch("asyncio.run")
-    def test_start_bot_function(self, mock_asyncio_run, mock_orchestrator):
+    def test_start_bot_function(self, mock_orchestrator, run_coroutine):
         """Test start_bot function directly."""
         mock_orch_instance = Mock()
-        mock_orch_instance.run = Mock()
+        mock_orch_instance.run = AsyncMock()
         mock_orchestrator.return_value = mock_orch_instance
 
         from on1builder.cli.run_cmd import start_bot
@@ -144,4 +161,5 @@ class TestRunCmdModule:
         start_bot()
 
         mock_orchestrator.assert_called_once()
-        mock_asyncio_run.assert_called_once()
+        run_coroutine.assert_called_once()
+        mock_orch_instance.run.assert_awaited_once()
@@ -1,30 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from on1builder.config.settings import DatabaseSettings
 from on1builder.persistence import db_interface as db_module
 from on1builder.persistence.db_interface import DatabaseInterface
+from on1builder.persistence.db_models import Base, Transaction
 
+# Named in-memory database shared by every connection of the module engine, so
+# the schema is created once and each test only pays for a SAVEPOINT.
+SHARED_DB_URL = (
+    "sqlite+aiosqlite:///file:on1builder_db_tests?mode=memory&cache=shared&uri=true"
+)
 
-@pytest.mark.asyncio
-async def test_database_interface_roundtrip(monkeypatch, tmp_path):
-    DatabaseInterface.reset_instance()
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+TX_HASH = "0x" + "1" * 64
+
+
+class _StubSession:
+    """Minimal AsyncSession stand-in covering what DatabaseInterface calls."""
+
+    def __init__(self):
+        self.add = MagicMock()
+        self.refresh = AsyncMock()
+        self.execute = AsyncMock()
+
+    def begin(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def db_engine():
+    engine = create_async_engine(SHARED_DB_URL, poolclass=AsyncAdaptedQueuePool)
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT nesting; let
+    # SQLAlchemy emit it so the per-test rollback covers every write.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, _record):
+        dbapi_connection.isolation_level = None
 
-    db_path = tmp_path / "test.db"
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # A shared-cache memory database only lives while a connection is open; pin
+    # one for the module so pool recycling can never drop the schema.
+    async with engine.connect():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db_interface(db_engine, monkeypatch):
+    """DatabaseInterface whose writes are rolled back after each test."""
+    DatabaseInterface.reset_instance()
     stub_settings = SimpleNamespace(
-        database=DatabaseSettings(url=f"sqlite+aiosqlite:///{db_path}"),
+        database=DatabaseSettings(url="sqlite+aiosqlite://"),
         debug=False,
     )
-
     monkeypatch.setattr(db_module, "settings", stub_settings)
 
-    interface = DatabaseInterface()
-    await interface.initialize_db()
+    async with db_engine.connect() as conn:
+        outer = await conn.begin()
+        interface = DatabaseInterface()
+        # Swap in the shared engine, releasing the one built at construction
+        await interface._engine.dispose()
+        interface._engine = db_engine
+        interface._session_factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        interface._initialized = True
+        yield interface
+        await outer.rollback()
+
+    DatabaseInterface.reset_instance()
+
+
+async def test_database_interface_roundtrip(db_interface):
+    interface = db_interface
 
-    tx_hash = "0x" + "1" * 64
     tx_payload = {
-        "tx_hash": tx_hash,
+        "tx_hash": TX_HASH,
         "chain_id": 1,
         "from_address": "0x" + "2" * 40,
         "to_address": "0x" + "3" * 40,
@@ -39,15 +113,15 @@ async def test_database_interface_roundtrip(monkeypatch, tmp_path):
     saved_tx = await interface.save_transaction(tx_payload)
     assert saved_tx is not None
 
-    fetched = await interface.get_transaction_by_hash(tx_hash)
+    fetched = await interface.get_transaction_by_hash(TX_HASH)
     assert fetched is not None
-    assert fetched.tx_hash == tx_hash
+    assert fetched.tx_hash == TX_HASH
 
     recent = await interface.get_recent_transactions(chain_id=1, limit=5)
-    assert recent and recent[0].tx_hash == tx_hash
+    assert recent and recent[0].tx_hash == TX_HASH
 
     profit_payload = {
-        "tx_hash": tx_hash,
+        "tx_hash": TX_HASH,
         "chain_id": 1,
         "profit_amount_eth": 0.5,
         "profit_amount_usd": 1000.0,
@@ -61,8 +135,8 @@ async def test_database_interface_roundtrip(monkeypatch, tmp_path):
     assert saved_profit is not None
 
     summary = await interface.get_profit_summary()
-    assert summary["trade_count"] >= 1
-    assert summary["total_profit_eth"] >= 0.5
+    assert summary["trade_count"] == 1
+    assert summary["total_profit_eth"] == pytest.approx(0.5)
 
     price_payload = {
         "chain_id": 1,
@@ -77,5 +151,177 @@ async def test_database_interface_roundtrip(monkeypatch, tmp_path):
     assert latest_price is not None
     assert latest_price.symbol == "ETH"
 
-    await interface.close()
+
+async def test_writes_are_rolled_back_between_tests(db_interface):
+    assert await db_interface.get_transaction_by_hash(TX_HASH) is None
+    assert await db_interface.get_recent_transactions(chain_id=1) == []
+
+    summary = await db_interface.get_profit_summary()
+    assert summary["trade_count"] == 0
+
+
+async def test_health_check_uses_shared_database(db_interface):
+    assert await db_interface.health_check() is True
+
+
+@pytest.fixture
+def mock_session(db_interface):
+    """Stub session wired in as the interface's session factory."""
+    session = _StubSession()
+    db_interface._session_factory = MagicMock(return_value=session)
+    return session
+
+
+async def test_save_transaction_adds_and_refreshes(db_interface, mock_session):
+    saved = await db_interface.save_transaction(
+        {"tx_hash": TX_HASH, "chain_id": 1, "from_address": "0x" + "2" * 40}
+    )
+
+    assert isinstance(saved, Transaction)
+    mock_session.add.assert_called_once_with(saved)
+    mock_session.refresh.assert_awaited_once_with(saved)
+
+
+async def test_save_transaction_returns_none_on_failure(db_interface, mock_session):
+    mock_session.add.side_effect = RuntimeError("disk full")
+
+    saved = await db_interface.save_transaction({"tx_hash": TX_HASH}, retries=0)
+
+    assert saved is None
+    mock_session.refresh.assert_not_awaited()
+
+
+async def test_save_profit_record_returns_none_on_failure(db_interface, mock_session):
+    mock_session.refresh.side_effect = RuntimeError("connection lost")
+
+    saved = await db_interface.save_profit_record({"tx_hash": TX_HASH}, retries=0)
+
+    assert saved is None
+    mock_session.add.assert_called_once()
+
+
+async def test_get_transaction_by_hash_queries_session(db_interface, mock_session):
+    expected = Transaction(tx_hash=TX_HASH)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = expected
+    mock_session.execute.return_value = result
+
+    assert await db_interface.get_transaction_by_hash(TX_HASH) is expected
+    mock_session.execute.assert_awaited_once()
+
+
+async def test_get_profit_summary_without_rows(db_interface, mock_session):
+    result = MagicMock()
+    result.one_or_none.return_value = None
+    mock_session.execute.return_value = result
+
+    summary = await db_interface.get_profit_summary(chain_id=1)
+
+    assert summary == {
+        "total_profit_eth": 0.0,
+        "total_profit_usd": 0.0,
+        "trade_count": 0,
+    }
+
+
+async def test_get_profit_summary_uses_single_aggregate_query(
+    db_interface, mock_session
+):
+    result = MagicMock()
+    result.one_or_none.return_value = SimpleNamespace(
+        total_profit_eth=1.5, total_profit_usd=3000.0, trade_count=3
+    )
+    mock_session.execute.return_value = result
+
+    summary = await db_interface.get_profit_summary()
+
+    assert summary == {
+        "total_profit_eth": 1.5,
+        "total_profit_usd": 3000.0,
+        "trade_count": 3,
+    }
+    mock_session.execute.assert_awaited_once()
+
+
+async def test_concurrent_construction_builds_one_engine(monkeypatch):
+    DatabaseInterface.reset_instance()
+    stub_settings = SimpleNamespace(
+        database=DatabaseSettings(url="sqlite+aiosqlite://"), debug=False
+    )
+    monkeypatch.setattr(db_module, "settings", stub_settings)
+    engine_factory = MagicMock(wraps=create_async_engine)
+    monkeypatch.setattr(db_module, "create_async_engine", engine_factory)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: DatabaseInterface(), range(32)))
+
+        assert all(instance is instances[0] for instance in instances)
+        engine_factory.assert_called_once()
+    finally:
+        DatabaseInterface.reset_instance()
+
+
+async def test_raw_tx_text_is_stored_verbatim(db_interface):
+    raw_tx = '{"foo": "bar"}'
+
+    saved = await db_interface.save_transaction(
+        {
+            "tx_hash": TX_HASH,
+            "chain_id": 1,
+            "from_address": "0x" + "2" * 40,
+            "value": 0,
+            "raw_tx": raw_tx,
+        }
+    )
+
+    assert saved is not None
+    fetched = await db_interface.get_transaction_by_hash(TX_HASH)
+    assert fetched.raw_tx == raw_tx
+
+
+async def test_save_transactions_bulk_inserts_rows(db_interface):
+    rows = [
+        {
+            "tx_hash": f"0x{index:064x}",
+            "chain_id": 1,
+            "from_address": "0x" + "2" * 40,
+            "value": index,
+            "strategy": "arbitrage",
+        }
+        for index in range(1, 1001)
+    ]
+
+    assert await db_interface.save_transactions(rows) == len(rows)
+
+    recent = await db_interface.get_recent_transactions(chain_id=1, limit=len(rows))
+    assert {tx.tx_hash for tx in recent} == {row["tx_hash"] for row in rows}
+    assert all(tx.timestamp is not None for tx in recent)
+
+
+async def test_save_transactions_failure_returns_zero(db_interface, mock_session):
+    mock_session.execute.side_effect = RuntimeError("locked")
+
+    assert await db_interface.save_transactions([{"tx_hash": TX_HASH}], retries=0) == 0
+    assert await db_interface.save_transactions([]) == 0
+
+
+async def test_file_database_connections_use_wal(monkeypatch, tmp_path):
     DatabaseInterface.reset_instance()
+    stub_settings = SimpleNamespace(
+        database=DatabaseSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}"),
+        debug=False,
+    )
+    monkeypatch.setattr(db_module, "settings", stub_settings)
+
+    interface = DatabaseInterface()
+    try:
+        await interface.initialize_db()
+        async with interface._engine.connect() as conn:
+            journal_mode = await conn.exec_driver_sql("PRAGMA journal_mode")
+            synchronous = await conn.exec_driver_sql("PRAGMA synchronous")
+            assert journal_mode.scalar() == "wal"
+            assert synchronous.scalar() == 1  # NORMAL
+    finally:
+        await interface.close()
+        DatabaseInterface.reset_instance()
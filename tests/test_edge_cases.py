@@ -67,14 +67,12 @@ class TestBalanceManagerEdgeCases:
         assert manager._determine_balance_tier(Decimal("10000")) == "whale"
         assert manager._determine_balance_tier(Decimal("999999")) == "whale"
 
-    @pytest.mark.asyncio
     async def test_zero_balance_update(self, manager, mock_web3):
         """Updating balance when wallet has zero ETH should return zero."""
         mock_web3.eth.get_balance.return_value = 0
         balance = await manager.update_balance(force=True)
         assert balance == Decimal("0")
 
-    @pytest.mark.asyncio
     async def test_profit_tracking_negative_value(self, manager):
         """Recording a negative profit (loss) should not be tracked (below threshold)."""
         await manager.record_profit(Decimal("-0.01"), "arbitrage")
@@ -82,14 +80,12 @@ class TestBalanceManagerEdgeCases:
         # Negative profit is below MIN_PROFIT_THRESHOLD so it's not tracked
         assert stats["total_trades"] == 0
 
-    @pytest.mark.asyncio
     async def test_profit_tracking_zero_value(self, manager):
         """Recording zero profit should not be tracked (below threshold)."""
         await manager.record_profit(Decimal("0"), "arbitrage")
         stats = manager.get_profit_stats()
         assert stats["total_trades"] == 0
 
-    @pytest.mark.asyncio
     async def test_profit_tracking_above_threshold(self, manager):
         """Recording profit above threshold should be tracked."""
         await manager.record_profit(Decimal("0.01"), "arbitrage")
@@ -97,14 +93,12 @@ class TestBalanceManagerEdgeCases:
         assert stats["total_trades"] == 1
         assert stats["total_profit_eth"] == Decimal("0.01")
 
-    @pytest.mark.asyncio
     async def test_max_investment_zero_balance(self, manager):
         """Max investment with zero balance should be zero or very small."""
         manager.current_balance = Decimal("0")
         max_inv = await manager.get_max_investment_amount()
         assert max_inv >= Decimal("0")
 
-    @pytest.mark.asyncio
     async def test_max_investment_dust_balance(self, manager):
         """Max investment with dust balance should be conservative."""
         manager.current_balance = Decimal("0.005")
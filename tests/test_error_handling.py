@@ -39,7 +39,6 @@ class TestComponentInitializationError:
 class TestWithErrorHandlingDecorator:
     """Test with_error_handling decorator."""
 
-    @pytest.mark.asyncio
     async def test_async_function_success(self):
         """Test decorator with successful async function."""
 
@@ -51,7 +50,6 @@ class TestWithErrorHandlingDecorator:
         result = await async_func(5)
         assert result == 10
 
-    @pytest.mark.asyncio
     async def test_async_function_with_retry(self):
         """Test decorator with retry on async function."""
         call_count = 0
@@ -68,7 +66,6 @@ class TestWithErrorHandlingDecorator:
         assert result == "success"
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_async_function_with_fallback(self):
         """Test decorator with fallback on async function."""
 
@@ -79,7 +76,6 @@ class TestWithErrorHandlingDecorator:
         result = await async_func()
         assert result == "default"
 
-    @pytest.mark.asyncio
     async def test_async_function_critical_failure(self):
         """Test decorator with critical failure on async function."""
 
@@ -157,7 +153,6 @@ class TestWithErrorHandlingDecorator:
 class TestSafeCall:
     """Test safe_call function."""
 
-    @pytest.mark.asyncio
     async def test_safe_call_async_success(self):
         """Test safe_call with successful async function."""
 
@@ -167,7 +162,6 @@ class TestSafeCall:
         result = await safe_call(async_func, 5, component_name="test")
         assert result == 15
 
-    @pytest.mark.asyncio
     async def test_safe_call_async_with_kwargs(self):
         """Test safe_call with async function using kwargs."""
 
@@ -177,7 +171,6 @@ class TestSafeCall:
         result = await safe_call(async_func, 5, b=20, component_name="test")
         assert result == 25
 
-    @pytest.mark.asyncio
     async def test_safe_call_async_with_error(self):
         """Test safe_call with async function that raises error."""
 
@@ -205,7 +198,6 @@ class TestSafeCall:
         result = asyncio.run(safe_call(sync_func, component_name="test", fallback=None))
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_safe_call_no_logging(self):
         """Test safe_call with log_errors=False."""
 
@@ -291,7 +283,6 @@ class TestComponentHealthTracker:
         assert "unhealthy" in unhealthy
         assert "healthy" not in unhealthy
 
-    @pytest.mark.asyncio
     async def test_attempt_recovery_async(self):
         """Test recovery with async strategy."""
         tracker = ComponentHealthTracker()
@@ -307,7 +298,6 @@ class TestComponentHealthTracker:
         assert result is True
         assert tracker._health_status["test"]["healthy"] is True
 
-    @pytest.mark.asyncio
     async def test_attempt_recovery_sync(self):
         """Test recovery with sync strategy."""
         tracker = ComponentHealthTracker()
@@ -321,7 +311,6 @@ class TestComponentHealthTracker:
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_attempt_recovery_no_strategy(self):
         """Test recovery without strategy."""
         tracker = ComponentHealthTracker()
@@ -331,7 +320,6 @@ class TestComponentHealthTracker:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_attempt_recovery_failure(self):
         """Test recovery strategy that fails."""
         tracker = ComponentHealthTracker()
@@ -345,7 +333,6 @@ class TestComponentHealthTracker:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_attempt_recovery_exception(self):
         """Test recovery strategy that raises exception."""
         tracker = ComponentHealthTracker()
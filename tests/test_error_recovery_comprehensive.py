@@ -24,7 +24,6 @@ from on1builder.utils.error_recovery import (
 )
 
 
-@pytest.mark.asyncio
 async def test_circuit_breaker_opens_then_half_opens_and_closes():
     breaker = CircuitBreaker(
         failure_threshold=2, recovery_timeout=1, expected_exception=ValueError
@@ -65,7 +64,6 @@ def test_circuit_breaker_reset_timing_helpers():
     assert 0 < breaker._time_until_reset() <= 10
 
 
-@pytest.mark.asyncio
 async def test_retry_manager_retries_and_uses_backoff(monkeypatch):
     sleeps: list[float] = []
     monkeypatch.setattr(
@@ -92,7 +90,6 @@ async def test_retry_manager_retries_and_uses_backoff(monkeypatch):
     assert retry._calculate_delay(3) == 10
 
 
-@pytest.mark.asyncio
 async def test_retry_manager_applies_jitter_and_raises_after_all_failures(monkeypatch):
     monkeypatch.setattr(error_recovery_module.asyncio, "sleep", AsyncMock())
     monkeypatch.setattr("random.uniform", lambda a, b: 1.25)
@@ -113,7 +110,6 @@ async def test_retry_manager_applies_jitter_and_raises_after_all_failures(monkey
     assert retry._calculate_delay(1) == pytest.approx(10.0)
 
 
-@pytest.mark.asyncio
 async def test_error_recovery_manager_handle_error_and_statistics(monkeypatch):
     manager = ErrorRecoveryManager()
     context = {"chain_id": 1}
@@ -134,7 +130,6 @@ async def test_error_recovery_manager_handle_error_and_statistics(monkeypatch):
     assert manager._is_error_frequency_too_high("worker:ConnectionError") is True
 
 
-@pytest.mark.asyncio
 async def test_error_recovery_manager_connection_and_transaction_strategies(
     monkeypatch,
 ):
@@ -180,7 +175,6 @@ async def test_error_recovery_manager_connection_and_transaction_strategies(
     assert gas_context["retry_tx_params"]["gas"] == 180000
 
 
-@pytest.mark.asyncio
 async def test_error_recovery_manager_funds_strategies_and_missing_context():
     manager = ErrorRecoveryManager()
     context: dict[str, object] = {}
@@ -215,7 +209,6 @@ async def test_error_recovery_manager_funds_strategies_and_missing_context():
     assert await manager._reduce_gas_limit(TransactionError("tx"), {}) is False
 
 
-@pytest.mark.asyncio
 async def test_with_error_recovery_decorator_retries_after_recovery(monkeypatch):
     manager = MagicMock()
     manager.handle_error = AsyncMock(return_value=True)
@@ -236,7 +229,6 @@ async def test_with_error_recovery_decorator_retries_after_recovery(monkeypatch)
     manager.handle_error.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_with_error_recovery_reraises_when_unrecovered_or_retry_fails(
     monkeypatch,
 ):
@@ -265,7 +257,6 @@ async def test_with_error_recovery_reraises_when_unrecovered_or_retry_fails(
         await retry_fails()
 
 
-@pytest.mark.asyncio
 async def test_convenience_decorators_and_singleton_getter(monkeypatch):
     assert isinstance(with_circuit_breaker(), CircuitBreaker)
     assert isinstance(with_retry(), RetryManager)
@@ -13,7 +13,6 @@ requires_live = pytest.mark.skipif(
 
 
 @requires_live
-@pytest.mark.asyncio
 async def test_live_eth_price_and_summary(monkeypatch):
     # Ensure config validation passes by providing a public RPC endpoint
     monkeypatch.setenv("RPC_URL_1", "https://ethereum-rpc.publicnode.com")
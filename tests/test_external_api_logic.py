@@ -4,7 +4,6 @@ import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
 from cachetools import TTLCache
 
 from on1builder.integrations.external_apis import ExternalAPIManager, RateLimitTracker
@@ -36,7 +35,6 @@ def test_rate_limit_tracker_backoff_when_near_limit(monkeypatch):
     assert tracker.can_make_request() is False
 
 
-@pytest.mark.asyncio
 async def test_get_price_returns_cache_and_skips_failed_tokens(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager_state(manager)
@@ -52,7 +50,6 @@ async def test_get_price_returns_cache_and_skips_failed_tokens(monkeypatch):
     assert skipped is None
 
 
-@pytest.mark.asyncio
 async def test_comprehensive_market_data_handles_errors_gracefully(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager_state(manager)
@@ -94,7 +91,6 @@ def test_normalize_oracle_symbol_maps_weth():
     assert manager._normalize_oracle_symbol("weth") == "ETH"
 
 
-@pytest.mark.asyncio
 async def test_get_price_falls_back_to_oracle_when_no_providers(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager_state(manager)
@@ -128,7 +124,6 @@ def test_load_configured_oracle_feeds_merges(monkeypatch):
     assert manager._oracle_feeds_by_chain[56]["BNB"] == "0xabc"
 
 
-@pytest.mark.asyncio
 async def test_get_price_skips_unhealthy_providers(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager_state(manager)
@@ -27,7 +27,8 @@ class DummyResponse:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    async def json(self):
+    async def json(self, loads=None):
+        self.loads = loads
         return self._data
 
 
@@ -204,7 +205,6 @@ def provider(name, base_url="https://example.com", rate_limit=5):
     return Provider(name=name, base_url=base_url, rate_limit=rate_limit)
 
 
-@pytest.mark.asyncio
 async def test_initialize_builds_providers_and_marks_initialized(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -277,7 +277,6 @@ def test_start_background_tasks_registers_tasks(monkeypatch):
     assert all(task.callbacks for task in created)
 
 
-@pytest.mark.asyncio
 async def test_check_provider_health_and_prefetch(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -302,7 +301,6 @@ async def test_check_provider_health_and_prefetch(monkeypatch):
     assert manager._get_price_non_blocking.await_count == 4
 
 
-@pytest.mark.asyncio
 async def test_token_loading_and_parsing(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -349,7 +347,18 @@ async def test_token_loading_and_parsing(monkeypatch):
     assert manager._parse_token_json("missing.json") == []
 
 
-@pytest.mark.asyncio
+def test_parse_token_json_reads_utf8_and_rejects_malformed_files(tmp_path):
+    manager = ExternalAPIManager.__new__(ExternalAPIManager)
+    token_file = tmp_path / "tokens.json"
+    token_file.write_text('[{"symbol": "ÆTH", "name": "Æther"}]', encoding="utf-8")
+    assert manager._parse_token_json(str(token_file)) == [
+        {"symbol": "ÆTH", "name": "Æther"}
+    ]
+
+    token_file.write_text("[{", encoding="utf-8")
+    assert manager._parse_token_json(str(token_file)) == []
+
+
 async def test_get_price_paths_and_failed_token_cleanup(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -382,7 +391,6 @@ async def test_get_price_paths_and_failed_token_cleanup(monkeypatch):
     assert any(token.startswith("OLD") for token in manager._failed_tokens)
 
 
-@pytest.mark.asyncio
 async def test_get_price_uses_provider_tasks_and_reloads_tokens(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -420,7 +428,6 @@ async def test_get_price_uses_provider_tasks_and_reloads_tokens(monkeypatch):
     )
 
 
-@pytest.mark.asyncio
 async def test_provider_fetchers_and_make_request(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -458,9 +465,10 @@ async def test_provider_fetchers_and_make_request(monkeypatch):
     assert await manager._fetch_from_etherscan("ETH") == 2500.0
     assert await manager._fetch_from_etherscan("UNI") is None
 
+    ok_response = DummyResponse(200, {"ok": True})
     manager._session = DummySession(
         [
-            DummyResponse(200, {"ok": True}),
+            ok_response,
             DummyResponse(400, {}),
             DummyResponse(500, {}),
         ]
@@ -468,6 +476,7 @@ async def test_provider_fetchers_and_make_request(monkeypatch):
     assert await ExternalAPIManager._make_request(manager, "u", "coingecko") == {
         "ok": True
     }
+    assert ok_response.loads is api_module.json_loads
     assert (
         await ExternalAPIManager._make_request(
             manager, "u", "binance", params={"symbol": "BAD"}
@@ -486,7 +495,6 @@ async def test_provider_fetchers_and_make_request(monkeypatch):
         await ExternalAPIManager._make_request(manager, "u", "coingecko")
 
 
-@pytest.mark.asyncio
 async def test_close_health_cache_and_backoff_helpers():
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -517,7 +525,6 @@ async def test_close_health_cache_and_backoff_helpers():
     assert manager._session is None
 
 
-@pytest.mark.asyncio
 async def test_oracle_and_onchain_helpers(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -561,7 +568,6 @@ async def test_oracle_and_onchain_helpers(monkeypatch):
     assert token0 == "0xtoken"
 
 
-@pytest.mark.asyncio
 async def test_market_sentiment_volatility_volume_cap_and_metadata(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -599,7 +605,6 @@ async def test_market_sentiment_volatility_volume_cap_and_metadata(monkeypatch):
     assert "timestamp" in data
 
 
-@pytest.mark.asyncio
 async def test_coingecko_helpers_social_sentiment_and_history(monkeypatch):
     manager = ExternalAPIManager()
     reset_manager(manager)
@@ -5,8 +5,6 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from on1builder.utils.gas_optimizer import GasOptimizer
 
 
@@ -56,7 +54,6 @@ class FakeWeb3:
         return value / 10**9
 
 
-@pytest.mark.asyncio
 async def test_initialize_sets_eip1559_and_handles_failure(monkeypatch):
     web3 = FakeWeb3()
     optimizer = GasOptimizer(web3)
@@ -73,7 +70,6 @@ async def test_initialize_sets_eip1559_and_handles_failure(monkeypatch):
     assert failed_optimizer._is_eip1559_supported is False
 
 
-@pytest.mark.asyncio
 async def test_get_optimal_gas_params_selects_eip1559_or_legacy(monkeypatch):
     web3 = FakeWeb3()
     optimizer = GasOptimizer(web3)
@@ -90,7 +86,6 @@ async def test_get_optimal_gas_params_selects_eip1559_or_legacy(monkeypatch):
     assert await optimizer.get_optimal_gas_params("low", 1) == {"type": 0}
 
 
-@pytest.mark.asyncio
 async def test_get_eip1559_params_and_fallback(monkeypatch):
     web3 = FakeWeb3()
     optimizer = GasOptimizer(web3)
@@ -118,7 +113,6 @@ async def test_get_eip1559_params_and_fallback(monkeypatch):
     }
 
 
-@pytest.mark.asyncio
 async def test_get_legacy_gas_params_and_fallback():
     web3 = FakeWeb3()
     web3.eth.gas_price = AwaitableValue(100)
@@ -154,7 +148,6 @@ def test_predict_base_fee_with_various_histories():
     )
 
 
-@pytest.mark.asyncio
 async def test_update_gas_metrics_calculates_priority_and_trims_old_data(monkeypatch):
     web3 = FakeWeb3()
     web3.eth.gas_price = AwaitableValue(200)
@@ -168,16 +161,17 @@ async def test_update_gas_metrics_calculates_priority_and_trims_old_data(monkeyp
     optimizer._gas_history = [(old_time, 1)]
     optimizer._base_fee_history = [(old_time, 2)]
     optimizer._priority_fee_history = [(old_time, 3)]
+    gas_history = optimizer._gas_history
 
     await optimizer._update_gas_metrics()
 
+    assert optimizer._gas_history is gas_history
     assert len(optimizer._gas_history) == 1
     assert optimizer._gas_history[-1][1] == 200
     assert optimizer._base_fee_history[-1][1] == 120
     assert optimizer._priority_fee_history[-1][1] == 50
 
 
-@pytest.mark.asyncio
 async def test_calculate_priority_fee_estimate_paths():
     web3 = FakeWeb3()
     web3.eth.get_transaction = AsyncMock(
@@ -199,7 +193,6 @@ async def test_calculate_priority_fee_estimate_paths():
     )
 
 
-@pytest.mark.asyncio
 async def test_estimate_transaction_cost_for_eip_and_legacy():
     optimizer = GasOptimizer(FakeWeb3())
     optimizer.get_optimal_gas_params = AsyncMock(
@@ -214,7 +207,6 @@ async def test_estimate_transaction_cost_for_eip_and_legacy():
     ) / Decimal(10**18)
 
 
-@pytest.mark.asyncio
 async def test_should_delay_transaction_and_error_path():
     optimizer = GasOptimizer(FakeWeb3())
     assert await optimizer.should_delay_transaction() == (False, None)
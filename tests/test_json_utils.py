@@ -0,0 +1,65 @@
+"""Tests for the shared JSON helpers."""
+
+import json
+
+import pytest
+
+from on1builder.utils import json_utils
+from on1builder.utils.json_utils import json_dumps, json_loads
+
+BIG_WEI = 2**256 - 1
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not json_utils.HAVE_ORJSON:
+        pytest.skip("orjson not available")
+    monkeypatch.setattr(json_utils, "HAVE_ORJSON", request.param)
+    return request.param
+
+
+def test_dumps_round_trips_through_stdlib(backend):
+    payload = {"text": "Gas spike ⚠", "fields": [{"value": 1.5}], "ok": True}
+
+    assert json.loads(json_dumps(payload)) == payload
+
+
+def test_dumps_handles_ints_beyond_64_bits(backend):
+    assert json.loads(json_dumps({"value": BIG_WEI})) == {"value": BIG_WEI}
+
+
+def test_dumps_uses_default_for_unknown_types(backend):
+    assert json.loads(json_dumps({"n": object()}, default=lambda o: "x")) == {"n": "x"}
+
+
+@pytest.mark.parametrize(
+    "data", ['{"value": %d}' % BIG_WEI, b'{"value": %d}' % BIG_WEI]
+)
+def test_loads_keeps_ints_beyond_64_bits_exact(backend, data):
+    assert json_loads(data) == {"value": BIG_WEI}
+
+
+@pytest.mark.parametrize("data", ['{"a": [1, 2.5, "b"]}', b'{"a": [1, 2.5, "b"]}'])
+def test_loads_accepts_str_and_bytes(backend, data):
+    assert json_loads(data) == {"a": [1, 2.5, "b"]}
+
+
+def test_loads_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{not json")
+
+
+def test_dumps_layout_matches_across_backends(monkeypatch):
+    from datetime import datetime
+
+    if not json_utils.HAVE_ORJSON:
+        pytest.skip("orjson not available")
+    payload = {1: "chain", "at": datetime(2026, 1, 2), "text": "€5", "ok": True}
+
+    with_orjson = json_dumps(payload, default=str)
+    monkeypatch.setattr(json_utils, "HAVE_ORJSON", False)
+
+    assert with_orjson == json_dumps(payload, default=str)
+    assert (
+        with_orjson == '{"1":"chain","at":"2026-01-02 00:00:00","text":"€5","ok":true}'
+    )
@@ -2,10 +2,13 @@
 
 import logging
 import os
-from unittest.mock import Mock, patch
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from on1builder.utils import json_utils, logging_config
 from on1builder.utils.logging_config import (
     HAVE_COLORLOG,
     JsonFormatter,
@@ -15,6 +18,16 @@ from on1builder.utils.logging_config import (
 )
 
 
+@pytest.fixture
+def settings_unavailable(monkeypatch):
+    """Make settings lookups fail so setup_logging falls back to the environment."""
+
+    def _raise():
+        raise RuntimeError("settings unavailable")
+
+    monkeypatch.setattr("on1builder.config.loaders.get_settings", _raise)
+
+
 class TestJsonFormatter:
     """Test JsonFormatter class."""
 
@@ -97,6 +110,105 @@ class TestJsonFormatter:
         assert parsed["user_id"] == 123
         assert parsed["action"] == "login"
 
+    def test_formatting_tolerates_unserializable_extras(self):
+        """Test JSON output stringifies values json cannot encode."""
+        import json
+
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+        record.extra_data = {"amount": Decimal("1.5")}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["amount"] == "1.5"
+
+    def test_formatting_handles_ints_beyond_64_bits(self):
+        """Test uint256-sized wei values are logged exactly."""
+        import json
+
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+        record.extra_data = {"value_wei": 2**255}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["value_wei"] == 2**255
+
+    def test_formatting_layout_is_identical_across_serializers(self, monkeypatch):
+        """Test orjson, the big-int fallback and stdlib emit the same line shape."""
+        from datetime import datetime
+
+        if not json_utils.HAVE_ORJSON:
+            pytest.skip("orjson not available")
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Prix: %s",
+            args=("€5",),
+            exc_info=None,
+        )
+        record.extra_data = {
+            1: "chain",
+            "amount": Decimal("1.5"),
+            "at": datetime(2026, 1, 2, 3, 4, 5),
+        }
+
+        with_orjson = formatter.format(record)
+        monkeypatch.setattr(json_utils, "HAVE_ORJSON", False)
+        with_stdlib = formatter.format(record)
+        monkeypatch.setattr(json_utils, "HAVE_ORJSON", True)
+        record.extra_data["value_wei"] = 2**255
+        big_int_fallback = formatter.format(record)
+
+        assert with_orjson == with_stdlib
+        assert big_int_fallback == with_stdlib[:-1] + f',"value_wei":{2**255}}}'
+        assert '"at":"2026-01-02 03:04:05"' in with_orjson
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_formatting_matches_with_and_without_orjson(self, monkeypatch, have_orjson):
+        """Test both serializers produce the same JSON document."""
+        if have_orjson and not json_utils.HAVE_ORJSON:
+            pytest.skip("orjson not available")
+        monkeypatch.setattr(json_utils, "HAVE_ORJSON", have_orjson)
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Prix: %s",
+            args=("€5",),
+            exc_info=None,
+        )
+        record.extra_data = {1: "chain", "amount": Decimal("1.5")}
+
+        import json
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["message"] == "Prix: €5"
+        assert parsed["1"] == "chain"
+        assert parsed["amount"] == "1.5"
+
 
 class TestSetupLogging:
     """Test setup_logging function."""
@@ -108,7 +220,7 @@ class TestSetupLogging:
     def test_setup_logging_default(self):
         """Test default logging setup."""
         with patch.dict(os.environ, {}, clear=True):
-            setup_logging()
+            setup_logging(force_setup=True)
 
         logger = logging.getLogger("on1builder")
         assert logger.level in [logging.INFO, logging.DEBUG]
@@ -116,9 +228,10 @@ class TestSetupLogging:
 
     def test_setup_logging_debug_mode(self):
         """Test logging setup with debug mode."""
-        with patch("on1builder.config.loaders.get_settings") as mock_settings:
-            mock_settings.return_value = Mock(debug=True)
-
+        with patch(
+            "on1builder.config.loaders.get_settings",
+            return_value=SimpleNamespace(debug=True),
+        ):
             setup_logging(force_setup=True)
 
             logger = logging.getLogger("on1builder")
@@ -150,30 +263,26 @@ class TestSetupLogging:
 
             assert isinstance(handler.formatter, colorlog.ColoredFormatter)
 
-    def test_setup_logging_without_colorlog(self):
+    def test_setup_logging_without_colorlog(self, monkeypatch):
         """Test logging setup falls back when colorlog unavailable."""
-        with patch("on1builder.utils.logging_config.HAVE_COLORLOG", False):
-            with patch.dict(os.environ, {"LOG_FORMAT": "console"}):
-                setup_logging(force_setup=True)
+        monkeypatch.setattr(logging_config, "HAVE_COLORLOG", False)
+        monkeypatch.setenv("LOG_FORMAT", "console")
 
-                logger = logging.getLogger("on1builder")
-                handler = logger.handlers[0]
+        setup_logging(force_setup=True)
 
-                assert isinstance(handler.formatter, logging.Formatter)
+        logger = logging.getLogger("on1builder")
+        handler = logger.handlers[0]
 
-    def test_setup_logging_custom_level(self):
+        assert isinstance(handler.formatter, logging.Formatter)
+
+    def test_setup_logging_custom_level(self, monkeypatch, settings_unavailable):
         """Test logging setup with custom level from environment."""
-        with patch.dict(os.environ, {"LOG_LEVEL": "WARNING"}):
-            with patch("on1builder.config.loaders.get_settings", side_effect=Exception):
-                setup_logging(force_setup=True)
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
 
-                logger = logging.getLogger("on1builder")
-                assert logger.level == logging.WARNING
+        setup_logging(force_setup=True)
 
-    def test_setup_logging_file_handler_created(self):
-        """Test file handler is created."""
-        # Skip in test environment
-        pytest.skip("File handler creation tested separately")
+        logger = logging.getLogger("on1builder")
+        assert logger.level == logging.WARNING
 
     def test_setup_logging_file_handler_error(self):
         """Test logging continues if file handler fails."""
@@ -189,6 +298,39 @@ class TestSetupLogging:
                 logger = logging.getLogger("on1builder")
                 assert len(logger.handlers) > 0
 
+    def test_setup_logging_file_handler_rotates_and_defers_open(
+        self, monkeypatch, tmp_path
+    ):
+        """Test the file handler is size-rotated and opens the file lazily."""
+        from logging.handlers import RotatingFileHandler
+
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.setenv("ON1_LOG_TO_FILE", "1")
+        monkeypatch.setattr(logging_config, "get_base_dir", lambda: tmp_path)
+
+        setup_logging(force_setup=True)
+
+        logger = logging.getLogger("on1builder")
+        (file_handler,) = [
+            h for h in logger.handlers if isinstance(h, RotatingFileHandler)
+        ]
+        assert file_handler.maxBytes == logging_config.LOG_FILE_MAX_BYTES
+        assert file_handler.backupCount == logging_config.LOG_FILE_BACKUP_COUNT
+        assert file_handler.delay is True
+
+    @pytest.mark.parametrize("value", ["0", "false", "NO"])
+    def test_setup_logging_skips_file_handler_when_disabled(self, monkeypatch, value):
+        """Test ON1_LOG_TO_FILE turns the file handler off outside a test."""
+        from logging.handlers import RotatingFileHandler
+
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.setenv("ON1_LOG_TO_FILE", value)
+
+        setup_logging(force_setup=True)
+
+        logger = logging.getLogger("on1builder")
+        assert not any(isinstance(h, RotatingFileHandler) for h in logger.handlers)
+
     def test_setup_logging_clears_existing_handlers(self):
         """Test setup_logging clears existing handlers."""
         logger = logging.getLogger("on1builder")
@@ -205,6 +347,17 @@ class TestSetupLogging:
         # Should clear and recreate handlers
         assert len(logger.handlers) > 0
 
+    def test_setup_logging_closes_replaced_file_handler(self, tmp_path):
+        """Test reconfiguring releases the file handle of a replaced handler."""
+        logger = logging.getLogger("on1builder")
+        file_handler = logging.FileHandler(tmp_path / "old.log")
+        logger.addHandler(file_handler)
+
+        setup_logging(force_setup=True)
+
+        assert file_handler not in logger.handlers
+        assert file_handler.stream is None
+
     def test_setup_logging_idempotent(self):
         """Test setup_logging is idempotent without force_setup."""
         setup_logging()
@@ -218,7 +371,7 @@ class TestSetupLogging:
         # Should not add more handlers
         assert len(logger.handlers) == handler_count
 
-    def test_setup_logging_force_setup(self):
+    def test_setup_logging_force_setup(self, monkeypatch, settings_unavailable):
         """Test force_setup reconfigures logging."""
         setup_logging()
 
@@ -226,12 +379,11 @@ class TestSetupLogging:
         original_level = logger.level
 
         # Change environment and force setup
-        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}):
-            with patch("on1builder.config.loaders.get_settings", side_effect=Exception):
-                setup_logging(force_setup=True)
+        monkeypatch.setenv("LOG_LEVEL", "ERROR")
+        setup_logging(force_setup=True)
 
-                # Level should change
-                assert logger.level != original_level or original_level == logging.ERROR
+        # Level should change
+        assert logger.level != original_level or original_level == logging.ERROR
 
 
 class TestGetLogger:
@@ -316,18 +468,17 @@ class TestLoggingIntegration:
 
     def test_logger_output(self, caplog):
         """Test logger actually logs messages."""
-        with caplog.at_level(logging.INFO):
-            logger = get_logger("test")
+        logger = get_logger("test")
+        with caplog.at_level(logging.INFO, logger="on1builder"):
             logger.info("Test message")
 
         assert "Test message" in caplog.text
 
-    def test_different_log_levels(self, caplog):
+    def test_different_log_levels(self, caplog, monkeypatch, settings_unavailable):
         """Test different log levels work correctly."""
         # Set up logger with DEBUG level
-        with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}):
-            with patch("on1builder.config.loaders.get_settings", side_effect=Exception):
-                setup_logging(force_setup=True)
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        setup_logging(force_setup=True)
 
         logger = get_logger("test")
 
@@ -1,5 +1,6 @@
 """Behavior-heavy tests that assert end-to-end intentions rather than syntax."""
 
+import json
 from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -7,6 +8,7 @@ from unittest.mock import AsyncMock
 import eth_abi
 import pytest
 
+from on1builder.engines import strategy_executor as strategy_executor_module
 from on1builder.engines.strategy_executor import StrategyExecutor
 from on1builder.monitoring.txpool_scanner import TxPoolScanner
 from on1builder.utils.profit_calculator import ProfitCalculator
@@ -80,7 +82,79 @@ class DummyContracts:
         self.simple_flashloan_contract = {}
 
 
-@pytest.mark.asyncio
+MEDIUM_BALANCE_SUMMARY = {
+    "balance": 2.0,
+    "balance_tier": "medium",
+    "wallet_address": "0xabc",
+    "max_investment": 1.0,
+    "profit_threshold": 0.05,
+    "flashloan_recommended": False,
+    "emergency_mode": False,
+}
+
+# Serialized once; the weights-loading tests only need the file contents.
+WEIGHTS_JSON = json.dumps(
+    {
+        "version": "2.0",
+        "strategies": {
+            "arbitrage": {"weight": [2.5]},
+            "back_run": {"weight": 0.4},
+            "retired_strategy": {"weight": [9.0]},
+        },
+    }
+)
+LEGACY_WEIGHTS_JSON = json.dumps(
+    {"arbitrage": [2.5], "back_run": [0.4], "retired_strategy": [9.0]}
+)
+
+
+@pytest.fixture(autouse=True)
+def weights_path(monkeypatch, tmp_path):
+    """Keep executors off the shipped weights file; tests may write their own."""
+    path = tmp_path / "strategy_weights.json"
+    monkeypatch.setattr(
+        strategy_executor_module, "get_strategy_weights_path", lambda: path
+    )
+    return path
+
+
+@pytest.fixture(scope="module")
+def tx_manager():
+    """Stateless transaction manager shared by every executor in the module."""
+    return DummyTxManager()
+
+
+@pytest.fixture
+def strategy_settings(monkeypatch):
+    """Plain settings stub with every strategy enabled; tests flip flags in place."""
+    stub_settings = SimpleNamespace(
+        ml_exploration_rate=0.0,
+        ml_learning_rate=0.01,
+        ml_decay_rate=0.99,
+        allow_unsimulated_trades=True,
+        flashloan_enabled=True,
+        mev_strategies_enabled=True,
+        front_running_enabled=True,
+        back_running_enabled=True,
+        sandwich_attacks_enabled=True,
+        simulation_concurrency=1,
+    )
+    monkeypatch.setattr(strategy_executor_module, "settings", stub_settings)
+    return stub_settings
+
+
+@pytest.fixture
+def make_executor(strategy_settings, tx_manager):
+    """Build a StrategyExecutor with deterministic (exploration-free) selection."""
+
+    def _make(balance_summary=MEDIUM_BALANCE_SUMMARY):
+        executor = StrategyExecutor(tx_manager, DummyBalanceManager(balance_summary))
+        executor._exploration_rate = 0.0
+        return executor
+
+    return _make
+
+
 async def test_profit_calculator_tracks_net_profit_and_strategy_intent(monkeypatch):
     """Ensure profit analysis reflects inflow/outflow, gas, and strategy signals."""
     calculator = ProfitCalculator(AsyncMock(), SimpleNamespace(wallet_address="0xabc"))
@@ -121,25 +195,11 @@ async def test_profit_calculator_tracks_net_profit_and_strategy_intent(monkeypat
     assert analysis["strategy_analysis"]["flash_loan_detected"] is True
 
 
-@pytest.mark.asyncio
 async def test_strategy_executor_respects_balance_tiers_and_ON1Builders_opportunities(
-    monkeypatch, tmp_path
+    make_executor,
 ):
     """Validate strategy selection honors balance tiers and ON1Builders opportunities with limits."""
-    balance_summary = {
-        "balance": 2.0,
-        "balance_tier": "medium",
-        "wallet_address": "0xabc",
-        "max_investment": 1.0,
-        "profit_threshold": 0.05,
-        "flashloan_recommended": False,
-        "emergency_mode": False,
-    }
-    balance_manager = DummyBalanceManager(balance_summary)
-    tx_manager = DummyTxManager()
-    executor = StrategyExecutor(tx_manager, balance_manager)
-    # Make selection deterministic
-    executor._exploration_rate = 0.0
+    executor = make_executor()
     executor._weights["front_run"] = [3.0]
     executor._weights["arbitrage"] = [0.1]
 
@@ -151,42 +211,38 @@ async def test_strategy_executor_respects_balance_tiers_and_ON1Builders_opportun
     ON1Builder = await executor._ON1Builder_opportunity_with_balance(opportunity)
     assert ON1Builder["investment_amount"] == 1.0  # capped to max_investment
     assert ON1Builder["amount_limited"] is True
-    assert ON1Builder["min_profit_threshold"] == balance_summary["profit_threshold"]
+    assert (
+        ON1Builder["min_profit_threshold"] == MEDIUM_BALANCE_SUMMARY["profit_threshold"]
+    )
     assert "optimal_gas_price" in ON1Builder and ON1Builder["gas_viable"] is True
 
 
-@pytest.mark.asyncio
-async def test_strategy_executor_respects_feature_flags(monkeypatch):
+@pytest.mark.parametrize(
+    "disabled_flags,weights",
+    [
+        pytest.param(
+            ["flashloan_enabled", "front_running_enabled", "sandwich_attacks_enabled"],
+            {"front_run": 10.0, "flashloan_arbitrage": 8.0, "arbitrage": 2.0},
+            id="per-strategy-flags",
+        ),
+        pytest.param(
+            ["mev_strategies_enabled"],
+            {"back_run": 5.0, "arbitrage": 2.0},
+            id="global-mev-toggle",
+        ),
+    ],
+)
+async def test_strategy_executor_skips_disabled_strategies(
+    strategy_settings, make_executor, disabled_flags, weights
+):
     """Disabled strategies should not be selected even with high weights."""
-    stub_settings = SimpleNamespace(
-        ml_exploration_rate=0.0,
-        ml_learning_rate=0.01,
-        ml_decay_rate=0.99,
-        allow_unsimulated_trades=True,
-        flashloan_enabled=False,
-        mev_strategies_enabled=True,
-        front_running_enabled=False,
-        back_running_enabled=True,
-        sandwich_attacks_enabled=False,
-        simulation_concurrency=1,
-    )
-    monkeypatch.setattr("on1builder.engines.strategy_executor.settings", stub_settings)
+    for flag in disabled_flags:
+        setattr(strategy_settings, flag, False)
 
-    balance_summary = {
-        "balance": 2.0,
-        "balance_tier": "medium",
-        "wallet_address": "0xabc",
-        "max_investment": 1.0,
-        "profit_threshold": 0.05,
-        "flashloan_recommended": False,
-        "emergency_mode": False,
-    }
-    executor = StrategyExecutor(DummyTxManager(), DummyBalanceManager(balance_summary))
-    executor._exploration_rate = 0.0
-    executor._weights["front_run"] = [10.0]
-    executor._weights["flashloan_arbitrage"] = [8.0]
-    executor._weights["arbitrage"] = [2.0]
+    executor = make_executor()
     executor._weights["back_run"] = [0.1]
+    for strategy_name, weight in weights.items():
+        executor._weights[strategy_name] = [weight]
 
     opportunity = {
         "expected_profit_eth": 0.4,
@@ -198,61 +254,16 @@ async def test_strategy_executor_respects_feature_flags(monkeypatch):
     assert chosen == "arbitrage"
 
 
-@pytest.mark.asyncio
-async def test_strategy_executor_respects_global_mev_toggle(monkeypatch):
-    """Global MEV toggle should suppress front/back/sandwich strategies."""
-    stub_settings = SimpleNamespace(
-        ml_exploration_rate=0.0,
-        ml_learning_rate=0.01,
-        ml_decay_rate=0.99,
-        allow_unsimulated_trades=True,
-        flashloan_enabled=True,
-        mev_strategies_enabled=False,
-        front_running_enabled=True,
-        back_running_enabled=True,
-        sandwich_attacks_enabled=True,
-        simulation_concurrency=1,
-    )
-    monkeypatch.setattr("on1builder.engines.strategy_executor.settings", stub_settings)
-
-    balance_summary = {
-        "balance": 2.0,
-        "balance_tier": "medium",
-        "wallet_address": "0xabc",
-        "max_investment": 1.0,
-        "profit_threshold": 0.05,
-        "flashloan_recommended": False,
-        "emergency_mode": False,
-    }
-    executor = StrategyExecutor(DummyTxManager(), DummyBalanceManager(balance_summary))
-    executor._exploration_rate = 0.0
-    executor._weights["back_run"] = [5.0]
-    executor._weights["arbitrage"] = [2.0]
-
-    opportunity = {
-        "expected_profit_eth": 0.4,
-        "investment_amount": 1.0,
-        "simulated": True,
-    }
-    strategy_func, chosen = await executor._select_strategy(opportunity)
-    assert strategy_func is not None
-    assert chosen == "arbitrage"
-
-
-def test_strategy_executor_updates_weights_with_context():
+def test_strategy_executor_updates_weights_with_context(make_executor):
     """Weight updates should reward profitable executions with contextual signals."""
-    balance_manager = DummyBalanceManager(
+    executor = make_executor(
         {
+            **MEDIUM_BALANCE_SUMMARY,
             "balance": 5.0,
-            "balance_tier": "medium",
-            "wallet_address": "0xabc",
             "max_investment": 2.0,
             "profit_threshold": 0.01,
-            "flashloan_recommended": False,
-            "emergency_mode": False,
         }
     )
-    executor = StrategyExecutor(DummyTxManager(), balance_manager)
     executor._weights["arbitrage"] = [1.0]
 
     opportunity = {
@@ -267,7 +278,40 @@ def test_strategy_executor_updates_weights_with_context():
     assert executor._weights["arbitrage"][0] > 1.0
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "weights_json",
+    [
+        pytest.param(WEIGHTS_JSON, id="v2-format"),
+        pytest.param(LEGACY_WEIGHTS_JSON, id="legacy-format"),
+    ],
+)
+def test_strategy_executor_loads_saved_weights(
+    make_executor, weights_path, weights_json
+):
+    """Persisted weights should seed the executor; unknown strategies are dropped."""
+    weights_path.write_text(weights_json)
+
+    executor = make_executor()
+
+    assert executor._weights["arbitrage"] == [2.5]
+    assert executor._weights["back_run"] == [0.4]
+    assert executor._weights["front_run"] == [1.0]
+    assert "retired_strategy" not in executor._weights
+
+
+def test_strategy_executor_saved_weights_round_trip(make_executor, weights_path):
+    """Weights written to disk should reload into a fresh executor unchanged."""
+    executor = make_executor()
+    executor._weights["arbitrage"] = [1.75]
+
+    executor._save_weights()
+
+    saved = json.loads(weights_path.read_text())
+    assert saved["version"] == "2.0"
+    assert saved["strategies"]["arbitrage"]["weight"] == [1.75]
+    assert make_executor()._weights == executor._weights
+
+
 async def test_txpool_scanner_identifies_mev_relevance_and_opportunities(monkeypatch):
     """End-to-end transaction analysis should flag MEV relevance and produce opportunities."""
     stub_settings = SimpleNamespace(
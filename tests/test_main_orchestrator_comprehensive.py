@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from on1builder.core import main_orchestrator as orchestrator_module
 from on1builder.core.main_orchestrator import MainOrchestrator
 from on1builder.utils.custom_exceptions import InitializationError
 
@@ -22,7 +23,29 @@ class Worker:
         self.stop = AsyncMock()
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def service_mocks(monkeypatch):
+    """Patch every service-level collaborator of the orchestrator in one pass."""
+    mocks = {
+        "initialize_memory_optimization": AsyncMock(),
+        "cleanup_memory_optimization": AsyncMock(),
+        "MultiChainOrchestrator": lambda workers: SimpleNamespace(
+            start=AsyncMock(), stop=AsyncMock()
+        ),
+        "ExternalAPIManager": lambda: SimpleNamespace(close=AsyncMock()),
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(orchestrator_module, name, mock)
+
+    mocks["close_all_connections"] = AsyncMock()
+    monkeypatch.setattr(
+        orchestrator_module.Web3ConnectionFactory,
+        "close_all_connections",
+        mocks["close_all_connections"],
+    )
+    return mocks
+
+
 async def test_initialize_database_and_workers(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._config = SimpleNamespace(chains=[1, 2], wallet_address="0xabc")
@@ -45,7 +68,6 @@ async def test_initialize_database_and_workers(monkeypatch):
         await MainOrchestrator._initialize_workers(orch)
 
 
-@pytest.mark.asyncio
 async def test_initialize_chain_worker_and_startup_details(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._config = SimpleNamespace(wallet_address="0xabc", chains=[1])
@@ -54,15 +76,15 @@ async def test_initialize_chain_worker_and_startup_details(monkeypatch):
     worker = Worker(1)
     balance_manager = MagicMock(update_balance=AsyncMock())
 
+    monkeypatch.setattr(orchestrator_module, "ChainWorker", lambda chain_id: worker)
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.ChainWorker", lambda chain_id: worker
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.create_web3_instance",
+        orchestrator_module,
+        "create_web3_instance",
         AsyncMock(return_value="web3"),
     )
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.BalanceManager",
+        orchestrator_module,
+        "BalanceManager",
         lambda web3, address: balance_manager,
     )
 
@@ -75,8 +97,7 @@ async def test_initialize_chain_worker_and_startup_details(monkeypatch):
     assert MainOrchestrator._get_startup_details(orch)["active_chains"] == [1]
 
 
-@pytest.mark.asyncio
-async def test_start_services_send_alert_stop_and_shutdown(monkeypatch):
+async def test_start_services_send_alert_stop_and_shutdown(monkeypatch, service_mocks):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._workers = [Worker(1), Worker(2)]
     orch._balance_managers = {}
@@ -94,6 +115,7 @@ async def test_start_services_send_alert_stop_and_shutdown(monkeypatch):
         def __init__(self, coro):
             self.coro = coro
             self.cancel = MagicMock()
+            self.done = MagicMock(return_value=False)
 
         def __await__(self):
             self.coro.close()
@@ -102,30 +124,16 @@ async def test_start_services_send_alert_stop_and_shutdown(monkeypatch):
             return None
 
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.asyncio.create_task",
+        orchestrator_module.asyncio,
+        "create_task",
         lambda coro: FakeTask(coro),
     )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.MultiChainOrchestrator",
-        lambda workers: SimpleNamespace(start=AsyncMock(), stop=AsyncMock()),
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.initialize_memory_optimization", AsyncMock()
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.ExternalAPIManager",
-        lambda: SimpleNamespace(close=AsyncMock()),
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.Web3ConnectionFactory.close_all_connections",
-        AsyncMock(),
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.cleanup_memory_optimization", AsyncMock()
-    )
 
     await MainOrchestrator._start_services(orch)
     assert orch._multi_chain_orchestrator is not None
+    background_tasks = list(orch._background_tasks)
+    assert len(background_tasks) == 3
+    service_mocks["initialize_memory_optimization"].assert_awaited_once()
 
     await MainOrchestrator._send_alert(
         orch, title="hello", message="world", level="INFO", details={"x": 1}
@@ -138,9 +146,13 @@ async def test_start_services_send_alert_stop_and_shutdown(monkeypatch):
     orch._is_running = False
     await MainOrchestrator._shutdown(orch)
     orch._generate_final_report.assert_awaited_once()
+    service_mocks["close_all_connections"].assert_awaited_once()
+    service_mocks["cleanup_memory_optimization"].assert_awaited_once()
+    for task in background_tasks:
+        task.cancel.assert_called_once()
+    assert orch._background_tasks == []
 
 
-@pytest.mark.asyncio
 async def test_send_alert_failure_and_handle_critical_error(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._notification_service = SimpleNamespace(
@@ -156,7 +168,6 @@ async def test_send_alert_failure_and_handle_critical_error(monkeypatch):
     orch._send_alert.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_performance_report_health_and_final_report(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     worker = Worker(1)
@@ -186,7 +197,6 @@ async def test_performance_report_health_and_final_report(monkeypatch):
     orch._generate_performance_report.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_performance_monitor_loop_handles_success_cancel_and_error(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._is_running = True
@@ -195,7 +205,7 @@ async def test_performance_monitor_loop_handles_success_cancel_and_error(monkeyp
         side_effect=lambda: setattr(orch, "_is_running", False)
     )
     orch._check_system_health = AsyncMock()
-    monkeypatch.setattr("on1builder.core.main_orchestrator.asyncio.sleep", AsyncMock())
+    monkeypatch.setattr(orchestrator_module.asyncio, "sleep", AsyncMock())
     await MainOrchestrator._performance_monitor_loop(orch)
     orch._generate_performance_report.assert_awaited_once()
 
@@ -206,7 +216,45 @@ async def test_performance_monitor_loop_handles_success_cancel_and_error(monkeyp
     async def stop_after_error(_seconds):
         orch._is_running = False
 
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.asyncio.sleep", stop_after_error
-    )
+    monkeypatch.setattr(orchestrator_module.asyncio, "sleep", stop_after_error)
     await MainOrchestrator._performance_monitor_loop(orch)
+
+
+async def test_initialize_workers_connects_chains_concurrently():
+    orch = MainOrchestrator.__new__(MainOrchestrator)
+    orch._config = SimpleNamespace(chains=[3, 1, 2])
+    orch._workers = []
+    orch._send_alert = AsyncMock()
+    in_flight = 0
+    peak = 0
+
+    async def init_chain(chain_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * chain_id)
+        in_flight -= 1
+        orch._workers.append(Worker(chain_id))
+
+    orch._initialize_chain_worker = init_chain
+
+    await MainOrchestrator._initialize_workers(orch)
+
+    assert peak == 3
+    # Workers keep the configured chain order regardless of completion order.
+    assert [worker.chain_id for worker in orch._workers] == [3, 1, 2]
+    orch._send_alert.assert_not_awaited()
+
+
+async def test_cancel_background_tasks_reaps_all_in_one_pass():
+    orch = MainOrchestrator.__new__(MainOrchestrator)
+    finished = asyncio.create_task(asyncio.sleep(0))
+    await finished
+    blocked = [asyncio.create_task(asyncio.Event().wait()) for _ in range(5)]
+    orch._background_tasks = [finished, *blocked]
+
+    await MainOrchestrator._cancel_background_tasks(orch)
+
+    assert all(task.cancelled() for task in blocked)
+    assert not finished.cancelled()
+    assert orch._background_tasks == []
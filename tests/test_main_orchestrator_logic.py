@@ -6,8 +6,7 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
+from on1builder.core import main_orchestrator as orchestrator_module
 from on1builder.core.main_orchestrator import MainOrchestrator
 
 
@@ -28,7 +27,6 @@ class DummyBalanceManager:
         return self.eth_balance if token == "ETH" else Decimal("0")
 
 
-@pytest.mark.asyncio
 async def test_check_system_health_flags_unhealthy_and_low_balance(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._workers = [DummyWorker(1)]
@@ -43,7 +41,6 @@ async def test_check_system_health_flags_unhealthy_and_low_balance(monkeypatch):
     assert orch._send_alert.await_count >= 1
 
 
-@pytest.mark.asyncio
 async def test_main_orchestrator_startup_avoids_blocking_sleep(monkeypatch):
     def _raise_sleep(_):
         raise AssertionError("time.sleep should not be called during startup")
@@ -51,21 +48,22 @@ async def test_main_orchestrator_startup_avoids_blocking_sleep(monkeypatch):
     stub_manager = SimpleNamespace(get_config=lambda: SimpleNamespace(chains=[1]))
 
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.get_config_manager",
+        orchestrator_module,
+        "get_config_manager",
         lambda: stub_manager,
     )
+    monkeypatch.setattr(orchestrator_module, "initialize_global_config", lambda: None)
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.initialize_global_config", lambda: None
-    )
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.NotificationService",
+        orchestrator_module,
+        "NotificationService",
         lambda: SimpleNamespace(),
     )
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.DatabaseInterface",
+        orchestrator_module,
+        "DatabaseInterface",
         lambda: SimpleNamespace(),
     )
-    monkeypatch.setattr("on1builder.core.main_orchestrator.time.sleep", _raise_sleep)
+    monkeypatch.setattr(orchestrator_module.time, "sleep", _raise_sleep)
 
     orch = MainOrchestrator()
     orch._initialize_database = AsyncMock()
@@ -73,17 +71,16 @@ async def test_main_orchestrator_startup_avoids_blocking_sleep(monkeypatch):
     orch._start_services = AsyncMock()
     orch._send_alert = AsyncMock()
     orch._shutdown = AsyncMock()
+    # Pre-set so the main loop's wait() returns immediately after startup.
     orch._shutdown_event.set()
 
-    monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.asyncio.sleep",
-        AsyncMock(return_value=None),
-    )
-
     await orch.run()
 
+    assert orch._is_running is True
+    orch._start_services.assert_awaited_once()
+    orch._shutdown.assert_awaited_once()
+
 
-@pytest.mark.asyncio
 async def test_main_orchestrator_memory_optimizer_lifecycle(monkeypatch):
     orch = MainOrchestrator.__new__(MainOrchestrator)
     orch._workers = []
@@ -98,11 +95,13 @@ async def test_main_orchestrator_memory_optimizer_lifecycle(monkeypatch):
     init_memory = AsyncMock()
     cleanup_memory = AsyncMock()
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.initialize_memory_optimization",
+        orchestrator_module,
+        "initialize_memory_optimization",
         init_memory,
     )
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.cleanup_memory_optimization",
+        orchestrator_module,
+        "cleanup_memory_optimization",
         cleanup_memory,
     )
 
@@ -112,11 +111,13 @@ async def test_main_orchestrator_memory_optimizer_lifecycle(monkeypatch):
 
     orch._generate_final_report = AsyncMock()
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.ExternalAPIManager",
+        orchestrator_module,
+        "ExternalAPIManager",
         lambda: SimpleNamespace(close=AsyncMock()),
     )
     monkeypatch.setattr(
-        "on1builder.core.main_orchestrator.Web3ConnectionFactory.close_all_connections",
+        orchestrator_module.Web3ConnectionFactory,
+        "close_all_connections",
         AsyncMock(),
     )
 
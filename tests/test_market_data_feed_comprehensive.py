@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from decimal import Decimal
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -33,8 +33,7 @@ def stub_settings(monkeypatch):
 
 @pytest.fixture
 def feed(stub_settings):
-    web3 = MagicMock()
-    web3.eth = SimpleNamespace(chain_id=AwaitableValue(1))
+    web3 = SimpleNamespace(eth=SimpleNamespace(chain_id=AwaitableValue(1)))
     feed = MarketDataFeed(web3)
     feed._api_manager = MagicMock()
     feed._api_manager.close = AsyncMock()
@@ -45,12 +44,11 @@ def feed(stub_settings):
     return feed
 
 
-@pytest.mark.asyncio
 async def test_start_stop_get_price_and_persistence(feed, monkeypatch):
     class FakeTask:
         def __init__(self, coro):
             self.coro = coro
-            self.cancel = MagicMock()
+            self.cancel = Mock()
 
         def __await__(self):
             self.coro.close()
@@ -76,7 +74,6 @@ async def test_start_stop_get_price_and_persistence(feed, monkeypatch):
     feed._api_manager.close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_persist_price_handles_db_failures(feed):
     feed._persist_interval = 1
     feed._db_ready = False
@@ -89,7 +86,6 @@ async def test_persist_price_handles_db_failures(feed):
     feed._db_interface.save_market_price.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_volatility_trend_sentiment_slippage_and_avoid_trading(feed):
     now = datetime.now()
     feed._price_history["ETH"] = [
@@ -112,7 +108,6 @@ async def test_volatility_trend_sentiment_slippage_and_avoid_trading(feed):
     assert await feed.should_avoid_trading("ETH") is True
 
 
-@pytest.mark.asyncio
 async def test_get_prices_background_loops_and_analysis(feed, monkeypatch):
     feed.get_price = AsyncMock(side_effect=[Decimal("1"), Decimal("2")])
     assert await feed.get_prices(["ETH", "WETH"]) == {
@@ -147,7 +142,6 @@ async def test_get_prices_background_loops_and_analysis(feed, monkeypatch):
     feed._calculate_market_sentiment.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_sentiment_anomaly_and_summary_helpers(feed):
     now = datetime.now()
     feed._price_history = {
@@ -36,7 +36,6 @@ def stub_settings(monkeypatch):
     yield
 
 
-@pytest.mark.asyncio
 async def test_price_cache_and_blacklist(monkeypatch):
     feed = MarketDataFeed(DummyWeb3())
     feed._db_ready = True
@@ -60,7 +59,6 @@ async def test_price_cache_and_blacklist(monkeypatch):
     assert await feed.get_price("FAIL") is None
 
 
-@pytest.mark.asyncio
 async def test_price_persistence(monkeypatch):
     feed = MarketDataFeed(DummyWeb3())
     feed._persist_interval = 1
@@ -73,7 +71,6 @@ async def test_price_persistence(monkeypatch):
     feed._db_interface.save_market_price.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_volatility_and_trend_detection(monkeypatch):
     feed = MarketDataFeed(DummyWeb3())
     now = datetime.now()
@@ -91,7 +88,6 @@ async def test_volatility_and_trend_detection(monkeypatch):
     assert trend == "bullish"
 
 
-@pytest.mark.asyncio
 async def test_should_avoid_trading_based_on_volatility(monkeypatch):
     feed = MarketDataFeed(DummyWeb3())
     feed._volatility_cache["ETH_60m"] = 0.2  # high volatility
@@ -99,7 +95,6 @@ async def test_should_avoid_trading_based_on_volatility(monkeypatch):
     assert await feed.should_avoid_trading("ETH") is True
 
 
-@pytest.mark.asyncio
 async def test_resolve_chain_id_awaits_async_property():
     feed = MarketDataFeed(DummyWeb3AsyncChain())
     resolved = await feed._resolve_chain_id()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -55,7 +55,6 @@ def test_get_current_metrics_and_register_callback(monkeypatch):
     assert optimizer._cleanup_callbacks == [callback]
 
 
-@pytest.mark.asyncio
 async def test_force_cleanup_collects_stats(monkeypatch):
     optimizer = MemoryOptimizer()
 
@@ -84,14 +83,13 @@ async def test_force_cleanup_collects_stats(monkeypatch):
     assert "Failed: bad_callback" in stats["callback_results"][1]
 
 
-@pytest.mark.asyncio
 async def test_start_and_stop_monitoring(monkeypatch):
     optimizer = MemoryOptimizer()
 
     class FakeTask:
         def __init__(self, coro):
             self.coro = coro
-            self.cancel = MagicMock()
+            self.cancel = Mock()
 
         def __await__(self):
             self.coro.close()
@@ -114,7 +112,6 @@ async def test_start_and_stop_monitoring(monkeypatch):
     assert optimizer._is_running is False
 
 
-@pytest.mark.asyncio
 async def test_monitoring_loop_triggers_cleanup_and_trims_history(monkeypatch):
     optimizer = MemoryOptimizer(
         gc_threshold_mb=100, cleanup_interval_seconds=0, memory_warning_threshold=70
@@ -138,7 +135,6 @@ async def test_monitoring_loop_triggers_cleanup_and_trims_history(monkeypatch):
     assert len(optimizer._metrics_history) == 500
 
 
-@pytest.mark.asyncio
 async def test_monitoring_loop_handles_exceptions(monkeypatch):
     optimizer = MemoryOptimizer()
     optimizer._is_running = True
@@ -177,7 +173,6 @@ def test_get_memory_analytics_with_and_without_history():
     assert analytics["cleanup_info"]["monitoring_active"] is True
 
 
-@pytest.mark.asyncio
 async def test_global_memory_optimizer_helpers(monkeypatch):
     optimizer = MemoryOptimizer()
     optimizer.start_monitoring = AsyncMock()
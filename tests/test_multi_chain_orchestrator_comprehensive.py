@@ -77,7 +77,6 @@ def stub_settings(monkeypatch):
     )
 
 
-@pytest.mark.asyncio
 async def test_start_stop_and_find_cross_chain_arbitrage(monkeypatch):
     workers = [Worker(1, "2000"), Worker(137, "2100")]
     orch = MultiChainOrchestrator(workers)
@@ -149,7 +148,6 @@ def test_cooldown_and_spread_scoring_helpers(monkeypatch):
     assert opps
 
 
-@pytest.mark.asyncio
 async def test_execute_cross_chain_arbitrage_and_profit_helpers():
     orch = MultiChainOrchestrator([Worker(1, "2000"), Worker(137, "2100")])
     orch.balance_managers = {
@@ -212,7 +210,6 @@ async def test_execute_cross_chain_arbitrage_and_profit_helpers():
     )
 
 
-@pytest.mark.asyncio
 async def test_liquidity_gas_balance_analysis_and_reporting(monkeypatch):
     orch = MultiChainOrchestrator([Worker(1, "2000"), Worker(137, "2100")])
     worker = orch.workers[1]
@@ -259,3 +256,24 @@ async def test_liquidity_gas_balance_analysis_and_reporting(monkeypatch):
     ]
     await orch._generate_opportunity_analysis()
     assert orch._notification_service.send_alert.await_count >= 2
+
+
+async def test_estimate_liquidity_resolves_tokens_once_from_worker_chain():
+    orch = MultiChainOrchestrator([Worker(1, "2000"), Worker(137, "2100")])
+    worker = orch.workers[137]
+    # Any chain_id RPC would now fail; the worker's own chain id must be used.
+    worker.web3.eth = SimpleNamespace()
+    lookups = []
+    original_lookup = orch._get_token_address
+
+    async def _recording_lookup(lookup_worker, symbol):
+        lookups.append(symbol)
+        return await original_lookup(lookup_worker, symbol)
+
+    orch._get_token_address = _recording_lookup
+    orch._query_pool_liquidity = AsyncMock(return_value=Decimal("250000"))
+
+    assert await orch._estimate_liquidity(worker, "WETH") == pytest.approx(0.25)
+    assert lookups == ["WETH", "WETH", "USDC"]
+    # Two Polygon routers, each queried against the WETH and USDC pools
+    assert orch._query_pool_liquidity.await_count == 4
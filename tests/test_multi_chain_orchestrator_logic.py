@@ -82,7 +82,6 @@ def test_common_tokens_detected_across_workers():
     assert "ETH" in common
 
 
-@pytest.mark.asyncio
 async def test_analyze_price_spreads_filters_by_profit(monkeypatch):
     workers = [
         DummyWorker(1, {"ETH": Decimal("2000")}),
@@ -106,7 +105,6 @@ async def test_analyze_price_spreads_filters_by_profit(monkeypatch):
     assert all(o["estimated_gas_cost"] > 0 for o in opps)
 
 
-@pytest.mark.asyncio
 async def test_optimal_trade_size_respects_limits(monkeypatch):
     workers = [
         DummyWorker(1, {"ETH": Decimal("2000")}),
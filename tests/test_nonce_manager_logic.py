@@ -28,7 +28,6 @@ def reset_singleton():
     NonceManager.reset_instance()
 
 
-@pytest.mark.asyncio
 async def test_nonce_initialization_and_increment():
     web3 = StubWeb3([5])
     manager = NonceManager(web3, "0xabc")
@@ -40,7 +39,6 @@ async def test_nonce_initialization_and_increment():
     assert web3.eth.calls == 1  # only one chain call for initial fetch
 
 
-@pytest.mark.asyncio
 async def test_resync_refreshes_nonce_from_chain():
     web3 = StubWeb3([3, 10])
     manager = NonceManager(web3, "0xabc")
@@ -53,7 +51,6 @@ async def test_resync_refreshes_nonce_from_chain():
     assert web3.eth.calls == 2
 
 
-@pytest.mark.asyncio
 async def test_singleton_refresh_resets_cached_nonce_on_reuse():
     web3_first = StubWeb3([7])
     manager = NonceManager(web3_first, "0xabc")
@@ -1,5 +1,7 @@
+import asyncio
 from types import SimpleNamespace
 
+import aiohttp
 import pytest
 
 from on1builder.config.settings import NotificationSettings
@@ -8,12 +10,16 @@ from on1builder.utils.notification_service import NotificationService
 
 
 class _DummyResponse:
-    def __init__(self, status: int = 200, ok: bool = True):
+    def __init__(
+        self, status: int = 200, ok: bool = True, headers=None, body: str = ""
+    ):
         self.status = status
         self.ok = ok
+        self.headers = headers or {}
+        self.body = body
 
     async def text(self) -> str:
-        return ""
+        return self.body
 
     async def __aenter__(self):
         return self
@@ -32,7 +38,23 @@ class _DummySession:
         return _DummyResponse()
 
 
-@pytest.mark.asyncio
+class _ScriptedSession(_DummySession):
+    """Answers successive posts with the given statuses, responses or errors."""
+
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def post(self, url, json):
+        self.calls.append((url, json))
+        step = self.statuses.pop(0)
+        if isinstance(step, BaseException):
+            raise step
+        if isinstance(step, _DummyResponse):
+            return step
+        return _DummyResponse(status=step, ok=step == 200)
+
+
 async def test_notification_service_sends_configured_channels(monkeypatch):
     NotificationService.reset_instance()
 
@@ -98,3 +120,432 @@ async def test_notification_service_sends_configured_channels(monkeypatch):
 
     await notification_service.close()
     NotificationService.reset_instance()
+
+
+async def test_notification_session_uses_configured_pool_limits(monkeypatch):
+    NotificationService.reset_instance()
+    captured = {}
+
+    def fake_connector(**kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(**kwargs)
+
+    def fake_client_session(**kwargs):
+        captured["connector_passed"] = kwargs["connector"]
+        captured["json_serialize"] = kwargs["json_serialize"]
+        return _DummySession()
+
+    monkeypatch.setattr(notification_module.aiohttp, "TCPConnector", fake_connector)
+    monkeypatch.setattr(
+        notification_module.aiohttp, "ClientSession", fake_client_session
+    )
+
+    service = NotificationService(
+        settings_override=NotificationSettings(pool_size=250, pool_per_host=50)
+    )
+    session = await service._get_session()
+
+    assert await service._get_session() is session
+    assert captured["limit"] == 250
+    assert captured["limit_per_host"] == 50
+    assert captured["connector_passed"].limit == 250
+    assert captured["json_serialize"] is notification_module.json_dumps
+    NotificationService.reset_instance()
+
+
+async def test_smtp_connection_is_reused_until_closed(monkeypatch):
+    NotificationService.reset_instance()
+    servers = []
+
+    class FakeSMTP:
+        def __init__(self, host, port):
+            self.sent = []
+            self.quit_called = False
+            servers.append(self)
+
+        def starttls(self):
+            pass
+
+        def login(self, username, password):
+            pass
+
+        def noop(self):
+            return (250, b"OK")
+
+        def send_message(self, msg):
+            self.sent.append(msg["Subject"])
+
+        def quit(self):
+            self.quit_called = True
+
+    monkeypatch.setattr(notification_module.smtplib, "SMTP", FakeSMTP)
+
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["email"],
+            smtp_server="smtp.example.com",
+            smtp_username="alerts@example.com",
+            smtp_password="secret",
+            alert_email="ops@example.com",
+        )
+    )
+    await service._send_email("first", "body", "ERROR", None)
+    await service._send_email("second", "body", "ERROR", None)
+
+    assert len(servers) == 1
+    assert len(servers[0].sent) == 2
+
+    service._smtp_messages_sent = service.SMTP_MAX_MESSAGES_PER_CONNECTION
+    await service._send_email("third", "body", "ERROR", None)
+    assert len(servers) == 2
+    assert servers[0].quit_called is True
+
+    await service.close()
+    assert servers[1].quit_called is True
+    NotificationService.reset_instance()
+
+
+async def test_alerts_below_min_level_skip_channel_dispatch(monkeypatch):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"],
+            min_level="WARNING",
+            slack_webhook_url="https://example.com/slack",
+        )
+    )
+
+    async def fail_get_session(self):
+        raise AssertionError("filtered alerts must not open a session")
+
+    monkeypatch.setattr(NotificationService, "_get_session", fail_get_session)
+
+    await service.send_alert("noisy", "ignored", level="INFO")
+    NotificationService.reset_instance()
+
+
+def test_dispatchers_resolved_once_from_configured_channels():
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack", "telegram", "discord"],
+            slack_webhook_url="https://example.com/slack",
+            discord_webhook_url="https://example.com/discord",
+        )
+    )
+
+    # Telegram lacks a bot token and chat id, so it is dropped up front
+    assert service._dispatchers == [service._send_slack, service._send_discord]
+    NotificationService.reset_instance()
+
+
+async def test_queue_alert_returns_immediately_and_delivers_in_background(
+    monkeypatch,
+):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    delivered = []
+
+    async def fake_send_alert(self, title, message, level="ERROR", details=None):
+        delivered.append((title, level))
+
+    monkeypatch.setattr(NotificationService, "send_alert", fake_send_alert)
+    monkeypatch.setattr(NotificationService, "ALERT_QUEUE_SIZE", 1)
+
+    assert service.queue_alert("first", "body", level="ERROR") is True
+    assert service.queue_alert("second", "body", level="ERROR") is False
+    assert service.queue_alert("debug", "body", level="DEBUG") is False
+    assert delivered == []
+
+    await service._alert_queue.join()
+    assert delivered == [("first", "ERROR")]
+    assert service._dropped_alert_count == 1
+
+    worker = service._alert_worker
+    await service.close()
+    assert worker.cancelled()
+    NotificationService.reset_instance()
+
+
+async def test_close_delivers_alerts_queued_before_shutdown(monkeypatch):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    delivered = []
+
+    async def fake_send_alert(self, title, message, level="ERROR", details=None):
+        await asyncio.sleep(0)
+        delivered.append(title)
+
+    monkeypatch.setattr(NotificationService, "send_alert", fake_send_alert)
+
+    for title in ["trade 1", "trade 2", "trade 3"]:
+        assert service.queue_alert(title, "filled", level="ERROR") is True
+    await service.close()
+
+    assert delivered == ["trade 1", "trade 2", "trade 3"]
+    NotificationService.reset_instance()
+
+
+async def test_close_reports_alerts_left_after_drain_timeout(monkeypatch, caplog):
+    NotificationService.reset_instance()
+    monkeypatch.setattr(NotificationService, "ALERT_DRAIN_TIMEOUT_SECONDS", 0.01)
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    stuck = asyncio.Event()
+
+    async def fake_send_alert(self, title, message, level="ERROR", details=None):
+        await stuck.wait()
+
+    monkeypatch.setattr(NotificationService, "send_alert", fake_send_alert)
+
+    for title in ["trade 1", "trade 2", "trade 3"]:
+        service.queue_alert(title, "filled", level="ERROR")
+    worker = service._alert_worker
+    with caplog.at_level("WARNING", logger="on1builder"):
+        await service.close()
+
+    assert worker.cancelled()
+    assert "closing with 2 queued alerts undelivered" in caplog.text
+    NotificationService.reset_instance()
+
+
+async def test_queue_alert_restarts_worker_on_existing_queue(monkeypatch):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    delivered = []
+
+    async def fake_send_alert(self, title, message, level="ERROR", details=None):
+        delivered.append(title)
+
+    monkeypatch.setattr(NotificationService, "send_alert", fake_send_alert)
+
+    service.queue_alert("first", "body", level="ERROR")
+    queue = service._alert_queue
+    service._alert_worker.cancel()
+    await asyncio.gather(service._alert_worker, return_exceptions=True)
+
+    service.queue_alert("second", "body", level="ERROR")
+    assert service._alert_queue is queue
+    await service.close()
+
+    assert delivered == ["first", "second"]
+    NotificationService.reset_instance()
+
+
+async def test_identical_alerts_are_collapsed_within_window(monkeypatch):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    dummy_session = _DummySession()
+
+    async def fake_get_session(self):
+        return dummy_session
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(notification_module.time, "monotonic", lambda: clock.now)
+
+    for _ in range(3):
+        await service.send_alert("Reorg", "chain 1 reorg", level="ERROR")
+    await service.send_alert("Reorg", "chain 137 reorg", level="ERROR")
+    assert len(dummy_session.calls) == 2
+
+    clock.now += service.ALERT_DEDUP_WINDOW_SECONDS
+    await service.send_alert("Reorg", "chain 1 reorg", level="ERROR")
+
+    assert len(dummy_session.calls) == 3
+    section = dummy_session.calls[-1][1]["attachments"][0]["blocks"][1]["text"]
+    assert section["text"] == "chain 1 reorg (x3 since last alert)"
+    await service.close()
+    NotificationService.reset_instance()
+
+
+async def test_suppressed_duplicates_are_summarized_on_close(monkeypatch):
+    NotificationService.reset_instance()
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    dummy_session = _DummySession()
+
+    async def fake_get_session(self):
+        return dummy_session
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+
+    for _ in range(3):
+        await service.send_alert("Reorg", "chain 1 reorg", level="ERROR")
+    assert len(dummy_session.calls) == 1
+
+    await service.close()
+
+    assert len(dummy_session.calls) == 2
+    section = dummy_session.calls[-1][1]["attachments"][0]["blocks"][1]["text"]
+    assert section["text"] == "chain 1 reorg (duplicates suppressed: 2)"
+    NotificationService.reset_instance()
+
+
+async def test_suppressed_duplicates_are_flushed_after_window(monkeypatch):
+    NotificationService.reset_instance()
+    monkeypatch.setattr(NotificationService, "ALERT_DEDUP_WINDOW_SECONDS", 0.01)
+    service = NotificationService(
+        settings_override=NotificationSettings(
+            channels=["slack"], slack_webhook_url="https://example.com/slack"
+        )
+    )
+    dummy_session = _DummySession()
+
+    async def fake_get_session(self):
+        return dummy_session
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+
+    await service.send_alert("Reorg", "chain 1 reorg", level="ERROR")
+    await service.send_alert(
+        "Reorg", "chain 1 reorg", level="ERROR", details={"block": 2}
+    )
+    await asyncio.wait_for(service._dedup_flush_task, timeout=1)
+
+    assert len(dummy_session.calls) == 2
+    blocks = dummy_session.calls[-1][1]["attachments"][0]["blocks"]
+    assert blocks[1]["text"]["text"] == "chain 1 reorg (duplicates suppressed: 1)"
+    assert "`2`" in blocks[3]["text"]["text"]
+    await service.close()
+    assert len(dummy_session.calls) == 2
+    NotificationService.reset_instance()
+
+
+@pytest.mark.parametrize(
+    "statuses,expected_result,expected_posts",
+    [
+        pytest.param([429, 503, 200], True, 3, id="recovers-after-throttling"),
+        pytest.param([429, 429, 429], False, 3, id="gives-up-after-max-attempts"),
+        pytest.param([400], False, 1, id="client-error-not-retried"),
+    ],
+)
+async def test_webhook_post_retries_transient_statuses(
+    monkeypatch, statuses, expected_result, expected_posts
+):
+    NotificationService.reset_instance()
+    service = NotificationService(settings_override=NotificationSettings())
+    session = _ScriptedSession(statuses)
+    delays = []
+
+    async def fake_get_session(self):
+        return session
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+    monkeypatch.setattr(notification_module.asyncio, "sleep", fake_sleep)
+
+    result = await service._post_webhook("Telegram", "https://example.com", {})
+
+    assert result is expected_result
+    assert len(session.calls) == expected_posts
+    assert delays == [0.2 * 2**i for i in range(expected_posts - 1)]
+    NotificationService.reset_instance()
+
+
+@pytest.mark.parametrize(
+    "response,expected_delay",
+    [
+        pytest.param(
+            _DummyResponse(429, ok=False, headers={"Retry-After": "3"}),
+            3.0,
+            id="retry-after-header",
+        ),
+        pytest.param(
+            _DummyResponse(
+                429, ok=False, body='{"ok":false,"parameters":{"retry_after":7}}'
+            ),
+            7.0,
+            id="telegram-retry-after",
+        ),
+        pytest.param(
+            _DummyResponse(429, ok=False, headers={"Retry-After": "600"}),
+            NotificationService.WEBHOOK_MAX_RETRY_AFTER,
+            id="capped",
+        ),
+    ],
+)
+async def test_webhook_post_waits_for_requested_retry_after(
+    monkeypatch, response, expected_delay
+):
+    NotificationService.reset_instance()
+    service = NotificationService(settings_override=NotificationSettings())
+    session = _ScriptedSession([response, 200])
+    delays = []
+
+    async def fake_get_session(self):
+        return session
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+    monkeypatch.setattr(notification_module.asyncio, "sleep", fake_sleep)
+
+    assert await service._post_webhook("Telegram", "https://example.com", {}) is True
+    assert delays == [expected_delay]
+    NotificationService.reset_instance()
+
+
+@pytest.mark.parametrize(
+    "steps,expected_result",
+    [
+        pytest.param(
+            [aiohttp.ClientConnectionError("reset"), asyncio.TimeoutError(), 200],
+            True,
+            id="recovers-after-connection-errors",
+        ),
+        pytest.param(
+            [aiohttp.ClientConnectionError("reset")] * 3,
+            False,
+            id="gives-up-after-max-attempts",
+        ),
+    ],
+)
+async def test_webhook_post_retries_connection_errors(
+    monkeypatch, steps, expected_result
+):
+    NotificationService.reset_instance()
+    service = NotificationService(settings_override=NotificationSettings())
+    session = _ScriptedSession(steps)
+    delays = []
+
+    async def fake_get_session(self):
+        return session
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(NotificationService, "_get_session", fake_get_session)
+    monkeypatch.setattr(notification_module.asyncio, "sleep", fake_sleep)
+
+    result = await service._post_webhook("Slack", "https://example.com", {})
+
+    assert result is expected_result
+    assert len(session.calls) == 3
+    assert delays == [0.2, 0.4]
+    NotificationService.reset_instance()
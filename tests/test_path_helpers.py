@@ -94,25 +94,21 @@ def test_get_strategy_weights_path():
     assert "strategy_weights.json" in str(path)
 
 
-def test_ensure_dir_exists():
+def test_ensure_dir_exists(tmp_path):
     """Test ensure_dir_exists function."""
-    import tempfile
-
     from on1builder.utils.path_helpers import ensure_dir_exists
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        test_dir = temp_path / "test_dir"
-        test_file = test_dir / "test_file.txt"
+    test_dir = tmp_path / "test_dir"
+    test_file = test_dir / "test_file.txt"
 
-        # Ensure directory creation for a file path
-        ensure_dir_exists(test_file)
-        assert test_dir.exists()
+    # Ensure directory creation for a file path
+    ensure_dir_exists(test_file)
+    assert test_dir.exists()
 
-        # Ensure directory creation for a directory path
-        test_dir2 = temp_path / "test_dir2"
-        ensure_dir_exists(test_dir2)
-        assert test_dir2.exists()
+    # Ensure directory creation for a directory path
+    test_dir2 = tmp_path / "test_dir2"
+    ensure_dir_exists(test_dir2)
+    assert test_dir2.exists()
 
 
 def test_get_monitored_tokens_path_fallback():
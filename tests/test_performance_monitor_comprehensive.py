@@ -5,8 +5,6 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from on1builder.monitoring import performance_monitor as perf_module
 from on1builder.monitoring.performance_monitor import (
     ChainMetrics,
@@ -26,7 +24,6 @@ def test_performance_metrics_properties():
     assert metrics.net_profit_eth == Decimal("1.5")
 
 
-@pytest.mark.asyncio
 async def test_start_stop_and_monitoring_loop(monkeypatch):
     monitor = PerformanceMonitor(collection_interval=1)
 
@@ -56,7 +53,6 @@ async def test_start_stop_and_monitoring_loop(monkeypatch):
     monitor._collect_metrics.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_collect_metrics_cleanup_and_chain_updates(monkeypatch):
     monitor = PerformanceMonitor()
     monkeypatch.setattr(perf_module.psutil, "cpu_percent", lambda interval=1: 20.0)
@@ -120,7 +116,6 @@ def test_record_transaction_summary_and_health():
     assert health["status"] in {"degraded", "unhealthy"}
 
 
-@pytest.mark.asyncio
 async def test_generate_report_formats_output():
     monitor = PerformanceMonitor()
     metric = PerformanceMetrics(
@@ -70,7 +70,6 @@ def calculator(monkeypatch):
     return calc
 
 
-@pytest.mark.asyncio
 async def test_calculate_transaction_profit_success_and_error(calculator):
     receipt = Receipt(logs=[1], gasUsed=21_000)
     transaction = {"gasPrice": 100}
@@ -98,7 +97,6 @@ def test_calculate_gas_cost_prefers_effective_gas_price(calculator):
     assert calculator._calculate_gas_cost(receipt, tx) == Decimal(500) / Decimal(10**18)
 
 
-@pytest.mark.asyncio
 async def test_parse_token_movements_dispatches_known_log_types(calculator):
     transfer_log = Log(topics=[Topic(calculator._event_signatures["Transfer"])])
     swap_log = Log(topics=[Topic(calculator._event_signatures["Swap"])])
@@ -114,7 +112,6 @@ async def test_parse_token_movements_dispatches_known_log_types(calculator):
     assert [entry["type"] for entry in result] == ["transfer", "swap", "flash_loan"]
 
 
-@pytest.mark.asyncio
 async def test_parse_transfer_log_success_and_invalid_topics(calculator):
     calculator._get_token_decimals = AsyncMock(return_value=6)
     calculator._convert_token_to_usd = AsyncMock(return_value=Decimal("12.5"))
@@ -142,7 +139,6 @@ async def test_parse_transfer_log_success_and_invalid_topics(calculator):
     assert await calculator._parse_transfer_log(Log(topics=[Topic("0x1")])) is None
 
 
-@pytest.mark.asyncio
 async def test_parse_swap_log_v2_v3_unknown_and_decode_error(calculator, monkeypatch):
     monkeypatch.setitem(
         sys.modules,
@@ -183,7 +179,6 @@ async def test_parse_swap_log_v2_v3_unknown_and_decode_error(calculator, monkeyp
     assert await calculator._parse_swap_log(v2_log) is None
 
 
-@pytest.mark.asyncio
 async def test_parse_flash_loan_log(calculator):
     log = Log(topics=[], address="0xflash", block_number=7, log_index=2)
     assert await calculator._parse_flash_loan_log(log) == {
@@ -194,7 +189,6 @@ async def test_parse_flash_loan_log(calculator):
     }
 
 
-@pytest.mark.asyncio
 async def test_analyze_profit_by_strategy_uses_wallet_and_chain_specific_settings(
     calculator,
 ):
@@ -235,7 +229,6 @@ async def test_analyze_profit_by_strategy_uses_wallet_and_chain_specific_setting
     )
 
 
-@pytest.mark.asyncio
 async def test_strategy_specific_analysis_branches(calculator):
     net_positive = {"ETH": Decimal("1")}
     movements = [{"type": "swap"}, {"type": "flash_loan"}]
@@ -259,7 +252,6 @@ async def test_strategy_specific_analysis_branches(calculator):
     )["liquidation_bonus_estimated"] is True
 
 
-@pytest.mark.asyncio
 async def test_get_token_decimals_cache_registry_contract_and_fallback(calculator):
     calculator._token_decimals_cache["0xcached"] = 9
     assert await calculator._get_token_decimals("0xCached") == 9
@@ -283,7 +275,6 @@ async def test_get_token_decimals_cache_registry_contract_and_fallback(calculato
     assert await calculator._get_token_decimals("0xjkl") == 18
 
 
-@pytest.mark.asyncio
 async def test_convert_token_and_eth_to_usd_paths(calculator):
     calculator._get_token_price_usd = AsyncMock(
         side_effect=[2.5, 0, 0, 0, RuntimeError("bad"), 3000, 0, RuntimeError("no eth")]
@@ -303,7 +294,6 @@ async def test_convert_token_and_eth_to_usd_paths(calculator):
     assert await calculator._convert_token_to_usd(Decimal("0"), None) == Decimal("0")
 
 
-@pytest.mark.asyncio
 async def test_calculate_flash_loan_profit_and_summary(calculator):
     calculator.calculate_transaction_profit = AsyncMock(
         side_effect=[
@@ -341,7 +331,6 @@ async def test_calculate_flash_loan_profit_and_summary(calculator):
     assert summary["strategy_breakdown"]["unknown"]["trade_count"] == 2
 
 
-@pytest.mark.asyncio
 async def test_get_profit_summary_handles_internal_errors_and_price_lookup(calculator):
     calculator.calculate_transaction_profit = AsyncMock(
         side_effect=RuntimeError("boom")
@@ -32,7 +32,6 @@ class DummyWeb3:
         return int(value * 10**9) if unit == "gwei" else value
 
 
-@pytest.mark.asyncio
 async def test_safety_guard_blocks_unsafe_tx(monkeypatch):
     from on1builder.core.transaction_manager import TransactionManager
 
@@ -64,7 +63,6 @@ async def test_safety_guard_blocks_unsafe_tx(monkeypatch):
         )
 
 
-@pytest.mark.asyncio
 async def test_gas_price_rejects_when_profit_too_low(monkeypatch):
     from on1builder.core.transaction_manager import TransactionManager
 
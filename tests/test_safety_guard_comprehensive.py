@@ -56,7 +56,6 @@ def guard(stub_settings):
     )
 
 
-@pytest.mark.asyncio
 async def test_check_transaction_short_circuits_when_circuit_broken(guard):
     guard._circuit_broken = True
     guard._circuit_break_reason = "too many failures"
@@ -66,7 +65,6 @@ async def test_check_transaction_short_circuits_when_circuit_broken(guard):
     assert "too many failures" in reason
 
 
-@pytest.mark.asyncio
 async def test_balance_checks_cover_bypass_and_failure_paths(stub_settings, guard):
     stub_settings.allow_insufficient_funds_tests = True
     assert await guard._check_balance({}) == (
@@ -102,7 +100,6 @@ async def test_balance_checks_cover_bypass_and_failure_paths(stub_settings, guar
     assert guard._get_dynamic_reserve(1.0) == 0.1
 
 
-@pytest.mark.asyncio
 async def test_gas_price_limit_checks_cover_dynamic_static_and_eip1559(
     guard, stub_settings
 ):
@@ -124,7 +121,6 @@ async def test_gas_price_limit_checks_cover_dynamic_static_and_eip1559(
     assert ok is True and "accepted limits" in reason
 
 
-@pytest.mark.asyncio
 async def test_gas_limit_duplicate_rate_profit_and_market_checks(guard):
     assert await guard._check_gas_limit({}) == (
         True,
@@ -175,6 +171,17 @@ async def test_gas_limit_duplicate_rate_profit_and_market_checks(guard):
     assert ok is True and "skipped" in reason.lower()
 
 
+def test_recent_signatures_evict_oldest_beyond_cap(guard, monkeypatch):
+    monkeypatch.setattr(SafetyGuard, "MAX_RECENT_TX_SIGNATURES", 3)
+    for signature in ["a", "b", "c"]:
+        guard._remember_signature(signature)
+
+    guard._remember_signature("a")
+    guard._remember_signature("d")
+
+    assert list(guard._recent_tx_signatures) == ["c", "a", "d"]
+
+
 def test_record_and_reset_helpers_and_stats(guard, monkeypatch):
     guard._record_failed_check("balance")
     guard.record_gas_spent(0.2)
@@ -184,7 +191,6 @@ def test_record_and_reset_helpers_and_stats(guard, monkeypatch):
     guard._reset_hourly_gas_if_needed()
     assert guard._gas_spent_last_hour == 0.0
 
-    guard._recent_tx_signatures = set(range(1002))
     guard._circuit_broken = True
     guard._circuit_break_reason = "x"
     guard._failed_tx_count = 3
@@ -202,7 +208,6 @@ def test_record_and_reset_helpers_and_stats(guard, monkeypatch):
     assert "check_distribution" in perf
 
 
-@pytest.mark.asyncio
 async def test_trip_circuit_breaker_and_auto_reset_property(guard, monkeypatch):
     await guard.trip_circuit_breaker("danger")
     assert guard._circuit_broken is True
@@ -212,7 +217,6 @@ async def test_trip_circuit_breaker_and_auto_reset_property(guard, monkeypatch):
     assert guard.is_circuit_broken is False
 
 
-@pytest.mark.asyncio
 async def test_check_transaction_runs_checks_and_handles_exceptions(guard):
     guard._reset_hourly_gas_if_needed = MagicMock()
     guard._check_balance = AsyncMock(return_value=(True, "ok"))
@@ -22,7 +22,7 @@ def test_load_env_values_format_apply_and_redaction(tmp_path):
     env1.write_text("A=1\nB='two words'\n# comment\n", encoding="utf-8")
     env2.write_text("C=3\n", encoding="utf-8")
 
-    values = setup_wizard._load_env_values([env1, env2])
+    values = setup_wizard._load_env_values([env1, env2, tmp_path / "missing.env"])
     assert values == {"A": "1", "B": "two words", "C": "3"}
     assert setup_wizard._format_env_value("two words", quoted=False) == '"two words"'
     assert (
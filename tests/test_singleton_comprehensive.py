@@ -94,7 +94,6 @@ def test_singleton_registry_registers_gets_has_and_resets():
         registry.get("missing")
 
 
-@pytest.mark.asyncio
 async def test_singleton_registry_shutdown_all_handles_async_sync_and_errors():
     registry = SingletonRegistry()
     async_instance = MagicMock()
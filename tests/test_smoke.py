@@ -6,6 +6,7 @@ Basic smoke tests for ON1Builder package.
 These tests verify that the package can be imported and basic functionality works.
 """
 
+import importlib
 from pathlib import Path
 
 import pytest
@@ -22,38 +23,38 @@ def test_package_import():
         pytest.fail(f"Failed to import on1builder package: {e}")
 
 
-def test_cli_import():
-    """Test that the CLI module can be imported."""
-    try:
-        from on1builder.__main__ import cli
-
-        assert callable(cli)
-    except ImportError as e:
-        pytest.fail(f"Failed to import CLI: {e}")
-
-
-def test_config_import():
-    """Test that config modules can be imported."""
-    try:
-        from on1builder.config.settings import APISettings, GlobalSettings
-
-        assert GlobalSettings is not None
-        assert APISettings is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import config modules: {e}")
-
-
-def test_utils_import():
-    """Test that utility modules can be imported."""
-    try:
-        from on1builder.utils.custom_exceptions import ConfigurationError
-        from on1builder.utils.logging_config import get_logger
-
-        logger = get_logger("test")
-        assert logger is not None
-        assert ConfigurationError is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import utils: {e}")
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "on1builder.__main__",
+        "on1builder.config",
+        "on1builder.config.settings",
+        "on1builder.core",
+        "on1builder.engines",
+        "on1builder.integrations",
+        "on1builder.monitoring",
+        "on1builder.persistence",
+        "on1builder.utils",
+        "on1builder.utils.custom_exceptions",
+        "on1builder.utils.logging_config",
+    ],
+)
+def test_module_import(module_name):
+    """Test that each public module imports cleanly."""
+    module = importlib.import_module(module_name)
+    assert hasattr(module, "__file__")
+
+
+def test_entry_points_resolve():
+    """Test that the CLI, settings and logger entry points are usable."""
+    from on1builder.__main__ import cli
+    from on1builder.config.settings import APISettings, GlobalSettings
+    from on1builder.utils.logging_config import get_logger
+
+    assert callable(cli)
+    assert GlobalSettings is not None
+    assert APISettings is not None
+    assert get_logger("test") is not None
 
 
 def test_resource_files_exist():
@@ -97,22 +98,5 @@ def test_container_utility():
     assert container is not None
 
 
-def test_basic_module_structure():
-    """Test that basic module structure is intact."""
-    import on1builder.config
-    import on1builder.core
-    import on1builder.engines
-    import on1builder.integrations
-    import on1builder.monitoring
-    import on1builder.persistence
-    import on1builder.utils
-
-    assert hasattr(on1builder.utils, "__file__")
-    assert hasattr(on1builder.core, "__file__")
-    assert hasattr(on1builder.config, "__file__")
-    assert hasattr(on1builder.engines, "__file__")
-    assert hasattr(on1builder.monitoring, "__file__")
-
-
 if __name__ == "__main__":
     pytest.main([__file__])
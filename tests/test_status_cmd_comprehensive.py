@@ -47,7 +47,6 @@ def stub_settings(monkeypatch):
     return settings
 
 
-@pytest.mark.asyncio
 async def test_check_comprehensive_status_builds_rows(monkeypatch, stub_settings):
     printed = []
     monkeypatch.setattr(status_cmd.console, "print", lambda obj: printed.append(obj))
@@ -116,13 +115,12 @@ async def test_check_comprehensive_status_builds_rows(monkeypatch, stub_settings
     db.close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_show_balance_analysis_and_strategy_configuration(
     monkeypatch, stub_settings
 ):
     printed = []
     monkeypatch.setattr(status_cmd.console, "print", lambda obj: printed.append(obj))
-    web3 = MagicMock()
+    web3 = SimpleNamespace()
     monkeypatch.setattr(
         status_cmd.Web3ConnectionFactory,
         "create_connection",
@@ -47,6 +47,10 @@ class Resp:
 class Session:
     def __init__(self, responses):
         self.responses = list(responses)
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
 
     async def __aenter__(self):
         return self
@@ -102,6 +106,7 @@ def build_manager(base_path: Path | None = None):
     )
     tm._web3.from_wei = lambda value, unit: Decimal(value) / Decimal(10**18)
     tm._address = "0xabc"  # type: ignore[assignment]
+    tm._http_session = None
     tm._chain_id = 1
     tm._account = SimpleNamespace(  # type: ignore[assignment]
         sign_transaction=lambda params: SimpleNamespace(
@@ -122,7 +127,7 @@ def build_manager(base_path: Path | None = None):
     tm._db_interface = SimpleNamespace(  # type: ignore[assignment]
         save_transaction=AsyncMock(), save_profit_record=AsyncMock()
     )
-    tm._notification_service = SimpleNamespace(send_alert=AsyncMock())  # type: ignore[assignment]
+    tm._notification_service = SimpleNamespace(queue_alert=MagicMock())  # type: ignore[assignment]
     tm._gas_optimizer = SimpleNamespace(initialize=AsyncMock())  # type: ignore[assignment]
     tm._abi_registry = SimpleNamespace(  # type: ignore[assignment]
         get_abi=lambda name: [{"name": name}],
@@ -153,7 +158,6 @@ def build_manager(base_path: Path | None = None):
     return tm
 
 
-@pytest.mark.asyncio
 async def test_initialize_build_transaction_and_wait_for_receipt(
     monkeypatch, stub_settings, tmp_path
 ):
@@ -174,7 +178,6 @@ async def test_initialize_build_transaction_and_wait_for_receipt(
     assert (await tm.wait_for_receipt("0xtx", timeout=5))["status"] == 1
 
 
-@pytest.mark.asyncio
 async def test_sign_and_send_modes_and_retry_paths(
     monkeypatch, stub_settings, tmp_path
 ):
@@ -214,25 +217,20 @@ async def test_sign_and_send_modes_and_retry_paths(
     assert tm._nonce_manager.resync_nonce.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_private_bundle_signer_and_simulation_helpers(
     monkeypatch, stub_settings, tmp_path
 ):
     tm = build_manager(tmp_path)
-    sessions = iter(
+    session = Session(
         [
-            Session([Resp({"error": {"message": "nope"}}, 400)]),
-            Session([Resp({"result": "0xraw"})]),
+            Resp({"error": {"message": "nope"}}, 400),
+            Resp({"result": "0xraw"}),
         ]
     )
-    monkeypatch.setattr(tm_module.aiohttp, "ClientSession", lambda: next(sessions))
+    tm._http_session = session
     assert await tm._send_private_transaction(b"raw") == "0xraw"
 
-    monkeypatch.setattr(
-        tm_module.aiohttp,
-        "ClientSession",
-        lambda: Session([Resp({"result": {"bundleHash": "0xbh"}})]),
-    )
+    session.responses.append(Resp({"result": {"bundleHash": "0xbh"}}))
     original_getter = TransactionManager._get_bundle_signer_account
     monkeypatch.setattr(
         TransactionManager,
@@ -264,20 +262,35 @@ async def test_private_bundle_signer_and_simulation_helpers(
 
     await tm._simulate_transaction({"from": "0xabc", "to": "0xdef", "nonce": 1})
     stub_settings.simulation_backend = "anvil"
-    monkeypatch.setattr(
-        tm_module.aiohttp, "ClientSession", lambda: Session([Resp({"result": "ok"})])
-    )
+    session.responses.append(Resp({"result": "ok"}))
     await tm._simulate_transaction({"from": "0xabc", "to": "0xdef", "nonce": 1})
     stub_settings.simulation_backend = "tenderly"
-    monkeypatch.setattr(
-        tm_module.aiohttp,
-        "ClientSession",
-        lambda: Session([Resp({"simulation": True})]),
-    )
+    session.responses.append(Resp({"simulation": True}))
     await tm._simulate_transaction({"from": "0xabc", "to": "0xdef", "nonce": 1})
+    assert session.responses == []
+    assert tm._http_session is session
+
+
+async def test_http_session_is_created_lazily_and_closed(monkeypatch, tmp_path):
+    tm = build_manager(tmp_path)
+    created = []
+
+    def _make_session():
+        created.append(Session([]))
+        return created[-1]
+
+    monkeypatch.setattr(tm_module.aiohttp, "ClientSession", _make_session)
+
+    first = await tm._get_http_session()
+    assert await tm._get_http_session() is first
+
+    await tm.close()
+    assert first.closed is True
+    assert tm._http_session is None
+    assert await tm._get_http_session() is not first
+    assert len(created) == 2
 
 
-@pytest.mark.asyncio
 async def test_dex_path_and_swap_helpers(stub_settings, tmp_path):
     tm = build_manager(tmp_path)
     dex_contract = MagicMock()
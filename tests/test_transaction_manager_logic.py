@@ -3,7 +3,7 @@
 import asyncio
 from decimal import Decimal
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest import approx
@@ -71,7 +71,7 @@ def build_manager(override_sign_send: bool = True):
         save_profit_record=AsyncMock(return_value=None),
     )
     tm._notification_service = SimpleNamespace(  # type: ignore[assignment]
-        send_alert=AsyncMock(return_value=None)
+        queue_alert=Mock(return_value=True)
     )
     tm._execution_stats = {
         "total_transactions": 0,
@@ -113,7 +113,6 @@ def test_encode_uniswap_v3_path():
     assert encoded[23:].hex() == tokens[1][2:]
 
 
-@pytest.mark.asyncio
 async def test_build_transaction_rejects_gas_price_over_cap(monkeypatch):
     stub_settings = SimpleNamespace(
         dynamic_gas_pricing=False,
@@ -133,7 +132,6 @@ async def test_build_transaction_rejects_gas_price_over_cap(monkeypatch):
         await tm._build_transaction(to="0xdef", value=0)
 
 
-@pytest.mark.asyncio
 async def test_build_transaction_blocks_when_gas_unprofitable(monkeypatch):
     stub_settings = SimpleNamespace(
         dynamic_gas_pricing=True,
@@ -155,7 +153,6 @@ async def test_build_transaction_blocks_when_gas_unprofitable(monkeypatch):
         await tm._build_transaction(to="0xdef", value=0)
 
 
-@pytest.mark.asyncio
 async def test_build_transaction_falls_back_to_default_gas(monkeypatch):
     stub_settings = SimpleNamespace(
         dynamic_gas_pricing=False,
@@ -177,7 +174,6 @@ async def test_build_transaction_falls_back_to_default_gas(monkeypatch):
     assert tx_params["gas"] == stub_settings.default_gas_limit
 
 
-@pytest.mark.asyncio
 async def test_execute_and_confirm_tracks_profit_net_of_gas():
     tm = build_manager()
     tx_params = {"to": "0xdef", "value": 0, "gasPrice": 10 * 10**9, "gas": 100000}
@@ -191,7 +187,6 @@ async def test_execute_and_confirm_tracks_profit_net_of_gas():
     tm._db_interface.save_profit_record.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_execute_and_confirm_adds_profit_analysis_when_enabled(monkeypatch):
     tm = build_manager()
     tm._profit_calculator = SimpleNamespace(
@@ -211,7 +206,6 @@ async def test_execute_and_confirm_adds_profit_analysis_when_enabled(monkeypatch
     )
 
 
-@pytest.mark.asyncio
 async def test_execute_and_confirm_passes_expected_profit_to_send():
     tm = build_manager()
     captured = {}
@@ -228,7 +222,6 @@ async def test_execute_and_confirm_passes_expected_profit_to_send():
     assert captured.get("expected_profit_eth") == 0.05
 
 
-@pytest.mark.asyncio
 async def test_execute_and_confirm_reports_error_recovery(monkeypatch):
     tm = build_manager()
     tm._sign_and_send = AsyncMock(side_effect=StrategyExecutionError("boom"))
@@ -246,7 +239,6 @@ async def test_execute_and_confirm_reports_error_recovery(monkeypatch):
     recovery.handle_error.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_execute_and_confirm_retries_after_recovery(monkeypatch):
     tm = build_manager()
     tm._sign_and_send = AsyncMock(
@@ -279,7 +271,6 @@ async def test_execute_and_confirm_retries_after_recovery(monkeypatch):
     assert tm._sign_and_send.await_count == 2
 
 
-@pytest.mark.asyncio
 async def test_sign_and_send_raises_when_safety_fails():
     tm = build_manager(override_sign_send=False)
     tm._safety_guard.check_transaction = AsyncMock(return_value=(False, "blocked"))
@@ -297,7 +288,6 @@ async def test_sign_and_send_raises_when_safety_fails():
         await tm._sign_and_send(tx_params)
 
 
-@pytest.mark.asyncio
 async def test_sign_and_send_bypasses_balance_checks_when_flag(monkeypatch):
     stub_settings = SimpleNamespace(
         allow_insufficient_funds_tests=True,
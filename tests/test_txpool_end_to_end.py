@@ -1,14 +1,35 @@
 """End-to-end tests for txpool scanning and strategy selection."""
 
+import asyncio
 from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import eth_abi
 import pytest
 
 from on1builder.engines.strategy_executor import StrategyExecutor
+from on1builder.monitoring import txpool_scanner as txpool_module
 from on1builder.monitoring.txpool_scanner import TxPoolScanner
 
+V2_ROUTER = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+V3_ROUTER = "0x1f98431c8ad98523631ae4a59f267346ea31f984"
+
+# swapExactTokensForTokens calldata shared by the Uniswap V2 scanner tests.
+V2_AMOUNT_IN = 2 * 10**18
+V2_SWAP_PATH = ["0x" + "1" * 40, "0x" + "2" * 40]
+V2_SWAP_INPUT = bytes.fromhex("38ed1739") + eth_abi.encode(
+    ["uint256", "uint256", "address[]", "address", "uint256"],
+    [V2_AMOUNT_IN, 1 * 10**18, V2_SWAP_PATH, "0x" + "3" * 40, 1_700_000_000],
+)
+
+# Token map mixing an uppercase 0X prefix, mixed case, and a non-address entry.
+MIXED_MONITORED_TOKENS = {
+    "WETH": "0X789ABC456DEF",
+    "USDC": "0xAbC123",
+    "BAD": "not-an-address",
+}
+
 
 class DummyBalanceManager:
     def __init__(self, summary):
@@ -67,22 +88,27 @@ class DummyABIRegistry:
         return {}
 
 
-@pytest.mark.asyncio
-async def test_txpool_scanner_executes_selected_strategies(monkeypatch):
-    router_address = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+@pytest.fixture
+def scanner_settings(monkeypatch):
+    """Private-endpoint scanner settings with both Uniswap routers on chain 1."""
     stub_settings = SimpleNamespace(
-        contracts=SimpleNamespace(uniswap_v2_router={"1": router_address}),
+        contracts=SimpleNamespace(
+            uniswap_v2_router={"1": V2_ROUTER}, uniswap_v3_router={"1": V3_ROUTER}
+        ),
         chains=[1],
         websocket_urls={1: "ws://private"},
         rpc_urls={1: "http://private"},
         allow_unsimulated_trades=True,
         connection_retry_delay=0.1,
     )
-    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
-    monkeypatch.setattr(
-        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
-    )
+    monkeypatch.setattr(txpool_module, "settings", stub_settings)
+    monkeypatch.setattr(txpool_module, "ABIRegistry", DummyABIRegistry)
+    return stub_settings
+
 
+async def test_txpool_scanner_executes_selected_strategies(
+    monkeypatch, scanner_settings
+):
     strategy_settings = SimpleNamespace(
         ml_exploration_rate=0.0,
         ml_learning_rate=0.01,
@@ -100,30 +126,14 @@ async def test_txpool_scanner_executes_selected_strategies(monkeypatch):
         "on1builder.engines.strategy_executor.settings", strategy_settings
     )
 
-    import eth_abi
-
-    amount_in = 2 * 10**18
-    amount_out_min = 1 * 10**18
-    path = [
-        "0x" + "1" * 40,
-        "0x" + "2" * 40,
-    ]
-    recipient = "0x" + "3" * 40
-    deadline = 1_700_000_000
-    encoded = eth_abi.encode(
-        ["uint256", "uint256", "address[]", "address", "uint256"],
-        [amount_in, amount_out_min, path, recipient, deadline],
-    )
-    tx_input = bytes.fromhex("38ed1739" + encoded.hex())
-
     tx = {
         "hash": bytes.fromhex("11" * 32),
         "from": "0xdead",
-        "to": router_address,
+        "to": V2_ROUTER,
         "value": 6 * 10**18,
         "gasPrice": 60 * 10**9,
         "gas": 21000,
-        "input": tx_input,
+        "input": V2_SWAP_INPUT,
     }
     web3 = DummyWeb3(tx)
     balance_summary = {
@@ -150,34 +160,19 @@ async def test_txpool_scanner_executes_selected_strategies(monkeypatch):
             assert target_tx.get("gasPrice") == tx["gasPrice"]
             assert target_tx.get("hash") == tx["hash"].hex()
         assert opportunity.get("dex") == "uniswap_v2"
-        assert opportunity.get("path") == path
-        assert opportunity.get("amount_in") == amount_in
+        assert opportunity.get("path") == V2_SWAP_PATH
+        assert opportunity.get("amount_in") == V2_AMOUNT_IN
         assert opportunity.get("profit_potential", 0) > 0
         assert opportunity.get("expected_profit_eth") == opportunity.get(
             "estimated_profit_eth"
         )
 
 
-@pytest.mark.asyncio
-async def test_txpool_scanner_normalizes_input_data_string(monkeypatch):
-    router_address = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
-    stub_settings = SimpleNamespace(
-        contracts=SimpleNamespace(uniswap_v2_router={"1": router_address}),
-        chains=[1],
-        websocket_urls={1: "ws://private"},
-        rpc_urls={1: "http://private"},
-        allow_unsimulated_trades=True,
-        connection_retry_delay=0.1,
-    )
-    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
-    monkeypatch.setattr(
-        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
-    )
-
+def test_txpool_scanner_normalizes_input_data_string(scanner_settings):
     tx = {
         "hash": bytes.fromhex("22" * 32),
         "from": "0xdead",
-        "to": router_address,
+        "to": V2_ROUTER,
         "value": 2 * 10**18,
         "gasPrice": 60 * 10**9,
         "gas": 21000,
@@ -194,46 +189,17 @@ async def test_txpool_scanner_normalizes_input_data_string(monkeypatch):
     assert analysis["target_dex"] == "uniswap_v2"
 
 
-@pytest.mark.asyncio
-async def test_txpool_scanner_simulates_when_required(monkeypatch):
-    router_address = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
-    stub_settings = SimpleNamespace(
-        contracts=SimpleNamespace(uniswap_v2_router={"1": router_address}),
-        chains=[1],
-        websocket_urls={1: "ws://private"},
-        rpc_urls={1: "http://private"},
-        allow_unsimulated_trades=False,
-        connection_retry_delay=0.1,
-    )
-    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
-    monkeypatch.setattr(
-        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
-    )
-
-    import eth_abi
-
-    amount_in = 2 * 10**18
-    amount_out_min = 1 * 10**18
-    path = [
-        "0x" + "1" * 40,
-        "0x" + "2" * 40,
-    ]
-    recipient = "0x" + "3" * 40
-    deadline = 1_700_000_000
-    encoded = eth_abi.encode(
-        ["uint256", "uint256", "address[]", "address", "uint256"],
-        [amount_in, amount_out_min, path, recipient, deadline],
-    )
-    tx_input = bytes.fromhex("38ed1739" + encoded.hex())
+async def test_txpool_scanner_simulates_when_required(scanner_settings):
+    scanner_settings.allow_unsimulated_trades = False
 
     tx = {
         "hash": bytes.fromhex("33" * 32),
         "from": "0xdead",
-        "to": router_address,
+        "to": V2_ROUTER,
         "value": 2 * 10**18,
         "gasPrice": 60 * 10**9,
         "gas": 21000,
-        "input": tx_input,
+        "input": V2_SWAP_INPUT,
     }
     web3 = DummyWeb3(tx)
     executor = SimpleNamespace(
@@ -248,24 +214,7 @@ async def test_txpool_scanner_simulates_when_required(monkeypatch):
     assert executor.execute_opportunity.await_count >= 1
 
 
-@pytest.mark.asyncio
-async def test_txpool_scanner_detects_uniswap_v3(monkeypatch):
-    router_address = "0x1f98431c8ad98523631ae4a59f267346ea31f984"
-    stub_settings = SimpleNamespace(
-        contracts=SimpleNamespace(uniswap_v3_router={"1": router_address}),
-        chains=[1],
-        websocket_urls={1: "ws://private"},
-        rpc_urls={1: "http://private"},
-        allow_unsimulated_trades=True,
-        connection_retry_delay=0.1,
-    )
-    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
-    monkeypatch.setattr(
-        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
-    )
-
-    import eth_abi
-
+async def test_txpool_scanner_detects_uniswap_v3(scanner_settings):
     token_in = "0x" + "1" * 40
     token_out = "0x" + "2" * 40
     fee = 3000
@@ -294,7 +243,7 @@ async def test_txpool_scanner_detects_uniswap_v3(monkeypatch):
     tx = {
         "hash": bytes.fromhex("44" * 32),
         "from": "0xdead",
-        "to": router_address,
+        "to": V3_ROUTER,
         "value": 3 * 10**18,
         "gasPrice": 60 * 10**9,
         "gas": 21000,
@@ -318,24 +267,7 @@ async def test_txpool_scanner_detects_uniswap_v3(monkeypatch):
         assert opp.get("fee") == fee
 
 
-@pytest.mark.asyncio
-async def test_txpool_scanner_detects_uniswap_v3_multihop(monkeypatch):
-    router_address = "0x1f98431c8ad98523631ae4a59f267346ea31f984"
-    stub_settings = SimpleNamespace(
-        contracts=SimpleNamespace(uniswap_v3_router={"1": router_address}),
-        chains=[1],
-        websocket_urls={1: "ws://private"},
-        rpc_urls={1: "http://private"},
-        allow_unsimulated_trades=True,
-        connection_retry_delay=0.1,
-    )
-    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
-    monkeypatch.setattr(
-        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
-    )
-
-    import eth_abi
-
+async def test_txpool_scanner_detects_uniswap_v3_multihop(scanner_settings):
     token_a = "0x" + "1" * 40
     token_b = "0x" + "2" * 40
     token_c = "0x" + "3" * 40
@@ -362,7 +294,7 @@ async def test_txpool_scanner_detects_uniswap_v3_multihop(monkeypatch):
     tx = {
         "hash": bytes.fromhex("55" * 32),
         "from": "0xdead",
-        "to": router_address,
+        "to": V3_ROUTER,
         "value": 3 * 10**18,
         "gasPrice": 60 * 10**9,
         "gas": 21000,
@@ -381,3 +313,119 @@ async def test_txpool_scanner_detects_uniswap_v3_multihop(monkeypatch):
     for opp in opportunities:
         assert opp.get("dex") == "uniswap_v3"
         assert opp.get("fees") == [fee_1, fee_2]
+
+
+def test_txpool_scanner_normalizes_monitored_addresses(monkeypatch, scanner_settings):
+    monkeypatch.setattr(
+        txpool_module,
+        "ABIRegistry",
+        lambda: SimpleNamespace(
+            get_monitored_tokens=lambda _chain_id: MIXED_MONITORED_TOKENS
+        ),
+    )
+
+    scanner = TxPoolScanner(DummyWeb3({}), SimpleNamespace(), chain_id=1)
+
+    assert scanner._monitored_addresses == {"0x789abc456def", "0xabc123"}
+
+
+async def test_txpool_scanner_reuses_cached_analysis(monkeypatch, scanner_settings):
+    monkeypatch.setattr(TxPoolScanner, "MAX_TX_CACHE_SIZE", 2)
+    tx = {
+        "hash": bytes.fromhex("66" * 32),
+        "from": "0xdead",
+        "to": "0x" + "9" * 40,
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": "0x",
+    }
+    web3 = DummyWeb3(tx)
+    scanner = TxPoolScanner(web3, SimpleNamespace(), chain_id=1)
+
+    for tx_hash in ["0x01", "0x02", "0x01", "0x03"]:
+        await scanner._process_tx_hash(tx_hash)
+
+    assert web3.eth.get_transaction.await_count == 3
+    assert scanner.get_cache_stats()["cache_hits"] == 1
+    # "0x02" was least recently used when "0x03" arrived.
+    assert set(scanner._tx_analysis_cache) == {"0x01", "0x03"}
+
+
+async def test_txpool_scanner_bounds_pending_queue(monkeypatch, scanner_settings):
+    monkeypatch.setattr(TxPoolScanner, "MAX_PENDING_QUEUE_SIZE", 2)
+    processed = []
+    scanner = TxPoolScanner(DummyWeb3({}), SimpleNamespace(), chain_id=1)
+
+    async def _record(tx_hash):
+        processed.append(tx_hash)
+
+    monkeypatch.setattr(scanner, "_process_tx_hash", _record)
+
+    for tx_hash in ["0x01", "0x02", "0x03"]:
+        scanner._enqueue_tx_hash(tx_hash)
+
+    assert scanner._tx_hash_queue.maxsize == 2
+    assert scanner.get_cache_stats()["dropped_transactions"] == 1
+
+    worker = asyncio.create_task(scanner._tx_worker())
+    await scanner._tx_hash_queue.join()
+    worker.cancel()
+
+    assert processed == ["0x01", "0x02"]
+
+
+def test_txpool_scanner_drains_queued_hashes_in_batches(monkeypatch, scanner_settings):
+    monkeypatch.setattr(TxPoolScanner, "TX_BATCH_SIZE", 3)
+    scanner = TxPoolScanner(DummyWeb3({}), SimpleNamespace(), chain_id=1)
+    for tx_hash in ["0x02", "0x03", "0x04"]:
+        scanner._enqueue_tx_hash(tx_hash)
+
+    assert scanner._drain_tx_batch("0x01") == ["0x01", "0x02", "0x03"]
+    assert scanner._drain_tx_batch("0x05") == ["0x05", "0x04"]
+    assert scanner._tx_hash_queue.empty()
+
+
+async def test_txpool_scanner_processes_drained_batch_concurrently(
+    monkeypatch, scanner_settings
+):
+    scanner = TxPoolScanner(DummyWeb3({}), SimpleNamespace(), chain_id=1)
+    started = []
+    release = asyncio.Event()
+
+    async def slow_process(tx_hash):
+        started.append(tx_hash)
+        await release.wait()
+
+    monkeypatch.setattr(scanner, "_process_tx_hash", slow_process)
+    for tx_hash in ["0x01", "0x02", "0x03"]:
+        scanner._enqueue_tx_hash(tx_hash)
+
+    worker = asyncio.create_task(scanner._tx_worker())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert started == ["0x01", "0x02", "0x03"]
+
+    release.set()
+    await asyncio.wait_for(scanner._tx_hash_queue.join(), timeout=1)
+    worker.cancel()
+    await asyncio.gather(worker, return_exceptions=True)
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [
+        "swapExactTokensForTokens(uint256,uint256,address[],address,uint256)",
+        "swapTokensForExactTokens(uint256,uint256,address[],address,uint256)",
+        "swapExactETHForTokens(uint256,address[],address,uint256)",
+        "swapExactTokensForETH(uint256,uint256,address[],address,uint256)",
+        "exactInputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))",
+        "exactInput((bytes,address,uint256,uint256,uint256))",
+    ],
+)
+def test_swap_selector_table_matches_signatures(signature):
+    from eth_utils import keccak
+
+    selector = "0x" + keccak(text=signature)[:4].hex()
+    _, arg_types = TxPoolScanner.SWAP_SELECTOR_ABI[selector]
+    assert signature.endswith(f"({','.join(arg_types)})")
@@ -5,16 +5,18 @@
 Tests for utility modules.
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from web3 import AsyncWeb3
 
 
 def test_gas_optimizer_initialization():
     """Test GasOptimizer initializes with correct defaults."""
     from on1builder.utils.gas_optimizer import GasOptimizer
 
-    mock_web3 = MagicMock()
+    mock_web3 = Mock(spec=AsyncWeb3)
     optimizer = GasOptimizer(mock_web3)
 
     assert optimizer is not None
@@ -29,7 +31,7 @@ def test_gas_optimizer_priority_levels():
     """Test GasOptimizer defines valid priority levels with increasing multipliers."""
     from on1builder.utils.gas_optimizer import GasOptimizer
 
-    mock_web3 = MagicMock()
+    mock_web3 = Mock(spec=AsyncWeb3)
     optimizer = GasOptimizer(mock_web3)
 
     assert "low" in optimizer.PRIORITY_LEVELS
@@ -46,9 +48,9 @@ def test_profit_calculator_initialization():
     """Test ProfitCalculator initializes with event signatures and empty caches."""
     from on1builder.utils.profit_calculator import ProfitCalculator
 
-    mock_web3 = MagicMock()
-    mock_settings = MagicMock()
-    calculator = ProfitCalculator(mock_web3, mock_settings)
+    mock_web3 = Mock(spec=AsyncWeb3)
+    stub_settings = SimpleNamespace(wallet_address="0x" + "1" * 40)
+    calculator = ProfitCalculator(mock_web3, stub_settings)
 
     assert calculator is not None
     assert "Transfer" in calculator._event_signatures
@@ -83,18 +85,15 @@ def test_logging_config_returns_same_logger():
 
 def test_notification_service_basic():
     """Test NotificationService initializes with no active session."""
+    from on1builder.config.settings import NotificationSettings
     from on1builder.utils.notification_service import NotificationService
 
     NotificationService.reset_instance()
     try:
-        mock_settings = MagicMock()
-        mock_settings.notification = MagicMock()
-        mock_settings.notification.email_enabled = False
-        mock_settings.notification.discord_enabled = False
-
-        service = NotificationService(mock_settings)
+        service = NotificationService(NotificationSettings(channels=[]))
         assert service is not None
         assert service._session is None
+        assert service._configured_channels == []
     finally:
         NotificationService.reset_instance()
 
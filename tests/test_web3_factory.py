@@ -4,6 +4,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from on1builder.utils.custom_exceptions import ConnectionError
 from on1builder.utils.web3_factory import Web3ConnectionFactory
 
 
@@ -14,23 +15,23 @@ def _reset_factory_cache():
     Web3ConnectionFactory._connections.clear()
 
 
-@pytest.mark.asyncio
-async def test_web3_factory_accepts_string_keyed_urls(monkeypatch):
+def _install_http_stubs(monkeypatch, rpc_urls, is_connected=True):
+    """Route the factory through fake HTTP connections; returns the call log."""
     stub_settings = SimpleNamespace(
         websocket_urls={},
-        rpc_urls={"1": "http://example"},
+        rpc_urls=rpc_urls,
         poa_chains=[],
     )
     monkeypatch.setattr("on1builder.config.loaders.get_settings", lambda: stub_settings)
 
-    created = {}
+    created = []
 
     async def _fake_http(cls, chain_id, http_url):
-        created["args"] = (chain_id, http_url)
-        return object()
+        created.append((chain_id, http_url))
+        return {"chain_id": chain_id, "url": http_url}
 
     async def _fake_test(_cls, _web3):
-        return True
+        return is_connected
 
     monkeypatch.setattr(
         Web3ConnectionFactory,
@@ -40,41 +41,36 @@ async def test_web3_factory_accepts_string_keyed_urls(monkeypatch):
     monkeypatch.setattr(
         Web3ConnectionFactory, "_test_connection", classmethod(_fake_test)
     )
-
-    result = await Web3ConnectionFactory.create_connection(1, force_new=True)
-    assert result is not None
-    assert created["args"] == (1, "http://example")
-
-
-@pytest.mark.asyncio
-async def test_web3_factory_caches_connections(monkeypatch):
-    stub_settings = SimpleNamespace(
-        websocket_urls={},
-        rpc_urls={1: "http://example"},
-        poa_chains=[],
+    return created
+
+
+@pytest.mark.parametrize(
+    "rpc_key,is_connected,expect_error",
+    [(1, True, False), ("1", True, False), (1, False, True)],
+)
+async def test_web3_factory_http_connection(
+    monkeypatch, rpc_key, is_connected, expect_error
+):
+    created = _install_http_stubs(
+        monkeypatch, {rpc_key: "http://example"}, is_connected=is_connected
     )
-    monkeypatch.setattr("on1builder.config.loaders.get_settings", lambda: stub_settings)
 
-    created = {"count": 0}
+    if expect_error:
+        with pytest.raises(ConnectionError):
+            await Web3ConnectionFactory.create_connection(1, force_new=True)
+        assert 1 not in Web3ConnectionFactory._connections
+    else:
+        result = await Web3ConnectionFactory.create_connection(1, force_new=True)
+        assert result is not None
 
-    async def _fake_http(cls, chain_id, http_url):
-        created["count"] += 1
-        return {"chain_id": chain_id, "url": http_url}
+    assert created == [(1, "http://example")]
 
-    async def _fake_test(_cls, _web3):
-        return True
 
-    monkeypatch.setattr(
-        Web3ConnectionFactory,
-        "_create_http_connection",
-        classmethod(_fake_http),
-    )
-    monkeypatch.setattr(
-        Web3ConnectionFactory, "_test_connection", classmethod(_fake_test)
-    )
+async def test_web3_factory_caches_connections(monkeypatch):
+    created = _install_http_stubs(monkeypatch, {1: "http://example"})
 
     first = await Web3ConnectionFactory.create_connection(1, force_new=True)
     second = await Web3ConnectionFactory.create_connection(1)
 
     assert first is second
-    assert created["count"] == 1
+    assert len(created) == 1
@@ -21,7 +21,6 @@ def reset_factory():
     Web3ConnectionFactory._connections.clear()
 
 
-@pytest.mark.asyncio
 async def test_create_connection_uses_cache_and_replaces_stale(monkeypatch):
     fresh = object()
     stale = object()
@@ -42,7 +41,6 @@ async def test_create_connection_uses_cache_and_replaces_stale(monkeypatch):
     assert await Web3ConnectionFactory.create_connection(1, force_new=True) is fresh
 
 
-@pytest.mark.asyncio
 async def test_create_new_connection_prefers_websocket_then_http(monkeypatch):
     settings = SimpleNamespace(
         websocket_urls={1: "wss://rpc"}, rpc_urls={1: "https://rpc"}, poa_chains=[]
@@ -80,7 +78,6 @@ async def test_create_new_connection_prefers_websocket_then_http(monkeypatch):
         await Web3ConnectionFactory._create_new_connection(1)
 
 
-@pytest.mark.asyncio
 async def test_create_new_connection_wraps_http_errors(monkeypatch):
     settings = SimpleNamespace(
         websocket_urls={}, rpc_urls={1: "https://rpc"}, poa_chains=[]
@@ -97,7 +94,6 @@ async def test_create_new_connection_wraps_http_errors(monkeypatch):
         await Web3ConnectionFactory._create_new_connection(1)
 
 
-@pytest.mark.asyncio
 async def test_websocket_and_http_connection_helpers(monkeypatch):
     monkeypatch.setattr(factory_module, "WEBSOCKET_AVAILABLE", False)
     assert (
@@ -151,7 +147,6 @@ def test_configure_web3_instance_adds_poa_middleware(monkeypatch):
     onion.inject.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_test_connection_close_all_and_helper(monkeypatch):
     web3 = MagicMock()
     web3.eth.get_block = AsyncMock(return_value={})
@@ -8,7 +8,6 @@ Test websocket handling for proper None responses.
 import pytest
 
 
-@pytest.mark.asyncio
 async def test_websocket_none_handling():
     """Test that None values are handled properly in websocket connections."""
     # Simple test that doesn't require actual websocket connections
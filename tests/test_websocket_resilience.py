@@ -3,8 +3,6 @@
 import asyncio
 from types import SimpleNamespace
 
-import pytest
-
 from on1builder.monitoring.txpool_scanner import TxPoolScanner
 
 
@@ -26,7 +24,6 @@ class DummyExec:
         return {"success": True}
 
 
-@pytest.mark.asyncio
 async def test_websocket_subscription_failure_retries(monkeypatch):
     """Ensure scanner handles subscription failures without crashing."""
     # Simulate settings with minimal fields